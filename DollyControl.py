@@ -1,34 +1,59 @@
 #!/usr/bin/env python3
 # DollyControlPyQt.py
 # -*- coding: utf-8 -*-
+import time
+# (label, seconds) startup phases, reported by --profile-startup
+STARTUP_T0 = time.perf_counter()
+STARTUP_TIMES = []
+_startup_last = STARTUP_T0
+
+def startup_mark(label):
+    """Record the time since the previous checkpoint as startup phase `label`."""
+    global _startup_last
+    now = time.perf_counter()
+    STARTUP_TIMES.append((label, now - _startup_last))
+    _startup_last = now
+
 import sys
 import json
-import math
-import time
 import threading
 import os
 import shutil
 import copy
+import hashlib
+import argparse
+import bisect
+from collections import deque, OrderedDict
+from contextlib import nullcontext
+import ctypes
+from ctypes import wintypes
+import base64
+startup_mark("import stdlib")
 import numpy as np
+startup_mark("import numpy")
 from pythonosc.udp_client import SimpleUDPClient
 from pythonosc.dispatcher import Dispatcher
-from pythonosc import osc_server
-from scipy.spatial.transform import Rotation as R
-import ctypes
-from ctypes import wintypes
+startup_mark("import pythonosc")
 from PyQt6.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
                              QLabel, QPushButton, QLineEdit, QSlider, QCheckBox, QFileDialog,
-                             QScrollArea, QButtonGroup, QMessageBox)
+                             QScrollArea, QButtonGroup, QMessageBox, QComboBox)
 from PyQt6.QtCore import Qt
 from PyQt6.QtGui import QFont, QGuiApplication, QIcon, QPixmap
 from PyQt6.QtWidgets import QDialog, QLabel, QProgressBar, QTextEdit
 from PyQt6.QtCore import QTimer, QUrl, QObject, pyqtSignal
-from PyQt6.QtMultimedia import QMediaPlayer, QAudioOutput
-import base64
-
-
-# Thread-safety for camera pose updates from OSC
-pose_lock = threading.Lock()
+# QtMultimedia (play), winsound (beeps) and scipy (rotation offsets, via
+# rotation_from_euler) are imported on first use to keep them off the startup path.
+startup_mark("import PyQt6")
+from dolly_core import (MIN_POINTS, MAX_POINTS, MODE_CIRCLE, MODE_ARC, MODE_LINE, MODE_ELLIPSE,
+                        MODE_FILE, MODE_DOLLY_ZOOM, PAUSE_DURATION_DEFAULT, TIMING_GENERATOR,
+                        TIMING_CONSTANT_SPEED, EASING_LINEAR, EASING_CUSTOM, EASING_PROFILES,
+                        CameraSettings, ShapeParams, WaypointArray, WaypointEncoder,
+                        PoseRingBuffer, PoseStore, OscReceiver, path_from_pose_samples,
+                        generate_shape_path, unit_shape_template, adaptive_shape_parameters,
+                        arc_start_deg, dolly_zoom_path, transform_path, simplify_path,
+                        easing_curve, easing_elapsed_table, stage_reverse, stage_look_at,
+                        stage_vertical, stage_fields, stage_timing, stage_pause)
+startup_mark("import dolly_core")
 
 # ----------------------------------------------------
 #  DollyControl V2.61 Changa Husky
@@ -37,38 +62,6 @@ pose_lock = threading.Lock()
 #  Filmmaking use but if others find it useful cool.
 # ----------------------------------------------------
 
-# --------------------------
-# Helper: Compute Unity LookRotation as Euler Angles
-# --------------------------
-def compute_look_at_unity(camera_pos, target_pos, vertical_mode=False):
-    forward = target_pos - camera_pos
-    norm_fwd = np.linalg.norm(forward)
-    if norm_fwd < 1e-6:
-        return [0, 0, 0]
-    forward /= norm_fwd
-    world_up = np.array([0, 1, 0])
-    if abs(np.dot(forward, world_up)) > 0.99:
-        fallback_up = np.array([0, 0, 1])
-        if abs(np.dot(forward, fallback_up)) > 0.99:
-            fallback_up = np.array([1, 0, 0])
-        up_vec = fallback_up
-    else:
-        up_vec = world_up
-    right = np.cross(up_vec, forward)
-    norm_r = np.linalg.norm(right)
-    if norm_r < 1e-6:
-        norm_r = 1
-    right /= norm_r
-    up_corrected = np.cross(forward, right)
-    rot_matrix = np.column_stack((right, up_corrected, forward))
-    rot = R.from_matrix(rot_matrix)
-    euler = rot.as_euler('YXZ', degrees=True)
-    if vertical_mode:
-        vertical_adjust = R.from_euler('Z', 90, degrees=True)
-        final_rot = rot * vertical_adjust
-        euler = final_rot.as_euler('YXZ', degrees=True)
-    return euler.tolist()
-
 # --------------------------
 # Determine Export Path from Documents
 # --------------------------
@@ -87,6 +80,9 @@ os.makedirs(USED_LOCATIONS_PATH, exist_ok=True)
 PINS_PATH = os.path.join(EXPORT_PATH, "Bookmarks")
 os.makedirs(PINS_PATH, exist_ok=True)
 
+RECORDINGS_PATH = os.path.join(EXPORT_PATH, "Recordings")
+os.makedirs(RECORDINGS_PATH, exist_ok=True)
+
 # --------------------------
 # OSC Settings
 # --------------------------
@@ -110,24 +106,16 @@ dolly_speed = 3.0
 aperture = 15.0
 focal_distance = 2
 dolly_zoom_exaggeration = 2.0   # Range: 1.0 to 5.0
-user_points_limit = 15          # Range: 5 to 50
-
-# --- Dolly Mode Constants (single source of truth) ---
-MODE_CIRCLE = 1
-MODE_ARC = 2
-MODE_LINE = 3
-MODE_ELLIPSE = 4
-MODE_FILE = 5
-MODE_DOLLY_ZOOM = 6
+user_points_limit = 15          # Range: MIN_POINTS to MAX_POINTS
 # -----------------------------------------------------
 dolly_mode = MODE_CIRCLE  # 1=Circle, 2=Arc, 3=Line, 4=Ellipse, 5=File, 6=Dolly Zoom
 
 start_position = {"X": 0.0, "Y": 0.0, "Z": 0.0}
 exported_center = None
-current_path_data = None
+base_path_data = None      # generator output before the offsets
+current_path_data = None   # base path with the offset transform applied
 dolly_vertical = False
 dolly_pause = False
-PAUSE_DURATION_DEFAULT = 60.0
 lookat_x_offset = 0.0
 lookat_y_offset = 0.0
 view_target = None
@@ -137,11 +125,11 @@ arc_angle = 180.0
 # These will be set by the UI:
 use_view_target_checkbox = None
 camera_offset = {"X": 0.0, "Y": 0.0, "Z": 0.0}
-camera_rotation_offset = R.from_euler('XYZ', [0, 0, 0], degrees=True)
+camera_rotation_offset = None  # scipy Rotation; None until first use (identity)
 initial_dolly_distance = None
 initial_dolly_zoom = None
 reverse_dolly_zoom = False
-loaded_path_data_original = []
+loaded_path_data_original = WaypointArray.empty()
 loaded_file_label = None
 dolly_zoom_btn = None
 
@@ -177,13 +165,151 @@ reverse_zoom_checkbox = None
 translation_step_value = 0.5
 rotation_step_value = 1.0
 
+# Duration timing mode
+timing_mode = TIMING_GENERATOR
+constant_speed_checkbox = None
+easing_profile = EASING_LINEAR
+easing_bezier = (0.42, 0.0, 0.58, 1.0)  # control points for EASING_CUSTOM
+easing_combo = None
+easing_bezier_entry = None
+
+# Curvature-adaptive sampling for the generated shapes (points slider becomes the cap)
+adaptive_sampling = False
+sampling_tolerance = 0.05   # max chord error, metres
+sampling_max_angle = 30.0   # max turn per segment, degrees
+adaptive_sampling_checkbox = None
+sampling_tolerance_entry = None
+sampling_max_angle_entry = None
+waypoint_count_label = None
+
+# File mode path simplification tolerances
+simplify_position_tolerance = 0.02  # metres
+simplify_angle_tolerance = 1.0      # degrees
+simplify_position_entry = None
+simplify_angle_entry = None
+
+# Export scheduling (slider drags are coalesced into at most export_max_rate exports/s)
+EXPORT_MAX_RATE_DEFAULT = 10.0   # exports per second
+EXPORT_COALESCE_MS_DEFAULT = 40  # requests inside this window collapse into one export
+export_rate_slider = None
+export_rate_entry = None
+export_window_entry = None
+
 # Global flag to disable export processing during target move.
 target_move_mode = False
 
-# Latest camera pose (world space) from VRChat OSC
-current_camera_pos = {"X": 0.0, "Y": 0.0, "Z": 0.0}
-current_camera_rot = {"X": 0.0, "Y": 0.0, "Z": 0.0}  # Euler, degrees
-last_pose_timestamp = 0.0
+# ----------------------------------------------------
+# Camera Pose Ring Buffer
+# ----------------------------------------------------
+
+# Camera pose history (world space) from VRChat OSC
+POSE_BUFFER = PoseRingBuffer()
+POSE_STORE = PoseStore(POSE_BUFFER)  # OSC-thread writer; also stamps the last pose time
+POSE_AVERAGE_WINDOW = 0.25  # seconds averaged by Set Path / Set Target
+
+
+def camera_pose(average_window=0.0):
+    """Return (pos, rot) dicts for the camera, rounded like the OSC input.
+
+    With ``average_window`` > 0 the pose is averaged over that many seconds,
+    falling back to the newest sample if the stream has gone quiet.
+    """
+    vec = None
+    if average_window > 0:
+        vec = POSE_BUFFER.window_average(average_window)
+    if vec is None:
+        row = POSE_BUFFER.latest()
+        vec = row[1:] if row is not None else np.zeros(6)
+    pos = {"X": round(float(vec[0]), 3), "Y": round(float(vec[1]), 3), "Z": round(float(vec[2]), 3)}
+    rot = {"X": round(float(vec[3]), 2), "Y": round(float(vec[4]), 2), "Z": round(float(vec[5]), 2)}
+    return pos, rot
+
+# ----------------------------------------------------
+# Pose Recorder
+# ----------------------------------------------------
+RECORD_POLL_INTERVAL = 0.05    # seconds between ring buffer drains
+RECORD_CHUNK_BYTES = 1 << 16   # file write buffer; rows hit disk in chunks of this size
+
+class PoseRecorder(threading.Thread):
+    """
+    Records the camera pose stream to disk for Record mode.
+
+    The OSC thread keeps only pushing into POSE_BUFFER; this thread drains
+    new rows from it every `poll_interval` and appends them as raw float64
+    [t, X, Y, Z, rotX, rotY, rotZ] records to `path`, so a long take never
+    builds up in memory. `stop()` ends the take; `load_recording` turns the
+    file into a waypoint path.
+    """
+
+    def __init__(self, path, buffer=None, poll_interval=RECORD_POLL_INTERVAL):
+        super().__init__(name="DollyPoseRecorder", daemon=True)
+        self.path = path
+        self.poll_interval = poll_interval
+        self._buffer = POSE_BUFFER if buffer is None else buffer
+        self._cursor = self._buffer.count  # only samples arriving after start
+        self._stop_event = threading.Event()
+        self.samples = 0
+        self.dropped = 0
+        self.error = ""
+
+    def run(self):
+        try:
+            with open(self.path, "wb", buffering=RECORD_CHUNK_BYTES) as f:
+                while True:
+                    stopping = self._stop_event.wait(self.poll_interval)
+                    rows, self._cursor, dropped = self._buffer.read_since(self._cursor)
+                    if len(rows):
+                        f.write(rows.tobytes())
+                        self.samples += len(rows)
+                    self.dropped += dropped
+                    if stopping:
+                        break
+        except OSError as e:
+            self.error = str(e)
+
+    def stop(self):
+        self._stop_event.set()
+        self.join()
+
+def load_recording(raw_path):
+    """
+    Read a PoseRecorder file into a WaypointArray: one waypoint per sample,
+    Duration is the time since the previous sample, and the remaining fields
+    take the current camera settings.
+    """
+    rows = np.fromfile(raw_path, dtype=np.float64).reshape(-1, 7)
+    return path_from_pose_samples(rows, camera_settings())
+
+POSE_RECORDER = None
+
+def start_recording():
+    """Start a new take; returns the raw file path."""
+    global POSE_RECORDER
+    if POSE_RECORDER is not None:
+        raise RuntimeError("a recording is already running")
+    raw_path = os.path.join(RECORDINGS_PATH, time.strftime("take_%Y%m%d_%H%M%S") + ".bin")
+    POSE_RECORDER = PoseRecorder(raw_path)
+    POSE_RECORDER.start()
+    return raw_path
+
+def stop_recording():
+    """
+    Finish the running take and write it as a standard waypoint JSON next to
+    the raw file (which is removed once the JSON is in place).
+    Returns (path, json_path, recorder).
+    """
+    global POSE_RECORDER
+    recorder, POSE_RECORDER = POSE_RECORDER, None
+    if recorder is None:
+        raise RuntimeError("no recording is running")
+    recorder.stop()
+    if recorder.error:
+        raise OSError(recorder.error)
+    path = load_recording(recorder.path)
+    json_path = os.path.splitext(recorder.path)[0] + ".json"
+    publish_file_atomic(json_path, WaypointEncoder().encode(path).encode("utf-8"))
+    os.remove(recorder.path)
+    return path, json_path, recorder
 
 # Thread-safe bridge so OSC thread can "click" UI buttons
 class ActionBus(QObject):
@@ -192,8 +318,72 @@ class ActionBus(QObject):
     # NEW: generic nudges (thread-safe to UI)
     nudgeTranslate   = pyqtSignal(str, int)   # axis: "X"/"Y"/"Z", dir: +1/-1
     nudgeRotate      = pyqtSignal(str, int)   # axis: "X"/"Y"/"Z", dir: +1/-1
+    setDollyMode     = pyqtSignal(int)        # avatar SetDollyMode -> set_mode on the UI thread
+    modeChanged      = pyqtSignal(int)        # dolly mode switched (UI or OSC)
+    # Export worker -> UI: payload bytes, serialize ms, write+send ms, deduplicated, error text
+    exportFinished   = pyqtSignal(int, float, float, bool, str)
 BUS = ActionBus()
 
+class ExportScheduler(QObject):
+    """
+    Coalescing, rate-limited driver for send_dolly_path (GUI thread only).
+
+    Requests are latest-wins: any number of requests arriving while an export
+    is pending collapse into one export, which reads the newest state when it
+    fires. A pending export waits at least `window_ms` after the first request
+    and never fires faster than `max_rate` exports per second. A request that
+    arrives after an export has fired always schedules a trailing export.
+    """
+    rateChanged = pyqtSignal(float)
+
+    def __init__(self, export_fn, max_rate=EXPORT_MAX_RATE_DEFAULT,
+                 window_ms=EXPORT_COALESCE_MS_DEFAULT, parent=None):
+        super().__init__(parent)
+        self._export_fn = export_fn
+        self.max_rate = float(max_rate)
+        self.window_ms = int(window_ms)
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.timeout.connect(self._fire)
+        self._last_export = 0.0
+        self._history = deque(maxlen=256)
+        self.requested = 0
+        self.exported = 0
+
+    def set_max_rate(self, rate):
+        self.max_rate = max(0.1, float(rate))
+
+    def set_window_ms(self, window_ms):
+        self.window_ms = max(0, int(window_ms))
+
+    def request(self):
+        self.requested += 1
+        if self._timer.isActive():
+            return  # already pending; it will pick up the latest state
+        elapsed_ms = (time.monotonic() - self._last_export) * 1000.0
+        delay = max(self.window_ms, 1000.0 / self.max_rate - elapsed_ms)
+        self._timer.start(int(max(0.0, delay)))
+
+    def flush(self):
+        """Run a pending export immediately."""
+        if self._timer.isActive():
+            self._timer.stop()
+            self._fire()
+
+    def effective_rate(self, horizon=2.0):
+        """Exports per second over the last `horizon` seconds."""
+        cutoff = time.monotonic() - horizon
+        return sum(1 for t in self._history if t >= cutoff) / horizon
+
+    def _fire(self):
+        self._last_export = time.monotonic()
+        self._history.append(self._last_export)
+        self.exported += 1
+        self._export_fn()
+        self.rateChanged.emit(self.effective_rate())
+
+EXPORT_SCHEDULER = None  # created with the UI; exports run synchronously before that
+
 # Rising-edge memory so a held toggle doesn’t spam
 _AVATAR_TOGGLE_PREV = {
     "SetTargetFromCam": 0.0,
@@ -208,60 +398,6 @@ _AVATAR_TOGGLE_PREV = {
     "SetDolly_R-X": 0.0, "SetDolly_R-Y": 0.0, "SetDolly_R-Z": 0.0,    
 }
 
-def _reindex_waypoints(path):
-    for i, wp in enumerate(path):
-        wp["Index"] = i
-
-def add_pause_at_end(path, duration=None):
-    """
-    Insert a single pause waypoint at the end that keeps the camera fixed
-    for `duration` seconds.
-    """
-    if not path:
-        return path
-
-    pause_len = (
-        float(dolly_settings.get("pause_duration", PAUSE_DURATION_DEFAULT))
-        if duration is None else float(duration)
-    )
-
-    base = copy.deepcopy(path[-1])
-
-    # keep same transform & schema; only Duration changes
-    base["Duration"] = round(pause_len, 3)
-
-    # Optional: ensure Speed=0 if your player honors per-WP speed
-    # (If your system ignores Speed for fixed-position hold, you can skip this.)
-    base["Speed"] = float(0.0)
-
-    path.append(base)
-    _reindex_waypoints(path)
-    return path
-
-def add_pause_pair_at_end(path, duration=None):
-    if not path:
-        return path
-
-    pause_len = (
-        float(dolly_settings.get("pause_duration", PAUSE_DURATION_DEFAULT))
-        if duration is None else float(duration)
-    )
-
-    last = copy.deepcopy(path[-1])
-    hold1 = copy.deepcopy(last)
-    hold2 = copy.deepcopy(last)
-
-    hold1["Duration"] = round(pause_len, 3)
-    hold1["Speed"] = float(0.0)
-
-    # hold2 can be zero duration (acts as a resume marker), or same as hold1
-    hold2["Duration"] = float(0.0)
-    hold2["Speed"] = float(0.0)
-
-    path.extend([hold1, hold2])
-    _reindex_waypoints(path)
-    return path
-
 def update_arc_angle_slider(value):
     """
     Update the global arc_angle when the slider value changes.
@@ -269,7 +405,7 @@ def update_arc_angle_slider(value):
     global arc_angle, arc_angle_entry
     arc_angle = round(float(value), 2)
     arc_angle_entry.setText(str(arc_angle))
-    regenerate_path()
+    update_path("arc_angle")
 
 def on_arc_angle_entry_return():
     """
@@ -281,7 +417,7 @@ def on_arc_angle_entry_return():
         # Clamp between 5 and 180.
         val = max(5, min(180, val))
         arc_angle = val
-        regenerate_path()
+        update_path("arc_angle")
     except ValueError:
         pass
 
@@ -404,22 +540,22 @@ def set_reverse_path(checked):
     global reverse_path
     reverse_path = checked
     APP_WINDOW.append_status(f"Reverse path set to: {reverse_path}")
-    regenerate_path()
+    update_path("reverse_path")
 
 def update_points_count_slider(value):
     global user_points_limit, points_count_entry
     val = int(round(value))
     user_points_limit = val
     points_count_entry.setText(str(val))
-    regenerate_path()
+    update_path("points")
 
 def on_points_count_entry_return():
     global user_points_limit, points_count_entry
     try:
         val = int(points_count_entry.text())
-        val = max(5, min(50, val))
+        val = max(MIN_POINTS, min(MAX_POINTS, val))
         user_points_limit = val
-        regenerate_path()
+        update_path("points")
     except ValueError:
         pass
 
@@ -427,7 +563,7 @@ def set_is_local(checked):
     global is_local
     is_local = checked
     APP_WINDOW.append_status(f"Is local set to: {is_local}")
-    regenerate_path()
+    update_path("is_local")
 
 def update_dz_exaggeration_slider(value):
     global dolly_zoom_exaggeration, dz_exag_entry
@@ -435,7 +571,7 @@ def update_dz_exaggeration_slider(value):
     dolly_zoom_exaggeration = val
     dz_exag_entry.setText(str(val))
     if dolly_mode == MODE_DOLLY_ZOOM :
-        regenerate_path()
+        update_path("dz_exaggeration")
 
 def on_dz_exaggeration_entry_return():
     global dolly_zoom_exaggeration, dz_exag_entry
@@ -444,7 +580,7 @@ def on_dz_exaggeration_entry_return():
         val = max(1.0, min(5.0, val))
         dolly_zoom_exaggeration = val
         if dolly_mode == MODE_DOLLY_ZOOM :
-            regenerate_path()
+            update_path("dz_exaggeration")
     except ValueError:
         pass
 
@@ -453,7 +589,7 @@ def update_aperture_slider(value):
     val = round(float(value) / 100, 2)
     aperture = val
     aperture_entry.setText(str(val))
-    regenerate_path()
+    update_path("aperture")
 
 def on_aperture_entry_return():
     global aperture, aperture_entry
@@ -461,7 +597,7 @@ def on_aperture_entry_return():
         val = float(aperture_entry.text())
         val = max(1.4, min(32, val))
         aperture = val
-        regenerate_path()
+        update_path("aperture")
     except ValueError:
         pass
 
@@ -470,7 +606,7 @@ def update_focal_distance_slider(value):
     val = round(float(value) / 100, 2)
     focal_distance = val
     focal_distance_entry.setText(str(val))
-    regenerate_path()
+    update_path("focal_distance")
 
 def on_focal_distance_entry_return():
     global focal_distance, focal_distance_entry
@@ -478,7 +614,7 @@ def on_focal_distance_entry_return():
         val = float(focal_distance_entry.text())
         val = max(0.1, min(30, val))
         focal_distance = val
-        regenerate_path()
+        update_path("focal_distance")
     except ValueError:
         pass
 
@@ -487,7 +623,7 @@ def update_radius_slider(value):
     val = round(float(value) / 100, 2)
     dolly_settings["radius"] = val
     radius_entry.setText(str(val))
-    regenerate_path()
+    update_path("radius")
 
 def update_zoom_slider(value):
     global dolly_zoom, zoom_entry
@@ -495,14 +631,14 @@ def update_zoom_slider(value):
     dolly_zoom = val
     zoom_entry.setText(str(val))
     if dolly_mode != MODE_DOLLY_ZOOM:
-        send_dolly_path()
+        update_path("zoom")
 
 def update_speed_slider(value):
     global dolly_speed, speed_entry
     val = round(float(value) / 100, 2)
     dolly_speed = val
     speed_entry.setText(str(val))
-    send_dolly_path()
+    update_path("speed")
 
 def on_translation_step_entry_return():
     global translation_step_value
@@ -536,6 +672,33 @@ def update_rotation_step_slider(value):
     rotation_step_value = val
     rotation_step_entry.setText(str(val))
 
+def update_export_rate_slider(value):
+    global export_rate_entry
+    val = int(value)
+    export_rate_entry.setText(str(val))
+    if EXPORT_SCHEDULER is not None:
+        EXPORT_SCHEDULER.set_max_rate(val)
+
+def on_export_rate_entry_return():
+    try:
+        val = float(export_rate_entry.text())
+        val = max(1, min(30, val))
+        export_rate_slider.setValue(int(val))
+        if EXPORT_SCHEDULER is not None:
+            EXPORT_SCHEDULER.set_max_rate(val)
+    except ValueError:
+        pass
+
+def on_export_window_entry_return():
+    try:
+        val = int(float(export_window_entry.text()))
+        val = max(0, min(1000, val))
+        export_window_entry.setText(str(val))
+        if EXPORT_SCHEDULER is not None:
+            EXPORT_SCHEDULER.set_window_ms(val)
+    except ValueError:
+        pass
+
 def _rising_edge(param_name: str, val: float) -> bool:
     prev = _AVATAR_TOGGLE_PREV.get(param_name, 0.0)
     fire = (val >= 0.5) and (prev < 0.5)
@@ -547,21 +710,21 @@ def update_lookat_x_slider(value):
     val = round(float(value) / 100, 2)
     lookat_x_offset = val
     lookat_x_entry.setText(str(val))
-    send_dolly_path()
+    update_path("lookat_x")
 
 def update_lookat_y_slider(value):
     global lookat_y_offset, lookat_y_entry
     val = round(float(value) / 100, 2)
     lookat_y_offset = val
     lookat_y_entry.setText(str(val))
-    send_dolly_path()
+    update_path("lookat_y")
 
 def update_duration_slider(value):
     global dolly_settings, duration_entry
     val = round(float(value) / 100, 2)
     dolly_settings["duration"] = val
     duration_entry.setText(str(val))
-    regenerate_path()
+    update_path("duration")
 
 def on_radius_entry_return():
     try:
@@ -587,7 +750,7 @@ def on_zoom_entry_return():
         zoom_slider.setValue(int(val))
         dolly_zoom = val
         if dolly_mode != MODE_DOLLY_ZOOM:
-            send_dolly_path()
+            update_path("zoom")
     except ValueError:
         pass
 
@@ -598,7 +761,7 @@ def on_speed_entry_return():
         val = max(0.1, min(10.0, val))
         speed_slider.setValue(int(val * 100))
         dolly_speed = val
-        send_dolly_path()
+        update_path("speed")
     except ValueError:
         pass
 
@@ -609,7 +772,7 @@ def on_lookat_x_entry_return():
         val = max(-20.0, min(20.0, val))
         lookat_x_slider.setValue(int(val * 100))
         lookat_x_offset = val
-        send_dolly_path()
+        update_path("lookat_x")
     except ValueError:
         pass
 
@@ -620,7 +783,7 @@ def on_lookat_y_entry_return():
         val = max(-20.0, min(20.0, val))
         lookat_y_slider.setValue(int(val * 100))
         lookat_y_offset = val
-        send_dolly_path()
+        update_path("lookat_y")
     except ValueError:
         pass
 
@@ -637,10 +800,13 @@ def export_pin(pin_number):
          "arc_angle": arc_angle,
          "num_points": user_points_limit,
          "translation_step": translation_step_value,
-         "rotation_step": rotation_step_value
+         "rotation_step": rotation_step_value,
+         "timing_mode": timing_mode,
+         "easing_profile": easing_profile,
+         "easing_bezier": list(easing_bezier)
     }
     # Convert the current rotation offset to Euler angles (XYZ, degrees)
-    rotation_offset_euler = camera_rotation_offset.as_euler('XYZ', degrees=True).tolist()
+    rotation_offset_euler = current_rotation_offset().as_euler('XYZ', degrees=True).tolist()
 
     data = {
          "origin": start_position,
@@ -665,6 +831,7 @@ def load_pin(pin_number):
     global start_position, exported_center, view_target, use_view_target
     global dolly_settings, dolly_zoom, dolly_speed, aperture, focal_distance, arc_angle, user_points_limit
     global translation_step_value, rotation_step_value, camera_offset, camera_rotation_offset
+    global timing_mode, easing_profile, easing_bezier
 
     pin_file = os.path.join(PINS_PATH, f"pin{pin_number}.json")
     if not os.path.exists(pin_file):
@@ -686,7 +853,7 @@ def load_pin(pin_number):
         if "rotation_offset" in data:
             # Recreate the camera_rotation_offset from saved Euler angles.
             euler_angles = data["rotation_offset"]
-            camera_rotation_offset = R.from_euler('XYZ', euler_angles, degrees=True)
+            camera_rotation_offset = rotation_from_euler('XYZ', euler_angles)
         if "settings" in data:
             settings = data["settings"]
             dolly_settings["radius"] = settings.get("radius", dolly_settings["radius"])
@@ -699,6 +866,14 @@ def load_pin(pin_number):
             user_points_limit = settings.get("num_points", user_points_limit)
             translation_step_value = settings.get("translation_step", translation_step_value)
             rotation_step_value = settings.get("rotation_step", rotation_step_value)
+            timing_mode = settings.get("timing_mode", timing_mode)
+            easing_profile = settings.get("easing_profile", easing_profile)
+            easing_bezier = tuple(settings.get("easing_bezier", easing_bezier))
+            if constant_speed_checkbox is not None:
+                constant_speed_checkbox.setChecked(timing_mode == TIMING_CONSTANT_SPEED)
+            if easing_combo is not None:
+                easing_combo.setCurrentText(easing_profile)
+                easing_bezier_entry.setText(", ".join(f"{v:g}" for v in easing_bezier))
         APP_WINDOW.append_status(f"Loaded Pin {pin_number}:\n  Origin: {start_position}\n  Target: {view_target}\n  Camera Offset: {camera_offset}\n  Rotation Offset (Euler): {data.get('rotation_offset')}\n  Settings: {data.get('settings', {})}")
         regenerate_path()
     except Exception as e:
@@ -707,37 +882,35 @@ def load_pin(pin_number):
 # --------------------------
 # Dolly Path Generation Functions
 # --------------------------
+def report_waypoint_count(n):
+    if waypoint_count_label is not None:
+        mode = "adaptive" if adaptive_sampling else "fixed"
+        waypoint_count_label.setText(f"Waypoints: {n} ({mode})")
+
+def camera_settings(**overrides):
+    """Snapshot of the live camera settings for the dolly_core generators."""
+    settings = dict(zoom=dolly_zoom, speed=dolly_speed, focal_distance=focal_distance,
+                    aperture=aperture, islocal=is_local)
+    settings.update(overrides)
+    return CameraSettings(**settings)
+
+def sample_parameters(params, max_points):
+    """Shape parameters for the generators: None (even spacing) unless adaptive sampling is on."""
+    if not adaptive_sampling:
+        return None
+    look_target = None
+    if view_target is not None:
+        look_target = (float(view_target["X"]), float(view_target["Y"]), float(view_target["Z"]))
+    return adaptive_shape_parameters(params, sampling_tolerance, sampling_max_angle, max_points,
+                                     look_target=look_target)
+
 def generate_circle_path():
     center = exported_center if exported_center is not None else start_position
-    dolly_settings["points"] = user_points_limit  
-    waypoints = []
-    n_pts = user_points_limit
-    per_wp_duration = float(dolly_settings.get('duration', 2.0)) / max(1, int(user_points_limit) - 1)
-    for i in range(user_points_limit):
-        angle = (i / user_points_limit) * 2 * math.pi
-        x = round(center["X"] + dolly_settings["radius"] * math.cos(angle), 3)
-        z = round(center["Z"] + dolly_settings["radius"] * math.sin(angle), 3)
-        y = round(center["Y"], 3)
-        yaw = round(math.degrees(math.atan2(center["Z"] - z, center["X"] - x)), 2)
-        wp = {
-            "Index": i,
-            "PathIndex": 0,
-            "FocalDistance": focal_distance,
-            "Aperture": aperture,
-            "Hue": 120.0,
-            "Saturation": 100.0,
-            "Lightness": 50.0,
-            "LookAtMeXOffset": 0.0,
-            "LookAtMeYOffset": 0.0,
-            "Zoom": dolly_zoom,
-            "Speed": dolly_speed,
-            "Duration": round((i / user_points_limit) * dolly_settings["duration"], 3),
-            "Position": {"X": x, "Y": y, "Z": z},
-            "Rotation": {"X": 0, "Y": yaw, "Z": 0},
-            "islocal": is_local
-        }
-        waypoints.append(wp)
-    return waypoints
+    dolly_settings["points"] = user_points_limit
+    params = ShapeParams(MODE_CIRCLE, center, dolly_settings["radius"], user_points_limit,
+                         dolly_settings["duration"])
+    return generate_shape_path(params, camera_settings(),
+                               t=sample_parameters(params, user_points_limit))
 
 def generate_arc_path(
     arc_degrees: float,
@@ -748,414 +921,849 @@ def generate_arc_path(
     saturation: float = 100.0,
     lightness: float = 50.0,
     look_at_center: bool = True,   # if False, face tangent along path
-    eps: float = 1e-6,):
+    eps: float = 1e-6,
+    camera_pos=None,):
     """
     Build a path along an arc centered on `view_target` if set, otherwise
-    around the current camera position as a fallback center.
-
-    Waypoint schema matches other generators:
-      Index, PathIndex, FocalDistance, Aperture, Hue/Saturation/Lightness,
-      LookAtMeXOffset/LookAtMeYOffset, Zoom, Speed, Duration,
-      Position{X,Y,Z}, Rotation{X,Y,Z}, islocal
+    around the current camera position as a fallback center. The arc starts
+    at the camera's bearing from the center. `camera_pos` defaults to the
+    live camera position.
 
     Rotation rule:
       - if look_at_center: yaw faces the center of the arc (classic orbit)
       - else: yaw faces tangent direction (forward along motion)
 
     Segment count is derived from arc span: ~1 waypoint per 5 degrees,
-    clamped to [2, 180] to avoid under/over-sampling.
+    clamped to [2, 180] to avoid under/over-sampling. With adaptive sampling
+    the count comes from the tolerance instead, still capped at 180.
     """
-    import math
-
-    # ----- Centers & starting angle -----
-    if view_target is not None:
-        cx = float(view_target["X"])
-        cy = float(view_target["Y"])
-        cz = float(view_target["Z"])
-    else:
-        # Fallback to camera as the center if no target set
-        cx = float(current_camera_pos.get("X", 0.0))
-        cy = float(current_camera_pos.get("Y", 0.0))
-        cz = float(current_camera_pos.get("Z", 0.0))
-
-    # Compute start angle from center -> camera vector in world XZ plane
-    vx = float(current_camera_pos.get("X", 0.0)) - cx
-    vz = float(current_camera_pos.get("Z", 0.0)) - cz
-    # Avoid NaN/zero vector (spawn at origin etc.)
-    if abs(vx) <= eps and abs(vz) <= eps:
-        # default start facing +Z from center
-        start_deg = 0.0
-    else:
-        start_deg = math.degrees(math.atan2(vx, vz))  # yaw convention: atan2(X, Z)
+    current_camera_pos = camera_pos if camera_pos is not None else camera_pose()[0]
+    # Fallback to camera as the center if no target set
+    center = view_target if view_target is not None else current_camera_pos
 
     # Normalize inputs
-    span = float(arc_degrees)
-    span = max(0.0, min(360.0, span))
+    span = max(0.0, min(360.0, float(arc_degrees)))
     if span == 0.0:
         span = 0.001  # avoid div-by-zero; degenerate tiny arc
 
-    # Direction
-    step_sign = -1.0 if clockwise else 1.0
-
     # Segments: ~every 5 degrees; clamp [2, 180]
     segs = max(2, min(180, int(round(max(2.0, span / 5.0)))))
-
-    # Total duration from settings
-    total_duration = float(dolly_settings.get("duration", 5.0))
-    per_wp_duration = total_duration / max(1, segs - 1)
-
-    # Precompute fixed fields
-    fd = float(focal_distance)
-    ap = float(aperture)
-    zf = float(dolly_zoom)
-    spd = float(dolly_speed)
-    local_flag = bool(is_local)
-
-    waypoints = []
-    for i in range(segs):
-        t = i / (segs - 1) if segs > 1 else 0.0
-        ang_deg = start_deg + step_sign * (t * span)
-        ang_rad = math.radians(ang_deg)
-
-        # Position on arc in XZ plane, preserve center Y (or raise/lower here if needed)
-        x = cx + radius * math.sin(ang_rad)
-        z = cz + radius * math.cos(ang_rad)
-        y = cy  # keep level with center; adjust if you have a height slider
-
-        # Yaw:
-        if look_at_center:
-            # Face towards center (orbit): bearing from point to center
-            yaw_deg = math.degrees(math.atan2(cx - x, cz - z))
-        else:
-            # Face tangent along path (forward):
-            # derivative of circle param: tangent is 90° ahead in direction of travel
-            yaw_deg = ang_deg + ( -90.0 if clockwise else 90.0 )
-
-        wp = {
-            "Index": i,
-            "PathIndex": path_index,
-            "FocalDistance": fd,
-            "Aperture": ap,
-            "Hue": hue,
-            "Saturation": saturation,
-            "Lightness": lightness,
-            "LookAtMeXOffset": 0.0,
-            "LookAtMeYOffset": 0.0,
-            "Zoom": zf,
-            "Speed": spd,
-            "Duration": round(per_wp_duration, 3),
-            "Position": {"X": round(x, 3), "Y": round(y, 3), "Z": round(z, 3)},
-            "Rotation": {"X": 0.0, "Y": round(yaw_deg, 2), "Z": 0.0},
-            "islocal": local_flag,
-        }
-        waypoints.append(wp)
-
-    return waypoints
-
+    params = ShapeParams(MODE_ARC, center, radius, segs, float(dolly_settings.get("duration", 5.0)),
+                         start_deg=arc_start_deg(center, current_camera_pos, eps), span_deg=span,
+                         clockwise=clockwise, look_at_center=look_at_center)
+    camera = camera_settings(path_index=path_index, hue=hue, saturation=saturation,
+                             lightness=lightness)
+    return generate_shape_path(params, camera, t=sample_parameters(params, 180))
 
 def generate_line_path():
     dolly_settings["points"] = user_points_limit
-    waypoints = []
-    n_pts = user_points_limit
-    per_wp_duration = float(dolly_settings.get('duration', 2.0)) / max(1, int(user_points_limit) - 1)
-    startX = start_position["X"] - dolly_settings["radius"]
-    endX = start_position["X"] + dolly_settings["radius"]
-    for i in range(user_points_limit):
-        t = i / (user_points_limit - 1) if user_points_limit > 1 else 0
-        x = round(startX + t * (endX - startX), 3)
-        y = round(start_position["Y"], 3)
-        z = start_position["Z"]
-        wp = {
-            "Index": i,
-            "PathIndex": 0,
-            "FocalDistance": focal_distance,
-            "Aperture": aperture,
-            "Hue": 120.0,
-            "Saturation": 100.0,
-            "Lightness": 50.0,
-            "LookAtMeXOffset": 0.0,
-            "LookAtMeYOffset": 0.0,
-            "Zoom": dolly_zoom,
-            "Speed": dolly_speed,
-            "Duration": round(per_wp_duration, 3),
-            "Position": {"X": x, "Y": y, "Z": z},
-            "Rotation": {"X": 0, "Y": 0, "Z": 0},
-            "islocal": is_local
-        }
-        waypoints.append(wp)
-    return waypoints
+    params = ShapeParams(MODE_LINE, start_position, dolly_settings["radius"], user_points_limit,
+                         dolly_settings.get("duration", 2.0))
+    return generate_shape_path(params, camera_settings(),
+                               t=sample_parameters(params, user_points_limit))
 
 def generate_elliptical_path():
     dolly_settings["points"] = user_points_limit
-    waypoints = []
-    n_pts = user_points_limit
-    per_wp_duration = float(dolly_settings.get('duration', 2.0)) / max(1, int(user_points_limit) - 1)
-    elliptical_ratio = 0.75
-    for i in range(user_points_limit):
-        angle = (i / user_points_limit) * 2 * math.pi
-        x = round(start_position["X"] + dolly_settings["radius"] * math.cos(angle), 3)
-        z = round(start_position["Z"] + (dolly_settings["radius"] * elliptical_ratio) * math.sin(angle), 3)
-        y = round(start_position["Y"], 3)
-        wp = {
-            "Index": i,
-            "PathIndex": 0,
-            "FocalDistance": focal_distance,
-            "Aperture": aperture,
-            "Hue": 120.0,
-            "Saturation": 100.0,
-            "Lightness": 50.0,
-            "LookAtMeXOffset": 0.0,
-            "LookAtMeYOffset": 0.0,
-            "Zoom": dolly_zoom,
-            "Speed": dolly_speed,
-            "Duration": round((i / user_points_limit) * dolly_settings["duration"], 3),
-            "Position": {"X": x, "Y": y, "Z": z},
-            "Rotation": {"X": 0, "Y": 0, "Z": 0}
-        }
-        waypoints.append(wp)
-    return waypoints
+    params = ShapeParams(MODE_ELLIPSE, start_position, dolly_settings["radius"], user_points_limit,
+                         dolly_settings["duration"], ellipse_ratio=0.75)
+    return generate_shape_path(params, camera_settings(),
+                               t=sample_parameters(params, user_points_limit))
 
 def generate_loaded_path():
-    if not loaded_path_data_original:
+    if not len(loaded_path_data_original):
         APP_WINDOW.append_status("No custom path loaded. Returning empty path.")
-        return []
-    # For file/slot modes, ignore the radius scaling and use a fixed scale factor.
-    scale_factor = 1
-    xs = [pt["Position"]["X"] for pt in loaded_path_data_original]
-    ys = [pt["Position"]["Y"] for pt in loaded_path_data_original]
-    zs = [pt["Position"]["Z"] for pt in loaded_path_data_original]
-    cx, cy, cz = sum(xs)/len(xs), sum(ys)/len(ys), sum(zs)/len(zs)
-    new_waypoints = []
-    for original in loaded_path_data_original:
-        wp = copy.deepcopy(original)
-        rx = wp["Position"]["X"] - cx
-        ry = wp["Position"]["Y"] - cy
-        rz = wp["Position"]["Z"] - cz
-        new_x = cx + rx * scale_factor
-        new_y = cy + ry * scale_factor
-        new_z = cz + rz * scale_factor
-        wp["Position"] = {"X": round(new_x, 3), "Y": round(new_y, 3), "Z": round(new_z, 3)}
-        wp["Zoom"] = dolly_zoom
-        wp["Speed"] = dolly_speed
-        wp["Aperture"] = aperture
-        wp["FocalDistance"] = focal_distance
-        new_waypoints.append(wp)
-    return new_waypoints
+        return WaypointArray.empty()
+    # File mode ignores the radius scaling; only the live settings are overridden.
+    return loaded_path_data_original.with_columns(
+        position=np.round(loaded_path_data_original.position, 3),
+        zoom=dolly_zoom,
+        speed=dolly_speed,
+        aperture=aperture,
+        focal_distance=focal_distance,
+    )
 
 def generate_dolly_zoom_path():
     if view_target is None:
         APP_WINDOW.append_status("No target available for Dolly Zoom mode; returning empty path.")
-        return []
-    start_vec = np.array([start_position["X"], start_position["Y"], start_position["Z"]])
-    target_vec = np.array([view_target["X"], view_target["Y"], view_target["Z"]])
-    initial_distance = np.linalg.norm(target_vec - start_vec)
-    num_points = 5
-    max_t = 0.95
-    if reverse_dolly_zoom:
-        t_values = [max_t - (max_t * i/(num_points-1)) for i in range(num_points)]
-    else:
-        t_values = [(max_t * i/(num_points-1)) for i in range(num_points)]
-    waypoints = []
-    for i, t in enumerate(t_values):
-        pos = start_vec * (1 - t) + target_vec * t
-        duration = round(t * dolly_settings["duration"], 3)
-        current_distance = np.linalg.norm(target_vec - pos)
-        new_zoom = initial_dolly_zoom * (current_distance / initial_distance) * dolly_zoom_exaggeration if initial_distance > 0 else initial_dolly_zoom
-        new_zoom = min(max(new_zoom, 20), 300)
-        euler = compute_look_at_unity(pos, target_vec, vertical_mode=False)
-        wp = {
-            "Index": i,
-            "PathIndex": 0,
-            "FocalDistance": focal_distance,
-            "Aperture": aperture,
-            "Hue": 120.0,
-            "Saturation": 100.0,
-            "Lightness": 50.0,
-            "LookAtMeXOffset": 0.0,
-            "LookAtMeYOffset": 0.0,
-            "Zoom": round(new_zoom, 2),
-            "Speed": dolly_speed,
-            "Duration": duration,
-            "Position": {"X": round(pos[0], 3), "Y": round(pos[1], 3), "Z": round(pos[2], 3)},
-            "Rotation": {"X": round(euler[1], 2), "Y": round(euler[0], 2), "Z": round(euler[2], 2)}
-        }
-        waypoints.append(wp)
-    return waypoints
+        return WaypointArray.empty()
+    return dolly_zoom_path(start_position, view_target, initial_dolly_zoom,
+                           dolly_zoom_exaggeration, dolly_settings["duration"],
+                           reverse=reverse_dolly_zoom, camera=camera_settings())
 
-def regenerate_path():
-    global current_path_data
+def build_geometry(camera_pos=None):
+    """
+    Untransformed generator output for the current mode (the base path).
+    `camera_pos` is the camera position Arc mode builds from (live if None).
+    """
     if dolly_mode == MODE_CIRCLE:
-        current_path_data = generate_circle_path()
+        path = generate_circle_path()
     elif dolly_mode == MODE_ARC:
-        current_path_data = generate_arc_path(arc_degrees=float(arc_angle), radius=float(dolly_settings.get("radius", 2.0)), clockwise=False, path_index=0, look_at_center=True)
+        path = generate_arc_path(arc_degrees=float(arc_angle), radius=float(dolly_settings.get("radius", 2.0)), clockwise=False, path_index=0, look_at_center=True, camera_pos=camera_pos)
     elif dolly_mode == MODE_LINE:
-        current_path_data = generate_line_path()
+        path = generate_line_path()
     elif dolly_mode == MODE_ELLIPSE:
-        current_path_data = generate_elliptical_path()
+        path = generate_elliptical_path()
     elif dolly_mode == MODE_FILE:
-        current_path_data = generate_loaded_path()
+        path = generate_loaded_path()
     elif dolly_mode == MODE_DOLLY_ZOOM:
-        current_path_data = generate_dolly_zoom_path()
+        path = generate_dolly_zoom_path()
     else:
-        current_path_data = []
+        path = WaypointArray.empty()
+    return path
+
+def rotation_from_euler(seq, angles):
+    """scipy Rotation from Euler angles in degrees; scipy is imported on the first call."""
+    from scipy.spatial.transform import Rotation
+    return Rotation.from_euler(seq, angles, degrees=True)
+
+def current_rotation_offset():
+    """The path rotation offset, created as the identity on first use."""
+    global camera_rotation_offset
+    if camera_rotation_offset is None:
+        camera_rotation_offset = rotation_from_euler('XYZ', [0, 0, 0])
+    return camera_rotation_offset
+
+def build_transformed_path(base):
+    """
+    `base` with the translation/rotation offsets applied through one
+    homogeneous transform, rebuilt from the current offsets on every call so
+    nudges never accumulate error. Dolly Zoom paths are not offset.
+    """
+    if dolly_mode == MODE_DOLLY_ZOOM or not len(base):
+        return base
+    # In file mode with a view target, skip the "target" itself (index 1).
+    mask = np.ones(len(base), dtype=bool)
+    if dolly_mode == MODE_FILE and view_target is not None and len(mask) > 1:
+        mask[1] = False
+    translation = (camera_offset["X"], camera_offset["Y"], camera_offset["Z"])
+    path = transform_path(base, translation, current_rotation_offset(), mask)
+    return path
+
+# --------------------------
+# Timing
+# --------------------------
+def current_easing():
+    """Bezier control points of the selected easing profile (None for linear)."""
+    if easing_profile == EASING_CUSTOM:
+        return tuple(easing_bezier)
+    return EASING_PROFILES.get(easing_profile)
+
+def timing_total_duration():
+    """Total play time the timing engine spreads over the current path."""
+    if dolly_mode == MODE_FILE:
+        return float(loaded_path_data_original.duration.sum())
+    return float(dolly_settings.get("duration", 2.0))
+
+# --------------------------
+# Hot-Path Instrumentation
+# --------------------------
+STAGE_TIMING_WINDOW = 200  # samples kept per stage for the rolling percentiles
+
+# Display order for the diagnostics panel; _run_stage names are timed as-is.
+TIMED_STAGES = ("generate", "offset", "reverse", "look_at", "vertical", "timing", "fields",
+                "pause", "serialize", "file_write", "osc_send")
+
+class _StageTimer:
+    __slots__ = ("timers", "stage", "t0")
+
+    def __init__(self, timers, stage):
+        self.timers = timers
+        self.stage = stage
+
+    def __enter__(self):
+        self.t0 = time.perf_counter()
+
+    def __exit__(self, *exc):
+        self.timers.record(self.stage, time.perf_counter() - self.t0)
+
+class StageTimers:
+    """
+    Rolling wall-clock timings of the export hot path, per stage.
 
-    # If file mode with a view target, apply camera_offset only to certain points
-    if dolly_mode == MODE_FILE and view_target is not None:
-        for i, pt in enumerate(current_path_data):
-            if i == 1:  # skip the "target" itself
+    `time(stage)` returns a context manager; while disabled it is a shared
+    no-op nullcontext, so instrumented code only pays for one attribute
+    check. Each stage keeps its last `window` samples in a bounded deque;
+    the GUI thread and the export worker append to different stages, and
+    deque appends are atomic, so no lock is needed.
+    """
+
+    _NULL = nullcontext()
+
+    def __init__(self, window=STAGE_TIMING_WINDOW):
+        self.enabled = False
+        self.window = int(window)
+        self._samples = {}
+
+    def time(self, stage):
+        if not self.enabled:
+            return self._NULL
+        return _StageTimer(self, stage)
+
+    def record(self, stage, seconds):
+        samples = self._samples.get(stage)
+        if samples is None:
+            samples = self._samples.setdefault(stage, deque(maxlen=self.window))
+        samples.append(seconds)
+
+    def clear(self):
+        self._samples = {}
+
+    def summary(self):
+        """(stage, samples, p50, p95, max) in milliseconds, in TIMED_STAGES order."""
+        order = {name: i for i, name in enumerate(TIMED_STAGES)}
+        rows = []
+        for stage in sorted(self._samples, key=lambda name: order.get(name, len(order))):
+            ms = np.array(list(self._samples[stage])) * 1000.0
+            if len(ms):
+                p50, p95 = np.percentile(ms, (50, 95))
+                rows.append((stage, len(ms), float(p50), float(p95), float(ms.max())))
+        return rows
+
+STAGE_TIMERS = StageTimers()
+
+EXPORT_LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5)  # seconds
+PAYLOAD_SIZE_BUCKETS = (1e3, 1e4, 1e5, 1e6, 1e7)  # bytes
+
+class Histogram:
+    """
+    Fixed-bucket histogram for the metrics endpoint.
+
+    Buckets and sum are updated and read together under a lock, so a scrape
+    never sees a `_sum` or `_count` that disagrees with the buckets. The lock
+    is only held for a few list operations, never across I/O.
+    """
+
+    def __init__(self, bounds):
+        self.bounds = tuple(float(b) for b in bounds)
+        self._counts = [0] * (len(self.bounds) + 1)  # last slot is +Inf
+        self._sum = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, value):
+        i = bisect.bisect_left(self.bounds, value)
+        with self._lock:
+            self._counts[i] += 1
+            self._sum += value
+
+    def snapshot(self):
+        """(cumulative [(upper bound, count)], sum, count), ending with +Inf."""
+        with self._lock:
+            counts = list(self._counts)
+            total = self._sum
+        cumulative, running = [], 0
+        for bound, n in zip(self.bounds + (float("inf"),), counts):
+            running += n
+            cumulative.append((bound, running))
+        return cumulative, total, running
+
+# --------------------------
+# Export Pipeline
+# --------------------------
+# Each stage (dolly_core.pipeline) is a pure function (path, *params) -> path.
+# Stages never mutate their input; they return views or `with_columns`
+# overrides that share the untouched columns, so a WaypointArray can be
+# treated as immutable once built.
+
+# name -> (input path, params, output path) of the last run
+_export_stage_cache = {}
+
+def _run_stage(name, func, path, *params):
+    """
+    Run an export stage, reusing its last output when it is called with the
+    same input path object and the same parameters.
+    """
+    cached = _export_stage_cache.get(name)
+    if cached is not None and cached[0] is path and cached[1] == params:
+        return cached[2]
+    with STAGE_TIMERS.time(name):
+        out = func(path, *params)
+    _export_stage_cache[name] = (path, params, out)
+    return out
+
+def build_oriented_path(base):
+    """Orientation stages over the geometry: reversal -> look-at -> vertical roll."""
+    path = base
+    if reverse_path:
+        keep_head = dolly_mode == MODE_FILE and view_target is not None
+        path = _run_stage("reverse", stage_reverse, path, keep_head)
+    if view_target is not None and use_view_target:
+        target = (float(view_target["X"]), float(view_target["Y"]), float(view_target["Z"]))
+        # In file mode, skip the target waypoint (assumed index 1)
+        skip_index = 1 if dolly_mode == MODE_FILE else None
+        path = _run_stage("look_at", stage_look_at, path, target, skip_index)
+    if dolly_vertical:
+        path = _run_stage("vertical", stage_vertical, path)
+    return path
+
+def build_field_path(oriented):
+    """Timing, per-waypoint scalar overrides and the optional pause waypoint."""
+    zoom = None if dolly_mode == MODE_DOLLY_ZOOM else dolly_zoom
+    path = oriented
+    easing = current_easing()
+    constant_speed = timing_mode == TIMING_CONSTANT_SPEED
+    if constant_speed or easing is not None:
+        # File mode's target marker (index 1) is not part of the camera move.
+        skip_index = 1 if dolly_mode == MODE_FILE and view_target is not None else None
+        path = _run_stage("timing", stage_timing, path, timing_total_duration(),
+                          constant_speed, easing, skip_index)
+    path = _run_stage("fields", stage_fields, path, lookat_x_offset, lookat_y_offset,
+                      dolly_speed, zoom, aperture, focal_distance)
+    if dolly_pause:
+        pause_len = float(dolly_settings.get("pause_duration", PAUSE_DURATION_DEFAULT))
+        path = _run_stage("pause", stage_pause, path, pause_len)
+    return path
+
+def build_export_path(base):
+    """
+    Run the export pipeline over `base` (normally current_path_data):
+    reversal -> look-at -> vertical roll -> timing -> scalar fields -> pause.
+
+    Orientation stages come before the scalar overrides so that zoom/speed
+    and LookAtMe changes only re-run the cheap column fills.
+    """
+    return build_field_path(build_oriented_path(base))
+
+# --------------------------
+# Path Cache
+# --------------------------
+PATH_CACHE_MAX_ENTRIES = 32
+PATH_CACHE_MAX_BYTES = 64 * 1024 * 1024
+
+class PathCache:
+    """
+    Bounded LRU cache of fully built paths, keyed by a digest of the complete
+    parameter state (`path_state_key`).
+
+    Each entry holds the base, transformed, oriented and export products plus, once
+    the export worker has serialized it, the JSON payload. Returning to a
+    state seen before (mode switches, toggles, pins) then skips generation
+    and serialization. Entries are evicted least-recently-used first when
+    either `max_entries` or `max_bytes` is exceeded. The GUI thread stores
+    and looks up paths while the worker attaches payloads, so access is
+    guarded by a lock.
+    """
+
+    def __init__(self, max_entries=PATH_CACHE_MAX_ENTRIES, max_bytes=PATH_CACHE_MAX_BYTES):
+        self.max_entries = int(max_entries)
+        self.max_bytes = int(max_bytes)
+        self._entries = OrderedDict()  # key -> [products, payload, nbytes]
+        self._keys_by_path = {}        # id(export path) -> keys of the entries sharing it
+        self._lock = threading.Lock()
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    @staticmethod
+    def _products_nbytes(products):
+        seen = {}
+        for path in products:
+            if path is None:
                 continue
-            for axis in ['X', 'Y', 'Z']:
-                pt["Position"][axis] = round(pt["Position"][axis] + camera_offset[axis], 3)
-    # Other modes
-    elif dolly_mode not in [MODE_DOLLY_ZOOM]:
-        for pt in current_path_data:
-            for axis in ['X', 'Y', 'Z']:
-                pt["Position"][axis] = round(pt["Position"][axis] + camera_offset[axis], 3)
-
-    # Apply rotation offset for non-Dolly-Zoom modes
-    if dolly_mode not in [MODE_DOLLY_ZOOM]:
-        if dolly_mode == MODE_FILE and view_target is not None:
-            camera_points = []
-            for i, pt in enumerate(current_path_data):
-                if i == 1:
-                    continue
-                camera_points.append(np.array([pt["Position"]["X"], pt["Position"]["Y"], pt["Position"]["Z"]]))
-        else:
-            camera_points = [np.array([pt["Position"]["X"], pt["Position"]["Y"], pt["Position"]["Z"]]) for pt in current_path_data]
-        if camera_points:
-            pivot = np.mean(camera_points, axis=0)
-            for i, pt in enumerate(current_path_data):
-                if dolly_mode == MODE_FILE and view_target is not None and i == 1:
-                    continue
-                pos = np.array([pt["Position"]["X"], pt["Position"]["Y"], pt["Position"]["Z"]])
-                rel = pos - pivot
-                new_rel = camera_rotation_offset.apply(rel)
-                new_pos = pivot + new_rel
-                pt["Position"]["X"] = round(new_pos[0], 3)
-                pt["Position"]["Y"] = round(new_pos[1], 3)
-                pt["Position"]["Z"] = round(new_pos[2], 3)
-        if current_path_data:
-            for i, pt in enumerate(current_path_data):
-                if dolly_mode == MODE_FILE and view_target is not None and i == 1:
-                    continue
-                base_rot = R.from_euler('XYZ', [pt["Rotation"]["X"], pt["Rotation"]["Y"], pt["Rotation"]["Z"]], degrees=True)
-                new_rot = camera_rotation_offset * base_rot
-                new_euler = new_rot.as_euler('XYZ', degrees=True)
-                pt["Rotation"]["X"] = round(new_euler[0], 2)
-                pt["Rotation"]["Y"] = round(new_euler[1], 2)
-                pt["Rotation"]["Z"] = round(new_euler[2], 2)
-    send_dolly_path()
+            for c in WaypointArray.COLUMNS:
+                arr = getattr(path, c)
+                seen[id(arr)] = arr.nbytes
+        return sum(seen.values())
+
+    def get(self, key):
+        """Return the cached (base, transformed, oriented, export) products for `key`, or None."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key, products):
+        with self._lock:
+            if key in self._entries:
+                self._drop(key)
+            nbytes = self._products_nbytes(products)
+            self._entries[key] = [products, None, nbytes]
+            if products[-1] is not None:
+                self._keys_by_path.setdefault(id(products[-1]), set()).add(key)
+            self.nbytes += nbytes
+            self._evict()
+
+    def _entries_for(self, path):
+        """Entries whose export product is `path` (several keys can share one path object)."""
+        entries = (self._entries.get(key) for key in self._keys_by_path.get(id(path), ()))
+        return [entry for entry in entries if entry is not None and entry[0][-1] is path]
+
+    def payload(self, path):
+        """Serialized payload previously attached for this export path, or None."""
+        with self._lock:
+            for entry in self._entries_for(path):
+                if entry[1] is not None:
+                    return entry[1]
+            return None
+
+    def attach_payload(self, path, payload):
+        with self._lock:
+            for entry in self._entries_for(path):
+                if entry[1] is None:
+                    entry[1] = payload
+                    entry[2] += len(payload)
+                    self.nbytes += len(payload)
+            self._evict()
+
+    def set_limits(self, max_entries=None, max_bytes=None):
+        with self._lock:
+            if max_entries is not None:
+                self.max_entries = max(0, int(max_entries))
+            if max_bytes is not None:
+                self.max_bytes = max(0, int(max_bytes))
+            self._evict()
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._keys_by_path.clear()
+            self.nbytes = 0
+
+    def _drop(self, key):
+        products, _, nbytes = self._entries.pop(key)
+        if products[-1] is not None:
+            keys = self._keys_by_path.get(id(products[-1]))
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._keys_by_path[id(products[-1])]
+        self.nbytes -= nbytes
+
+    def _evict(self):
+        while self._entries and (len(self._entries) > self.max_entries or self.nbytes > self.max_bytes):
+            self._drop(next(iter(self._entries)))
+            self.evictions += 1
+
+PATH_CACHE = PathCache()
+
+_loaded_path_digest = (None, "")  # (path, digest) so an unchanged File-mode path is hashed once
+
+def _waypoints_digest(path):
+    global _loaded_path_digest
+    if _loaded_path_digest[0] is not path:
+        h = hashlib.blake2b(digest_size=16)
+        for c in WaypointArray.COLUMNS:
+            h.update(np.ascontiguousarray(getattr(path, c)).tobytes())
+        _loaded_path_digest = (path, h.hexdigest())
+    return _loaded_path_digest[1]
+
+def path_state_key(camera_pos=None):
+    """
+    Canonical digest of every input the export path is built from. The
+    rotation offset enters as a sign-normalized quaternion so equal rotations
+    reached through different nudge sequences share a key. In Arc mode
+    `camera_pos` must be the camera position the geometry is built from
+    (live if None).
+    """
+    quat = current_rotation_offset().as_quat()
+    if quat[3] < 0:
+        quat = -quat
+    state = {
+        "mode": dolly_mode,
+        "start": start_position,
+        "center": exported_center,
+        "target": view_target,
+        "use_target": use_view_target,
+        "offset": camera_offset,
+        "rotation": np.round(quat, 9).tolist(),
+        "settings": {k: v for k, v in dolly_settings.items() if k != "points"},
+        "points": user_points_limit,
+        "arc_angle": arc_angle,
+        "zoom": dolly_zoom,
+        "speed": dolly_speed,
+        "aperture": aperture,
+        "focal_distance": focal_distance,
+        "lookat": (lookat_x_offset, lookat_y_offset),
+        "is_local": is_local,
+        "reverse": reverse_path,
+        "vertical": dolly_vertical,
+        "pause": dolly_pause,
+        "sampling": (adaptive_sampling, sampling_tolerance, sampling_max_angle),
+        "timing": (timing_mode, current_easing()),
+    }
+    if dolly_mode == MODE_DOLLY_ZOOM:
+        state["dolly_zoom"] = (dolly_zoom_exaggeration, reverse_dolly_zoom, initial_dolly_zoom)
+    if dolly_mode == MODE_FILE:
+        state["loaded"] = _waypoints_digest(loaded_path_data_original)
+    if dolly_mode == MODE_ARC:
+        # The arc starts at the camera bearing it was built from.
+        state["camera"] = camera_pos if camera_pos is not None else camera_pose()[0]
+    blob = json.dumps(state, sort_keys=True, default=float)
+    return hashlib.blake2b(blob.encode("utf-8"), digest_size=16).hexdigest()
+
+# --------------------------
+# Parameter Dependency Graph
+# --------------------------
+# Derived products, in derivation order: each one is built from the previous,
+# so invalidating a product also invalidates everything after it.
+PRODUCT_GEOMETRY = "geometry"        # untransformed generator output (base path)
+PRODUCT_TRANSFORM = "transform"      # translation/rotation offsets as one homogeneous transform
+PRODUCT_ORIENTATION = "orientation"  # reversal, look-at, vertical roll
+PRODUCT_FIELDS = "fields"            # timing, per-waypoint scalar fields + pause
+PRODUCT_PAYLOAD = "payload"          # serialized JSON (built by the export worker)
+PRODUCT_ORDER = (PRODUCT_GEOMETRY, PRODUCT_TRANSFORM, PRODUCT_ORIENTATION, PRODUCT_FIELDS, PRODUCT_PAYLOAD)
+
+# Parameter -> first product it invalidates.
+PARAM_PRODUCTS = {
+    "mode": PRODUCT_GEOMETRY,
+    "radius": PRODUCT_GEOMETRY,
+    "duration": PRODUCT_GEOMETRY,
+    "points": PRODUCT_GEOMETRY,
+    "arc_angle": PRODUCT_GEOMETRY,
+    "center": PRODUCT_GEOMETRY,
+    "target": PRODUCT_GEOMETRY,          # arc center, dolly zoom end, file-mode index 1
+    "camera_offset": PRODUCT_TRANSFORM,
+    "rotation_offset": PRODUCT_TRANSFORM,
+    "loaded_path": PRODUCT_GEOMETRY,
+    "is_local": PRODUCT_GEOMETRY,
+    "dz_exaggeration": PRODUCT_GEOMETRY,
+    "reverse_dolly_zoom": PRODUCT_GEOMETRY,
+    "sampling": PRODUCT_GEOMETRY,
+    "reverse_path": PRODUCT_ORIENTATION,
+    "use_target": PRODUCT_ORIENTATION,
+    "vertical": PRODUCT_ORIENTATION,
+    "timing": PRODUCT_FIELDS,
+    "easing": PRODUCT_FIELDS,
+    "zoom": PRODUCT_FIELDS,
+    "speed": PRODUCT_FIELDS,
+    "aperture": PRODUCT_FIELDS,
+    "focal_distance": PRODUCT_FIELDS,
+    "lookat_x": PRODUCT_FIELDS,
+    "lookat_y": PRODUCT_FIELDS,
+    "pause": PRODUCT_FIELDS,
+}
+
+_dirty_products = set(PRODUCT_ORDER)
+geometry_camera_pos = None  # camera position the current geometry was built from
+oriented_path_data = None
+export_path_data = None
+
+def invalidate_products(product):
+    """Mark `product` and everything derived from it as dirty."""
+    _dirty_products.update(PRODUCT_ORDER[PRODUCT_ORDER.index(product):])
+
+def invalidate(*params):
+    for param in params:
+        invalidate_products(PARAM_PRODUCTS[param])
+
+def refresh_path():
+    """
+    Recompute only the dirty products, in derivation order. Returns the final
+    export path; the payload is serialized from it by the export worker, which
+    reuses its last JSON when handed the same (unchanged) snapshot.
+
+    A state seen before is restored from PATH_CACHE without rebuilding.
+    Camera moves do not invalidate the geometry, so the pose is sampled only
+    when the geometry is rebuilt; partial rebuilds keep keying the products
+    on the pose the existing geometry came from.
+    """
+    global base_path_data, current_path_data, oriented_path_data, export_path_data
+    global geometry_camera_pos
+    if not _dirty_products:
+        return export_path_data
+    rebuild_geometry = PRODUCT_GEOMETRY in _dirty_products
+    camera_pos = camera_pose()[0] if rebuild_geometry else geometry_camera_pos
+    key = path_state_key(camera_pos)
+    cached = PATH_CACHE.get(key)
+    if cached is not None:
+        base_path_data, current_path_data, oriented_path_data, export_path_data = cached
+        geometry_camera_pos = camera_pos
+        _dirty_products.clear()
+        report_waypoint_count(len(export_path_data))
+        return export_path_data
+    if rebuild_geometry:
+        with STAGE_TIMERS.time("generate"):
+            base_path_data = build_geometry(camera_pos)
+        geometry_camera_pos = camera_pos
+    if PRODUCT_TRANSFORM in _dirty_products:
+        with STAGE_TIMERS.time("offset"):
+            current_path_data = build_transformed_path(base_path_data)
+    if PRODUCT_ORIENTATION in _dirty_products:
+        oriented_path_data = build_oriented_path(current_path_data)
+    if PRODUCT_FIELDS in _dirty_products:
+        export_path_data = build_field_path(oriented_path_data)
+        if export_path_data is not None:
+            report_waypoint_count(len(export_path_data))
+    _dirty_products.clear()
+    PATH_CACHE.put(key, (base_path_data, current_path_data, oriented_path_data, export_path_data))
+    return export_path_data
+
+def update_path(*params):
+    """Record which parameters changed, then rebuild only what depends on them and export."""
+    invalidate(*params)
+    request_export()
+
+def regenerate_path():
+    invalidate_products(PRODUCT_GEOMETRY)
+    request_export()
+
+def request_export():
+    """Ask for an export of the current state; coalesced by EXPORT_SCHEDULER once the UI is up."""
+    if EXPORT_SCHEDULER is None:
+        send_dolly_path()
+    else:
+        EXPORT_SCHEDULER.request()
+
+# --------------------------
+# Export Worker
+# --------------------------
+class ExportWorker(threading.Thread):
+    """
+    Owns serialization, the temp-file write and the /dolly/Import send so the
+    GUI thread never blocks on disk or network I/O.
+
+    The GUI thread hands over immutable WaypointArray snapshots through a
+    single-slot, latest-wins queue (`submit`); completion, byte size and
+    timings come back through BUS.exportFinished, the same way ActionBus
+    bridges the OSC thread. Payloads identical to the last imported one are
+    skipped entirely; new ones are published with an atomic file swap.
+    """
+
+    def __init__(self):
+        super().__init__(name="DollyExportWorker", daemon=True)
+        self._cond = threading.Condition()
+        self._pending = None
+        self._encoder = WaypointEncoder()
+        self._last_path = None
+        self._last_json = None
+        self._last_digest = None  # hash of the payload VRChat last imported
+        # Metrics, written only by the thread running export()
+        self.sent = 0
+        self.deduplicated = 0
+        self.errors = 0
+        self.latency = Histogram(EXPORT_LATENCY_BUCKETS)
+        self.payload_sizes = Histogram(PAYLOAD_SIZE_BUCKETS)
+
+    def submit(self, path):
+        with self._cond:
+            self._pending = path  # an older, not yet exported snapshot is stale
+            self._cond.notify()
+
+    def run(self):
+        while True:
+            with self._cond:
+                while self._pending is None:
+                    self._cond.wait()
+                path, self._pending = self._pending, None
+            self.export(path)
+
+    def serialize(self, path):
+        if path is not self._last_path:
+            payload = PATH_CACHE.payload(path)
+            if payload is None:
+                payload = self._encoder.encode(path)
+                PATH_CACHE.attach_payload(path, payload)
+            self._last_json = payload
+            self._last_path = path
+        return self._last_json
+
+    def export(self, path):
+        t0 = time.perf_counter()
+        try:
+            with STAGE_TIMERS.time("serialize"):
+                payload = self.serialize(path).encode("utf-8")
+                digest = hashlib.blake2b(payload, digest_size=16).digest()
+            t1 = time.perf_counter()
+            if digest == self._last_digest:
+                # Byte-identical to what VRChat already has: no write, no import.
+                self.deduplicated += 1
+                BUS.exportFinished.emit(len(payload), (t1 - t0) * 1000.0, 0.0, True, "")
+                return
+            temp_file_path = os.path.join(USED_LOCATIONS_PATH, "temp_dolly_export.json")
+            with STAGE_TIMERS.time("file_write"):
+                publish_file_atomic(temp_file_path, payload)
+            with STAGE_TIMERS.time("osc_send"):
+                client.send_message("/dolly/Import", temp_file_path)
+            self._last_digest = digest
+            t2 = time.perf_counter()
+            self.sent += 1
+            self.latency.observe(t2 - t0)
+            self.payload_sizes.observe(len(payload))
+            print(f"Sent OSC message with file path: {temp_file_path}")
+            BUS.exportFinished.emit(len(payload), (t1 - t0) * 1000.0, (t2 - t1) * 1000.0, False, "")
+        except Exception as e:
+            self.errors += 1
+            BUS.exportFinished.emit(0, 0.0, 0.0, False, str(e))
+
+def publish_file_atomic(dest_path, payload, retries=5, retry_delay=0.02):
+    """
+    Write `payload` (bytes) next to `dest_path` and swap it into place with
+    os.replace, so a reader sees either the old file or the new one, never a
+    half-written one. On Windows the swap fails while another process has the
+    destination open, so it is retried briefly before giving up.
+    """
+    tmp_path = dest_path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(payload)
+    for attempt in range(retries):
+        try:
+            os.replace(tmp_path, dest_path)
+            return
+        except PermissionError:
+            if attempt == retries - 1:
+                raise
+            time.sleep(retry_delay)
+
+EXPORT_WORKER = ExportWorker()  # started with the UI; exports run inline before that
 
 def send_dolly_path():
     global initial_import
+    snapshot = refresh_path()
     if initial_import:
         print("Initial import suppressed.")
         initial_import = False
         return
-    if current_path_data is None:
-        return
-
-    # Make a copy of the current path data.
-    final_data = copy.deepcopy(current_path_data)
-
-    # Apply reversal if the flag is set.
-    if reverse_path:
-        # For file mode (dolly_mode==MODE_FILE) with a target, keep index 1 fixed.
-        if dolly_mode == MODE_FILE and view_target is not None and len(final_data) > 2:
-            # Keep first two points (start and target) intact.
-            start_target = final_data[:2]
-            # Reverse the remaining points.
-            rest = final_data[2:]
-            rest.reverse()
-            final_data = start_target + rest
-        else:
-            final_data.reverse()
-        # Optionally update the Index fields for debugging:
-        for i, pt in enumerate(final_data):
-            pt["Index"] = i
-        APP_WINDOW.append_status(f"Reversed path order:", [pt["Index"] for pt in final_data])
-
-    # Apply common adjustments.
-    for pt in final_data:
-        pt["LookAtMeXOffset"] = lookat_x_offset
-        pt["LookAtMeYOffset"] = lookat_y_offset
-        if dolly_mode != MODE_DOLLY_ZOOM:
-            pt["Zoom"] = dolly_zoom
-        pt["Speed"] = dolly_speed
-
-    # If we have a target and are using it, adjust rotations.
-    if view_target is not None and use_view_target:
-        for i, pt in enumerate(final_data):
-            # In file mode, skip the target waypoint (assumed index 1)
-            if dolly_mode == MODE_FILE and view_target is not None and i == 1:
-                continue
-            cam = np.array([pt["Position"]["X"], pt["Position"]["Y"], pt["Position"]["Z"]])
-            tgt = np.array([view_target["X"], view_target["Y"], view_target["Z"]])
-            euler = compute_look_at_unity(cam, tgt, vertical_mode=False)
-            pt["Rotation"] = {"X": round(euler[1], 2), "Y": round(euler[0], 2), "Z": round(euler[2], 2)}
-
-    # Apply vertical adjustment if enabled.
-    if dolly_vertical:
-        for pt in final_data:
-            base_rot = R.from_euler('YXZ', [pt["Rotation"]["Y"], pt["Rotation"]["X"], pt["Rotation"]["Z"]], degrees=True)
-            vertical_adjust = R.from_euler('Z', 90, degrees=True)
-            final_rot = base_rot * vertical_adjust
-            euler = final_rot.as_euler('YXZ', degrees=True)
-            pt["Rotation"] = {"X": round(euler[1], 2), "Y": round(euler[0], 2), "Z": round(euler[2], 2)}
-
-    # Handle "Pause" by duplicating the last waypoint if needed.
-    if dolly_pause and final_data:
-        add_pause_at_end(final_data)  
-
-    json_data = json.dumps(final_data)
-    APP_WINDOW.append_status(f"Sending dolly path (size: {len(json_data)} bytes)")
-    temp_file_path = os.path.join(USED_LOCATIONS_PATH, "temp_dolly_export.json")
-    try:
-        with open(temp_file_path, "w", encoding="utf-8") as f:
-            f.write(json_data)
-        client.send_message("/dolly/Import", temp_file_path)
-        print(f"Sent OSC message with file path: {temp_file_path}")
-    except Exception as e:
-        APP_WINDOW.append_status(f"Error writing temp file: {e}")
+    if EXPORT_WORKER.is_alive():
+        EXPORT_WORKER.submit(snapshot)
+    else:
+        EXPORT_WORKER.export(snapshot)
 
+def on_export_finished(size, serialize_ms, io_ms, deduplicated, error):
+    if error:
+        APP_WINDOW.append_status(f"Error writing temp file: {error}")
+    elif deduplicated:
+        APP_WINDOW.append_status(f"Dolly path unchanged ({size} bytes); import skipped")
+    else:
+        APP_WINDOW.append_status(
+            f"Sending dolly path (size: {size} bytes, serialize {serialize_ms:.1f} ms, write+send {io_ms:.1f} ms)")
 
 def adjust_position(axis, direction):
-    global current_path_data, camera_offset, translation_step_value
+    # Only the offset transform is rebuilt; the base path is left untouched.
+    global camera_offset, translation_step_value
     delta = direction * translation_step_value
     camera_offset[axis] += delta
-    if current_path_data is None:
-        return
-    for i, pt in enumerate(current_path_data):
-        if dolly_mode == MODE_FILE and view_target is not None and i == 1:
-            continue
-        pt["Position"][axis] = round(pt["Position"][axis] + delta, 3)
-    send_dolly_path()
+    update_path("camera_offset")
 
 def rotate_path(axis, angle_deg):
-    global current_path_data, camera_rotation_offset, rotation_step_value
+    global camera_rotation_offset, rotation_step_value
     delta_angle = angle_deg * rotation_step_value
-    delta_rot = R.from_euler(axis, delta_angle, degrees=True)
-    camera_rotation_offset = delta_rot * camera_rotation_offset
-    regenerate_path()
+    delta_rot = rotation_from_euler(axis, delta_angle)
+    camera_rotation_offset = delta_rot * current_rotation_offset()
+    update_path("rotation_offset")
 
 def rebase_loaded_path():
     global loaded_path_data_original
-    if not loaded_path_data_original:
+    if not len(loaded_path_data_original):
         APP_WINDOW.append_status("No custom path loaded to rebase.")
         return
-    offset_x = start_position["X"] - loaded_path_data_original[0]["Position"]["X"]
-    offset_y = start_position["Y"] - loaded_path_data_original[0]["Position"]["Y"]
-    offset_z = start_position["Z"] - loaded_path_data_original[0]["Position"]["Z"]
-    for wp in loaded_path_data_original:
-        wp["Position"]["X"] = round(wp["Position"]["X"] + offset_x, 3)
-        wp["Position"]["Y"] = round(wp["Position"]["Y"] + offset_y, 3)
-        wp["Position"]["Z"] = round(wp["Position"]["Z"] + offset_z, 3)
-    APP_WINDOW.append_status("Loaded custom path rebased to start position:", start_position)
-    regenerate_path()
+    start = np.array([start_position["X"], start_position["Y"], start_position["Z"]])
+    offset = start - loaded_path_data_original.position[0]
+    loaded_path_data_original = loaded_path_data_original.with_columns(
+        position=np.round(loaded_path_data_original.position + offset, 3))
+    APP_WINDOW.append_status(f"Loaded custom path rebased to start position: {start_position}")
+    update_path("loaded_path")
+
+def simplify_loaded_path():
+    global loaded_path_data_original
+    if not len(loaded_path_data_original):
+        APP_WINDOW.append_status("No custom path loaded to simplify.")
+        return
+    before = loaded_path_data_original
+    # Index 1 doubles as the target marker in File mode, so it is never dropped.
+    after = simplify_path(before, simplify_position_tolerance, simplify_angle_tolerance, keep=(1,))
+    loaded_path_data_original = after
+    APP_WINDOW.append_status(
+        f"Simplified custom path: {len(before)} -> {len(after)} waypoints "
+        f"({len(before) / len(after):.1f}:1, total duration {after.duration.sum():.3f} s)")
+    update_path("loaded_path")
+
+def toggle_constant_speed(val):
+    global timing_mode
+    timing_mode = TIMING_CONSTANT_SPEED if val else TIMING_GENERATOR
+    APP_WINDOW.append_status(f"Constant Speed Timing: {val}")
+    update_path("timing")
+
+def set_easing_profile(name):
+    global easing_profile
+    if name not in EASING_PROFILES:
+        return
+    easing_profile = name
+    APP_WINDOW.append_status(f"Easing: {easing_profile}")
+    update_path("easing")
+
+def on_easing_bezier_entry_return():
+    global easing_bezier
+    try:
+        values = tuple(float(v) for v in easing_bezier_entry.text().split(","))
+        if len(values) == 4:
+            easing_bezier = tuple(min(1.0, max(0.0, v)) for v in values)
+    except ValueError:
+        pass
+    easing_bezier_entry.setText(", ".join(f"{v:g}" for v in easing_bezier))
+    if easing_profile == EASING_CUSTOM:
+        update_path("easing")
+
+def diagnostics_lines():
+    """Rolling stage timings followed by cache statistics, for the diagnostics panel."""
+    lines = [f"{'Stage':<12}{'n':>6}{'p50 ms':>10}{'p95 ms':>10}{'max ms':>10}"]
+    for stage, n, p50, p95, peak in STAGE_TIMERS.summary():
+        lines.append(f"{stage:<12}{n:>6}{p50:>10.2f}{p95:>10.2f}{peak:>10.2f}")
+    if len(lines) == 1:
+        lines.append("(no exports timed yet)")
+    lines.append("")
+    for name, cached in (("Shape templates", unit_shape_template),
+                         ("Easing curves", easing_curve),
+                         ("Easing tables", easing_elapsed_table)):
+        info = cached.cache_info()
+        lookups = info.hits + info.misses
+        hit_rate = 100.0 * info.hits / lookups if lookups else 0.0
+        lines.append(
+            f"{name}: {info.hits} hits / {info.misses} misses ({hit_rate:.0f}%), "
+            f"{info.currsize}/{info.maxsize} entries")
+    cache = PATH_CACHE
+    lookups = cache.hits + cache.misses
+    hit_rate = 100.0 * cache.hits / lookups if lookups else 0.0
+    lines.append(
+        f"Path cache: {cache.hits} hits / {cache.misses} misses ({hit_rate:.0f}%), "
+        f"{len(cache)}/{cache.max_entries} entries, {cache.nbytes / 1e6:.1f}/{cache.max_bytes / 1e6:.0f} MB, "
+        f"{cache.evictions} evicted")
+    return lines
+
+def toggle_stage_timing(val):
+    STAGE_TIMERS.clear()
+    STAGE_TIMERS.enabled = val
+    APP_WINDOW.append_status(f"Stage timing: {val}")
+
+def toggle_adaptive_sampling(val):
+    global adaptive_sampling
+    adaptive_sampling = val
+    update_path("sampling")
+    APP_WINDOW.append_status(f"Adaptive sampling: {adaptive_sampling}")
+
+def on_sampling_entry_return():
+    global sampling_tolerance, sampling_max_angle
+    try:
+        sampling_tolerance = max(0.001, float(sampling_tolerance_entry.text()))
+        sampling_max_angle = max(0.1, min(90.0, float(sampling_max_angle_entry.text())))
+    except ValueError:
+        pass
+    sampling_tolerance_entry.setText(str(sampling_tolerance))
+    sampling_max_angle_entry.setText(str(sampling_max_angle))
+    if adaptive_sampling:
+        update_path("sampling")
+        APP_WINDOW.append_status(
+            f"Adaptive sampling tolerance: {sampling_tolerance} m / {sampling_max_angle} deg")
+
+def on_simplify_tolerance_entry_return():
+    global simplify_position_tolerance, simplify_angle_tolerance
+    try:
+        simplify_position_tolerance = max(0.0, float(simplify_position_entry.text()))
+        simplify_angle_tolerance = max(0.0, float(simplify_angle_entry.text()))
+    except ValueError:
+        pass
+    simplify_position_entry.setText(str(simplify_position_tolerance))
+    simplify_angle_entry.setText(str(simplify_angle_tolerance))
 
 def start_osc_server():
     dispatcher = Dispatcher()
-    dispatcher.map("/usercamera/Pose", on_usercamera_pose)
+    dispatcher.map("/usercamera/Pose", POSE_STORE.on_osc)
     dispatcher.map("/avatar/parameters/SetTargetFromCam", on_avatar_set_target)
     dispatcher.map("/avatar/parameters/SetPathFromCam", on_avatar_set_path)
     dispatcher.map("/avatar/parameters/SetDollyMode", on_avatar_set_dolly_mode)
@@ -1195,10 +1803,13 @@ def start_osc_server():
     for addr, key, kind, axis, direc in maps:
         dispatcher.map(addr, make_nudge_handler(key, kind, axis, direc))
 
-    server = osc_server.ThreadingOSCUDPServer((OSC_IP, OSC_PORT_RECEIVE), dispatcher)
+    global OSC_RECEIVER
+    server = OSC_RECEIVER = OscReceiver(dispatcher, OSC_IP, OSC_PORT_RECEIVE, pose_handler=POSE_STORE.store)
     print(f"Starting OSC server on {OSC_IP}:{OSC_PORT_RECEIVE}")
     server.serve_forever()
 
+OSC_RECEIVER = None  # set by the OSC thread once its socket is bound
+
 def on_avatar_set_dolly_mode(address, *args):
     """Handle OSC int parameter to switch dolly mode.
     Accepts values matching the MODE_* constants.
@@ -1215,11 +1826,7 @@ def on_avatar_set_dolly_mode(address, *args):
     if val in valid_modes:
         # Avoid unnecessary regenerations if the mode is already set
         if val != dolly_mode:
-            try:
-                APP_WINDOW.append_status(f"OSC: SetDollyMode -> {val}")
-            except Exception:
-                pass
-            set_mode(val)  # same path as pressing a UI button
+            BUS.setDollyMode.emit(val)  # set_mode_from_osc, on the UI thread
 
 def on_avatar_set_target(address, *args):
     if not _camera_pose_is_nonzero():
@@ -1253,61 +1860,52 @@ def start_osc_server_thread():
     threading.Thread(target=start_osc_server, daemon=True).start()
 
 
-def on_usercamera_pose(address, *args):
-    """OSC handler for camera pose: posX, posY, posZ, rotX, rotY, rotZ (degrees)."""
-    try:
-        if len(args) >= 6:
-            x, y, z, rx, ry, rz = [float(a) for a in args[:6]]
-            with pose_lock:
-                current_camera_pos["X"] = round(x, 3)
-                current_camera_pos["Y"] = round(y, 3)
-                current_camera_pos["Z"] = round(z, 3)
-                current_camera_rot["X"] = round(rx, 2)
-                current_camera_rot["Y"] = round(ry, 2)
-                current_camera_rot["Z"] = round(rz, 2)
-                global last_pose_timestamp
-                last_pose_timestamp = time.time()
-    except Exception:
-        # Ignore malformed packets; keep OSC thread resilient.
-        pass
-
-
 def toggle_reverse_dolly_zoom(val):
     global reverse_dolly_zoom
     reverse_dolly_zoom = val
     APP_WINDOW.append_status(f"Reverse Dolly Zoom: {reverse_dolly_zoom}")
     if dolly_mode == MODE_DOLLY_ZOOM:
-        regenerate_path()
+        update_path("reverse_dolly_zoom")
+
+def set_mode_from_osc(mode):
+    if mode == dolly_mode:
+        return
+    APP_WINDOW.append_status(f"OSC: SetDollyMode -> {mode}")
+    set_mode(mode)  # same path as pressing a UI button
 
 def set_mode(mode):
     global dolly_mode
     dolly_mode = mode
+    BUS.modeChanged.emit(mode)
     if mode == MODE_DOLLY_ZOOM:  # Dolly Zoom mode
         ensure_dolly_zoom_init()
-    regenerate_path()
+    update_path("mode")
 
 def toggle_vertical(val):
     global dolly_vertical
     dolly_vertical = val
     APP_WINDOW.append_status(f"Vertical Mode: {dolly_vertical}")
-    regenerate_path()
+    update_path("vertical")
 
 def toggle_pause(val):
     global dolly_pause
     dolly_pause = val
     APP_WINDOW.append_status(f"Pause: {dolly_pause}")
-    regenerate_path()
+    update_path("pause")
 
 def toggle_use_view_target(val):
     global use_view_target
     use_view_target = val
     APP_WINDOW.append_status(f"Use Target: {use_view_target}")
-    regenerate_path()
+    update_path("use_target")
 
-def _camera_pose_is_nonzero() -> bool:
-    """Return True iff current_camera_pos is NOT the world origin (0,0,0).
-    No age/timestamp checks. Defensive against missing/NaN values.
+def _camera_pose_is_nonzero(current_camera_pos=None) -> bool:
+    """Return True iff the camera position is NOT the world origin (0,0,0).
+    Defaults to the latest sample. No age/timestamp checks. Defensive
+    against missing/NaN values.
     """
+    if current_camera_pos is None:
+        current_camera_pos, _ = camera_pose()
     try:
         x = float(current_camera_pos.get("X", 0.0))
         y = float(current_camera_pos.get("Y", 0.0))
@@ -1323,6 +1921,7 @@ def reset_to_defaults():
     global dolly_zoom, dolly_speed, lookat_x_offset, lookat_y_offset
     global camera_offset, camera_rotation_offset, dolly_vertical, dolly_pause
     global translation_step_value, rotation_step_value, dolly_zoom_exaggeration, aperture, focal_distance, user_points_limit
+    global sampling_tolerance, sampling_max_angle
     dolly_settings["radius"] = 2.0
     dolly_settings["duration"] = 2.0
     dolly_zoom = 45.0
@@ -1330,7 +1929,7 @@ def reset_to_defaults():
     lookat_x_offset = 0.0
     lookat_y_offset = 0.0
     camera_offset = {"X": 0.0, "Y": 0.0, "Z": 0.0}
-    camera_rotation_offset = R.from_euler('XYZ', [0, 0, 0], degrees=True)
+    camera_rotation_offset = None
     dolly_vertical = False
     dolly_pause = False
     translation_step_value = 0.5
@@ -1339,6 +1938,8 @@ def reset_to_defaults():
     aperture = 15.0
     focal_distance = 2
     user_points_limit = 15
+    sampling_tolerance = 0.05
+    sampling_max_angle = 30.0
 
     radius_slider.setValue(int(dolly_settings["radius"] * 100))
     radius_entry.setText(str(dolly_settings["radius"]))
@@ -1364,8 +1965,10 @@ def reset_to_defaults():
     rotation_step_slider.setValue(int(rotation_step_value * 100))
     rotation_step_entry.setText(str(rotation_step_value))
     
-    dz_exag_slider.setValue(int(dolly_zoom_exaggeration * 100))
-    dz_exag_entry.setText(str(dolly_zoom_exaggeration))
+    if dz_exag_slider is not None:  # built with the Dolly Zoom panel
+        dz_exag_slider.setValue(int(dolly_zoom_exaggeration * 100))
+        dz_exag_entry.setText(str(dolly_zoom_exaggeration))
+        reverse_zoom_checkbox.setChecked(False)
     
     aperture_slider.setValue(int(aperture * 100))
     aperture_entry.setText(str(aperture))
@@ -1378,7 +1981,11 @@ def reset_to_defaults():
 
     vertical_toggle.setChecked(False)
     pause_toggle.setChecked(False)
-    reverse_zoom_checkbox.setChecked(False)
+    adaptive_sampling_checkbox.setChecked(False)
+    constant_speed_checkbox.setChecked(False)
+    easing_combo.setCurrentText(EASING_LINEAR)
+    sampling_tolerance_entry.setText(str(sampling_tolerance))
+    sampling_max_angle_entry.setText(str(sampling_max_angle))
     if view_target is not None:
         use_view_target_checkbox.setChecked(True)
     else:
@@ -1447,6 +2054,8 @@ class DollyControllerWindow(QMainWindow):
         self.mode_group.buttonClicked.connect(lambda btn: self.set_mode(self.mode_group.id(btn)))
         self.main_layout.addLayout(mode_frame)
 
+        startup_mark("ui: actions & modes")
+
         #
         # --- 3) Custom JSON, Move Target, and Rebase ---
         #
@@ -1460,6 +2069,7 @@ class DollyControllerWindow(QMainWindow):
         btn_rebase.clicked.connect(rebase_loaded_path)
         load_frame.addWidget(btn_rebase)
         self.main_layout.addLayout(load_frame)
+
         self.loaded_file_label = QLabel("No file loaded")
         self.main_layout.addWidget(self.loaded_file_label)
 
@@ -1467,12 +2077,24 @@ class DollyControllerWindow(QMainWindow):
         btn_play.clicked.connect(self.play)
         load_frame.addWidget(btn_play)
 
+        self.record_button = QPushButton("Record")
+        self.record_button.setCheckable(True)
+        self.record_button.toggled.connect(self.toggle_recording)
+        load_frame.addWidget(self.record_button)
+
         regen_btn = QPushButton("Regenerate Path")
         regen_btn.clicked.connect(regenerate_path)
         reset_btn = QPushButton("Reset to Defaults")
         reset_btn.clicked.connect(reset_to_defaults)
         load_frame.addWidget(regen_btn)
         load_frame.addWidget(reset_btn)
+        diag_btn = QPushButton("Diagnostics")
+        diag_btn.setCheckable(True)
+        diag_btn.toggled.connect(self.toggle_diagnostics)
+        load_frame.addWidget(diag_btn)
+        self.diagnostics_box = None  # built on first toggle
+
+        startup_mark("ui: file controls")
 
         # --- 4) Pin Buttons (arranged as 2 rows of 4) ---
 
@@ -1494,6 +2116,8 @@ class DollyControllerWindow(QMainWindow):
         self.main_layout.addLayout(pin_frame_row1)
         self.main_layout.addLayout(pin_frame_row2)
 
+        startup_mark("ui: pins")
+
         #
         # --- 5) Dolly Parameters (sliders, text entries, etc.) ---
         #
@@ -1594,37 +2218,16 @@ class DollyControllerWindow(QMainWindow):
         focal_distance_layout.addWidget(focal_distance_slider)
         self.main_layout.addLayout(focal_distance_layout)
 
-        # Arc Angle Control
-        arc_angle_layout = QHBoxLayout()
-        arc_angle_layout.addWidget(QLabel("Arc Angle:"))
-        global arc_angle_entry
-        arc_angle_entry = QLineEdit(str(arc_angle))
-        arc_angle_entry.setFixedSize(60, 25)
-        arc_angle_entry.editingFinished.connect(on_arc_angle_entry_return)
-        arc_angle_layout.addWidget(arc_angle_entry)
-        arc_angle_slider = QSlider(Qt.Orientation.Horizontal)
-        arc_angle_slider.setMinimum(5)
-        arc_angle_slider.setMaximum(180)
-        arc_angle_slider.setValue(int(arc_angle))
-        arc_angle_slider.valueChanged.connect(update_arc_angle_slider)
-        arc_angle_layout.addWidget(arc_angle_slider)
-        self.main_layout.addLayout(arc_angle_layout)
+        startup_mark("ui: parameter sliders")
 
-        # Dolly Zoom Exaggeration
-        dz_exag_layout = QHBoxLayout()
-        dz_exag_layout.addWidget(QLabel("Dolly Zoom Exaggeration:"))
-        global dz_exag_entry, dz_exag_slider
-        dz_exag_entry = QLineEdit(str(dolly_zoom_exaggeration))
-        dz_exag_entry.setFixedSize(60, 25)
-        dz_exag_entry.editingFinished.connect(on_dz_exaggeration_entry_return)
-        dz_exag_layout.addWidget(dz_exag_entry)
-        dz_exag_slider = QSlider(Qt.Orientation.Horizontal)
-        dz_exag_slider.setMinimum(100)
-        dz_exag_slider.setMaximum(500)
-        dz_exag_slider.setValue(int(dolly_zoom_exaggeration * 100))
-        dz_exag_slider.valueChanged.connect(update_dz_exaggeration_slider)
-        dz_exag_layout.addWidget(dz_exag_slider)
-        self.main_layout.addLayout(dz_exag_layout)
+        # Mode-specific panels (Arc / File / Dolly Zoom) are built the first
+        # time their mode is selected and only shown while it is active.
+        self.mode_panel_layout = QVBoxLayout()
+        self.main_layout.addLayout(self.mode_panel_layout)
+        self.mode_panels = {}
+        self.show_mode_panel(dolly_mode)
+        BUS.modeChanged.connect(self.show_mode_panel)
+        startup_mark("ui: mode panel")
 
         # Points Count
         points_layout = QHBoxLayout()
@@ -1635,13 +2238,36 @@ class DollyControllerWindow(QMainWindow):
         points_count_entry.editingFinished.connect(on_points_count_entry_return)
         points_layout.addWidget(points_count_entry)
         points_count_slider = QSlider(Qt.Orientation.Horizontal)
-        points_count_slider.setMinimum(5)
-        points_count_slider.setMaximum(50)
+        points_count_slider.setMinimum(MIN_POINTS)
+        points_count_slider.setMaximum(MAX_POINTS)
         points_count_slider.setValue(user_points_limit)
         points_count_slider.valueChanged.connect(update_points_count_slider)
         points_layout.addWidget(points_count_slider)
         self.main_layout.addLayout(points_layout)
 
+        # Adaptive Sampling
+        sampling_layout = QHBoxLayout()
+        global adaptive_sampling_checkbox, sampling_tolerance_entry, sampling_max_angle_entry, waypoint_count_label
+        adaptive_sampling_checkbox = QCheckBox("Adaptive Sampling")
+        adaptive_sampling_checkbox.setChecked(adaptive_sampling)
+        adaptive_sampling_checkbox.toggled.connect(toggle_adaptive_sampling)
+        sampling_layout.addWidget(adaptive_sampling_checkbox)
+        sampling_layout.addWidget(QLabel("Chord tol (m):"))
+        sampling_tolerance_entry = QLineEdit(str(sampling_tolerance))
+        sampling_tolerance_entry.setFixedSize(60, 25)
+        sampling_tolerance_entry.editingFinished.connect(on_sampling_entry_return)
+        sampling_layout.addWidget(sampling_tolerance_entry)
+        sampling_layout.addWidget(QLabel("Max angle (deg):"))
+        sampling_max_angle_entry = QLineEdit(str(sampling_max_angle))
+        sampling_max_angle_entry.setFixedSize(60, 25)
+        sampling_max_angle_entry.editingFinished.connect(on_sampling_entry_return)
+        sampling_layout.addWidget(sampling_max_angle_entry)
+        waypoint_count_label = QLabel()
+        sampling_layout.addWidget(waypoint_count_label)
+        self.main_layout.addLayout(sampling_layout)
+        if export_path_data is not None:
+            report_waypoint_count(len(export_path_data))
+
         # Step Controls
         step_layout = QHBoxLayout()
         translation_step_label = QLabel("Translation Step (m):")
@@ -1672,9 +2298,11 @@ class DollyControllerWindow(QMainWindow):
         step_layout.addWidget(rotation_step_slider)
         self.main_layout.addLayout(step_layout)
 
+        startup_mark("ui: sampling & steps")
+
         # Toggle Options
         toggle_layout = QHBoxLayout()
-        global vertical_toggle, pause_toggle, use_view_target_checkbox, reverse_zoom_checkbox
+        global vertical_toggle, pause_toggle, use_view_target_checkbox
         vertical_toggle = QCheckBox("Rotate 90")
         vertical_toggle.toggled.connect(toggle_vertical)
         toggle_layout.addWidget(vertical_toggle)
@@ -1691,12 +2319,29 @@ class DollyControllerWindow(QMainWindow):
         reverse_path_checkbox.toggled.connect(lambda checked: set_reverse_path(checked))
         toggle_layout.addWidget(reverse_path_checkbox)
 
-        reverse_zoom_checkbox = QCheckBox("Reverse Dolly Zoom")
-        reverse_zoom_checkbox.toggled.connect(toggle_reverse_dolly_zoom)
-        toggle_layout.addWidget(reverse_zoom_checkbox)
+        global constant_speed_checkbox
+        constant_speed_checkbox = QCheckBox("Constant Speed")
+        constant_speed_checkbox.setChecked(timing_mode == TIMING_CONSTANT_SPEED)
+        constant_speed_checkbox.toggled.connect(toggle_constant_speed)
+        toggle_layout.addWidget(constant_speed_checkbox)
 
         self.main_layout.addLayout(toggle_layout)
 
+        # Easing
+        easing_layout = QHBoxLayout()
+        easing_layout.addWidget(QLabel("Easing:"))
+        global easing_combo, easing_bezier_entry
+        easing_combo = QComboBox()
+        easing_combo.addItems(list(EASING_PROFILES))
+        easing_combo.setCurrentText(easing_profile)
+        easing_combo.currentTextChanged.connect(set_easing_profile)
+        easing_layout.addWidget(easing_combo)
+        easing_layout.addWidget(QLabel("Bezier (x1, y1, x2, y2):"))
+        easing_bezier_entry = QLineEdit(", ".join(f"{v:g}" for v in easing_bezier))
+        easing_bezier_entry.editingFinished.connect(on_easing_bezier_entry_return)
+        easing_layout.addWidget(easing_bezier_entry)
+        self.main_layout.addLayout(easing_layout)
+
         # LookAtMe Offsets
         lookat_layout = QVBoxLayout()
         lookat_layout.addWidget(QLabel("LookAtMe Offsets"))
@@ -1730,6 +2375,8 @@ class DollyControllerWindow(QMainWindow):
         lookat_layout.addLayout(lookat_y_layout)
         self.main_layout.addLayout(lookat_layout)
 
+        startup_mark("ui: toggles, easing & offsets")
+
         # Axis Controls
         axis_label = QLabel("Axis Controls")
         self.main_layout.addWidget(axis_label)
@@ -1750,16 +2397,143 @@ class DollyControllerWindow(QMainWindow):
             ax_layout.addWidget(btn_rot_minus)
             self.main_layout.addLayout(ax_layout)
 
+        startup_mark("ui: axis controls")
+
+        # Export Rate Cap
+        export_layout = QHBoxLayout()
+        export_layout.addWidget(QLabel("Max Export Rate (/s):"))
+        global export_rate_entry, export_rate_slider, export_window_entry
+        export_rate_entry = QLineEdit(str(int(EXPORT_SCHEDULER.max_rate)))
+        export_rate_entry.setFixedSize(60, 25)
+        export_rate_entry.editingFinished.connect(on_export_rate_entry_return)
+        export_layout.addWidget(export_rate_entry)
+        export_rate_slider = QSlider(Qt.Orientation.Horizontal)
+        export_rate_slider.setMinimum(1)
+        export_rate_slider.setMaximum(30)
+        export_rate_slider.setValue(int(EXPORT_SCHEDULER.max_rate))
+        export_rate_slider.valueChanged.connect(update_export_rate_slider)
+        export_layout.addWidget(export_rate_slider)
+        export_layout.addWidget(QLabel("Window (ms):"))
+        export_window_entry = QLineEdit(str(EXPORT_SCHEDULER.window_ms))
+        export_window_entry.setFixedSize(60, 25)
+        export_window_entry.editingFinished.connect(on_export_window_entry_return)
+        export_layout.addWidget(export_window_entry)
+        self.export_rate_label = QLabel()
+        export_layout.addWidget(self.export_rate_label)
+        self.main_layout.addLayout(export_layout)
+        self.export_rate_timer = QTimer(self)
+        self.export_rate_timer.setInterval(500)
+        self.export_rate_timer.timeout.connect(self.update_export_rate_label)
+        self.export_rate_timer.start()
+        self.update_export_rate_label()
+
         # --- Status Panel ---
         self.status_box = QTextEdit()
         self.status_box.setReadOnly(True)
         self.status_box.setFixedHeight(80)
         self.status_box.setPlaceholderText("Status: Listening for OSC commands")
         self.main_layout.addWidget(self.status_box)
+        startup_mark("ui: export rate & status")
+
+    def show_mode_panel(self, mode):
+        """Show the panel for `mode` (building it on first use) and hide the others."""
+        builders = {MODE_ARC: self.build_arc_panel, MODE_FILE: self.build_file_panel,
+                    MODE_DOLLY_ZOOM: self.build_dolly_zoom_panel}
+        if mode not in self.mode_panels and mode in builders:
+            panel = QWidget()
+            builders[mode](panel)
+            self.mode_panel_layout.addWidget(panel)
+            self.mode_panels[mode] = panel
+        for panel_mode, panel in self.mode_panels.items():
+            panel.setVisible(panel_mode == mode)
+
+    def build_arc_panel(self, panel):
+        arc_angle_layout = QHBoxLayout(panel)
+        arc_angle_layout.setContentsMargins(0, 0, 0, 0)
+        arc_angle_layout.addWidget(QLabel("Arc Angle:"))
+        global arc_angle_entry
+        arc_angle_entry = QLineEdit(str(arc_angle))
+        arc_angle_entry.setFixedSize(60, 25)
+        arc_angle_entry.editingFinished.connect(on_arc_angle_entry_return)
+        arc_angle_layout.addWidget(arc_angle_entry)
+        arc_angle_slider = QSlider(Qt.Orientation.Horizontal)
+        arc_angle_slider.setMinimum(5)
+        arc_angle_slider.setMaximum(180)
+        arc_angle_slider.setValue(int(arc_angle))
+        arc_angle_slider.valueChanged.connect(update_arc_angle_slider)
+        arc_angle_layout.addWidget(arc_angle_slider)
+
+    def build_file_panel(self, panel):
+        global simplify_position_entry, simplify_angle_entry
+        simplify_frame = QHBoxLayout(panel)
+        simplify_frame.setContentsMargins(0, 0, 0, 0)
+        btn_simplify = QPushButton("Simplify Custom Path")
+        btn_simplify.clicked.connect(simplify_loaded_path)
+        simplify_frame.addWidget(btn_simplify)
+        simplify_frame.addWidget(QLabel("Pos tol (m):"))
+        simplify_position_entry = QLineEdit(str(simplify_position_tolerance))
+        simplify_position_entry.setFixedSize(60, 25)
+        simplify_position_entry.editingFinished.connect(on_simplify_tolerance_entry_return)
+        simplify_frame.addWidget(simplify_position_entry)
+        simplify_frame.addWidget(QLabel("Angle tol (deg):"))
+        simplify_angle_entry = QLineEdit(str(simplify_angle_tolerance))
+        simplify_angle_entry.setFixedSize(60, 25)
+        simplify_angle_entry.editingFinished.connect(on_simplify_tolerance_entry_return)
+        simplify_frame.addWidget(simplify_angle_entry)
+
+    def build_dolly_zoom_panel(self, panel):
+        dz_exag_layout = QHBoxLayout(panel)
+        dz_exag_layout.setContentsMargins(0, 0, 0, 0)
+        dz_exag_layout.addWidget(QLabel("Dolly Zoom Exaggeration:"))
+        global dz_exag_entry, dz_exag_slider, reverse_zoom_checkbox
+        dz_exag_entry = QLineEdit(str(dolly_zoom_exaggeration))
+        dz_exag_entry.setFixedSize(60, 25)
+        dz_exag_entry.editingFinished.connect(on_dz_exaggeration_entry_return)
+        dz_exag_layout.addWidget(dz_exag_entry)
+        dz_exag_slider = QSlider(Qt.Orientation.Horizontal)
+        dz_exag_slider.setMinimum(100)
+        dz_exag_slider.setMaximum(500)
+        dz_exag_slider.setValue(int(dolly_zoom_exaggeration * 100))
+        dz_exag_slider.valueChanged.connect(update_dz_exaggeration_slider)
+        dz_exag_layout.addWidget(dz_exag_slider)
+        reverse_zoom_checkbox = QCheckBox("Reverse Dolly Zoom")
+        reverse_zoom_checkbox.setChecked(reverse_dolly_zoom)
+        reverse_zoom_checkbox.toggled.connect(toggle_reverse_dolly_zoom)
+        dz_exag_layout.addWidget(reverse_zoom_checkbox)
 
     def set_mode(self, mode):
         set_mode(mode)  # call global helper to handle init & regen
 
+    def toggle_diagnostics(self, checked):
+        """Show the stage timing / cache panel; timers only run while it is visible."""
+        if self.diagnostics_box is None:
+            self.diagnostics_box = QTextEdit()
+            self.diagnostics_box.setReadOnly(True)
+            font = QFont("Consolas")
+            font.setStyleHint(QFont.StyleHint.Monospace)
+            self.diagnostics_box.setFont(font)
+            self.diagnostics_box.setFixedHeight(240)
+            self.main_layout.insertWidget(self.main_layout.indexOf(self.status_box), self.diagnostics_box)
+            self.diagnostics_timer = QTimer(self)
+            self.diagnostics_timer.setInterval(500)
+            self.diagnostics_timer.timeout.connect(self.update_diagnostics)
+        toggle_stage_timing(checked)
+        self.diagnostics_box.setVisible(checked)
+        if checked:
+            self.update_diagnostics()
+            self.diagnostics_timer.start()
+        else:
+            self.diagnostics_timer.stop()
+
+    def update_diagnostics(self):
+        self.diagnostics_box.setPlainText("\n".join(diagnostics_lines()))
+
+    def update_export_rate_label(self):
+        sched = EXPORT_SCHEDULER
+        self.export_rate_label.setText(
+            f"Effective: {sched.effective_rate():.1f}/s "
+            f"({sched.exported}/{sched.requested} requests exported)")
+
     def append_status(self, msg):
         ts = time.strftime("%H:%M:%S")
         try:
@@ -1775,17 +2549,46 @@ class DollyControllerWindow(QMainWindow):
         try:
             with open(fname, "r", encoding="utf-8") as f:
                 data = json.load(f)
-            loaded_path_data_original = data
+            loaded_path_data_original = WaypointArray.from_dicts(data)
             self.loaded_file_label.setText(f"Loaded file: {os.path.basename(fname)}")
             APP_WINDOW.append_status(f"Custom JSON loaded from {fname}, {len(data)} waypoints.")
-            regenerate_path()
+            update_path("loaded_path")
         except Exception as e:
             self.loaded_file_label.setText("Failed to load file!")
             APP_WINDOW.append_status(f"Error loading custom JSON: {e}")
 
+    def toggle_recording(self, checked):
+        global loaded_path_data_original
+        if checked:
+            try:
+                raw_path = start_recording()
+            except Exception as e:
+                APP_WINDOW.append_status(f"Could not start recording: {e}")
+                return
+            self.record_button.setText("Stop Recording")
+            APP_WINDOW.append_status(f"Recording camera poses to {raw_path}")
+            return
+
+        self.record_button.setText("Record")
+        if POSE_RECORDER is None:
+            return
+        try:
+            path, json_path, recorder = stop_recording()
+        except Exception as e:
+            APP_WINDOW.append_status(f"Recording failed: {e}")
+            return
+        loaded_path_data_original = path
+        self.loaded_file_label.setText(f"Loaded file: {os.path.basename(json_path)}")
+        APP_WINDOW.append_status(
+            f"Recorded {len(path)} waypoints ({path.duration.sum():.1f} s, "
+            f"{recorder.dropped} samples dropped) to {json_path}")
+        self.mode_buttons[MODE_FILE].setChecked(True)
+        set_mode(MODE_FILE)
+
     def set_target_from_camera(self):
-        # Use the latest cached camera position as the view target
+        # Use the recent averaged camera position as the view target
         global view_target, use_view_target
+        current_camera_pos, current_camera_rot = camera_pose(POSE_AVERAGE_WINDOW)
         view_target = {
             "X": current_camera_pos["X"],
             "Y": current_camera_pos["Y"],
@@ -1793,7 +2596,7 @@ class DollyControllerWindow(QMainWindow):
         }
         use_view_target = True
 
-        if not _camera_pose_is_nonzero():
+        if not _camera_pose_is_nonzero(current_camera_pos):
             soft_beep()
             APP_WINDOW.append_status("Ignored SetTargetFromCam: camera at origin (0,0,0).")
             return
@@ -1803,23 +2606,24 @@ class DollyControllerWindow(QMainWindow):
         # if you have a checkbox bound: use_view_target_checkbox.setChecked(True)
 
         APP_WINDOW.append_status(f"Target set from camera: {view_target}")
-        regenerate_path()
+        update_path("target")
 
     def set_path_from_camera(self):
-        # Use the latest cached camera position as the path origin/center
+        # Use the recent averaged camera position as the path origin/center
         global start_position, exported_center
+        current_camera_pos, _ = camera_pose(POSE_AVERAGE_WINDOW)
         start_position["X"] = current_camera_pos["X"]
         start_position["Y"] = current_camera_pos["Y"]
         start_position["Z"] = current_camera_pos["Z"]
         exported_center = dict(start_position)  # if your circle/arc uses this center
 
-        if not _camera_pose_is_nonzero():
+        if not _camera_pose_is_nonzero(current_camera_pos):
             soft_beep()
             APP_WINDOW.append_status("Ignored SetTargetFromCam: camera at origin (0,0,0).")
             return
 
         APP_WINDOW.append_status(f"Path origin set from camera: {start_position}")
-        regenerate_path()
+        update_path("center")
 
     def play(self):
         # --- Countdown Dialog ---
@@ -1877,7 +2681,9 @@ class DollyControllerWindow(QMainWindow):
 
         performance_dialog.setLayout(perf_layout)
 
-        # Set up the media player.
+        # Set up the media player. QtMultimedia is only needed here, so it is
+        # imported on first playback rather than at startup.
+        from PyQt6.QtMultimedia import QMediaPlayer, QAudioOutput
         player = QMediaPlayer()
         audio_output = QAudioOutput()
         audio_output.setVolume(1.0)  # Maximum volume.
@@ -1913,8 +2719,38 @@ class DollyControllerWindow(QMainWindow):
 
         # Show the modal popup instructing the user.
 
-def setup_ui_and_run():
-    app = QApplication(sys.argv)
+def app_icon():
+    """The embedded window icon, decoded from ICON_BASE64."""
+    pixmap = QPixmap()
+    pixmap.loadFromData(base64.b64decode(ICON_BASE64), "ICO")
+    return QIcon(pixmap)
+
+def startup_report():
+    """Startup phases as text lines: milliseconds per phase and running total."""
+    lines = [f"{'Startup phase':<32}{'ms':>9}{'total':>10}"]
+    total = 0.0
+    for label, seconds in STARTUP_TIMES:
+        total += seconds
+        lines.append(f"{label:<32}{seconds * 1000:>9.1f}{total * 1000:>10.1f}")
+    return lines
+
+def finish_startup(profile_startup=False):
+    """Startup work deferred until the window is on screen."""
+    startup_mark("window shown")
+    QApplication.instance().setWindowIcon(app_icon())
+    startup_mark("window icon")
+    regenerate_path()
+    EXPORT_SCHEDULER.flush()
+    startup_mark("first path (loads scipy)")
+    if profile_startup:
+        report = startup_report()
+        print("\n".join(report))
+        APP_WINDOW.append_status(
+            f"Startup took {sum(t for _, t in STARTUP_TIMES) * 1000:.0f} ms "
+            f"(--profile-startup breakdown printed to the console)")
+
+def setup_ui_and_run(argv=None, profile_startup=False):
+    app = QApplication(sys.argv if argv is None else argv)
     app.setStyleSheet("""
     QMainWindow {
         background-color: #1e1e1e;
@@ -1973,24 +2809,150 @@ def setup_ui_and_run():
         height: 18px;
     }
     """)
-    # Set the embedded icon as the app's window icon.
-    pixmap = QPixmap()
-    pixmap.loadFromData(base64.b64decode(ICON_BASE64), "ICO")
-    app.setWindowIcon(QIcon(pixmap))
-    global APP_WINDOW
+    startup_mark("QApplication & style")
+    global APP_WINDOW, EXPORT_SCHEDULER
+    EXPORT_SCHEDULER = ExportScheduler(send_dolly_path)
     APP_WINDOW = DollyControllerWindow()
+    BUS.exportFinished.connect(on_export_finished)
+    EXPORT_WORKER.start()
     window = APP_WINDOW
     BUS.setTargetFromCam.connect(window.set_target_from_camera)
     BUS.setPathFromCam.connect(window.set_path_from_camera)  
     BUS.nudgeTranslate.connect(lambda axis, d: adjust_position(axis, d))
-    BUS.nudgeRotate.connect(   lambda axis, d: rotate_path(axis, d))      
+    BUS.nudgeRotate.connect(   lambda axis, d: rotate_path(axis, d))
+    BUS.setDollyMode.connect(set_mode_from_osc)      
     window.show()
+    # The icon decode and the first path generation run once the event loop
+    # has put the window on screen.
+    QTimer.singleShot(0, lambda: finish_startup(profile_startup))
     sys.exit(app.exec())
 
+# --------------------------
+# Metrics Endpoint
+# --------------------------
+POSE_RATE_WINDOW = 1.0  # seconds of pose history behind dolly_pose_rate_hz
+
+def _format_labels(labels):
+    if not labels:
+        return ""
+    def escape(value):
+        return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+    return "{" + ",".join(f'{k}="{escape(v)}"' for k, v in labels.items()) + "}"
+
+def metrics_text():
+    """
+    Render the controller's counters in the Prometheus text format.
+
+    Only reads: every counter has a single writer (OSC thread, export
+    worker or GUI thread) and is read here without locks. Histograms are
+    copied under their own short lock so each one is internally consistent;
+    the OSC thread never takes it.
+    """
+    lines = []
+
+    def metric(name, kind, help_text, samples):
+        lines.append(f"# HELP {name} {help_text}")
+        lines.append(f"# TYPE {name} {kind}")
+        for suffix, labels, value in samples:
+            lines.append(f"{name}{suffix}{_format_labels(labels)} {value}")
+
+    def histogram(name, help_text, hist):
+        cumulative, total, count = hist.snapshot()
+        samples = [("_bucket", {"le": "+Inf" if bound == float("inf") else f"{bound:g}"}, n)
+                   for bound, n in cumulative]
+        samples += [("_sum", None, total), ("_count", None, count)]
+        metric(name, "histogram", help_text, samples)
+
+    receiver = OSC_RECEIVER
+    if receiver is not None:
+        counts = {}
+        for address, n in receiver.address_packets.copy().items():
+            label = address.decode("ascii", "replace")
+            counts[label] = counts.get(label, 0) + n
+        # Pose packets that missed the fast path are already in address_packets.
+        counts["/usercamera/Pose"] = counts.get("/usercamera/Pose", 0) + receiver.pose_packets
+        per_address = [("", {"address": label}, n) for label, n in counts.items()]
+        metric("dolly_osc_packets_total", "counter", "OSC packets received, by address.", per_address)
+
+    rate = POSE_BUFFER.rate(POSE_RATE_WINDOW)
+    metric("dolly_pose_rate_hz", "gauge",
+           f"Camera pose updates per second over the last {POSE_RATE_WINDOW:g} s.", [("", None, rate)])
+    pose_time = POSE_STORE.last_timestamp
+    if pose_time:
+        metric("dolly_last_pose_timestamp_seconds", "gauge",
+               "Unix time of the newest camera pose.", [("", None, pose_time)])
+        metric("dolly_pose_age_seconds", "gauge",
+               "Seconds since the newest camera pose.", [("", None, max(0.0, time.time() - pose_time))])
+
+    if EXPORT_SCHEDULER is not None:
+        metric("dolly_export_requests_total", "counter",
+               "Path exports requested (before coalescing).", [("", None, EXPORT_SCHEDULER.requested)])
+    worker = EXPORT_WORKER
+    metric("dolly_exports_sent_total", "counter",
+           "Paths written and sent to VRChat with /dolly/Import.", [("", None, worker.sent)])
+    metric("dolly_exports_deduplicated_total", "counter",
+           "Exports skipped because the payload matched the last import.", [("", None, worker.deduplicated)])
+    metric("dolly_export_errors_total", "counter",
+           "Exports that failed to write or send.", [("", None, worker.errors)])
+    histogram("dolly_export_latency_seconds",
+              "Serialize + write + send time of sent exports.", worker.latency)
+    histogram("dolly_export_payload_bytes", "Size of sent path JSON payloads.", worker.payload_sizes)
+    return "\n".join(lines) + "\n"
+
+def start_metrics_server(port):
+    """Serve metrics_text() at http://127.0.0.1:<port>/metrics from a daemon thread."""
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    class MetricsHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path.split("?", 1)[0] not in ("/", "/metrics"):
+                self.send_error(404)
+                return
+            body = metrics_text().encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass  # keep scrapes out of the console
+
+    server = ThreadingHTTPServer(("127.0.0.1", port), MetricsHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, name="DollyMetrics", daemon=True).start()
+    print(f"Serving metrics on http://127.0.0.1:{server.server_address[1]}/metrics")
+    return server
+
 # --------------------------
 # Main Entry Point
 # --------------------------
+startup_mark("module setup")
+
+def parse_args(argv=None):
+    """Command-line options; anything unrecognised is left for Qt."""
+    parser = argparse.ArgumentParser(description="VRChat Dolly Controller")
+    parser.add_argument("--profile-startup", action="store_true",
+                        help="print a per-import / per-UI-section startup time breakdown")
+    parser.add_argument("--metrics-port", type=int, default=None, metavar="PORT",
+                        help="serve Prometheus metrics on 127.0.0.1:PORT/metrics")
+    parser.add_argument("--path-cache-entries", type=int, default=PATH_CACHE_MAX_ENTRIES, metavar="N",
+                        help=f"built paths kept for instant recall (default {PATH_CACHE_MAX_ENTRIES}, 0 disables)")
+    parser.add_argument("--path-cache-mb", type=float, default=PATH_CACHE_MAX_BYTES / (1024 * 1024),
+                        metavar="MB", help="memory budget of the path cache in MiB "
+                        f"(default {PATH_CACHE_MAX_BYTES // (1024 * 1024)})")
+    return parser.parse_known_args(argv)
+
 if __name__ == "__main__":
+    args, qt_args = parse_args()
+    PATH_CACHE.set_limits(args.path_cache_entries, args.path_cache_mb * 1024 * 1024)
     start_osc_server_thread()
-    regenerate_path()
-    setup_ui_and_run()
\ No newline at end of file
+    startup_mark("OSC server thread")
+    if args.metrics_port is not None:
+        try:
+            start_metrics_server(args.metrics_port)
+        except OSError as e:
+            # Metrics are optional; a busy port must not keep the controller from starting.
+            print(f"metrics server disabled: {e}")
+        startup_mark("metrics server")
+    setup_ui_and_run([sys.argv[0]] + qt_args, profile_startup=args.profile_startup)
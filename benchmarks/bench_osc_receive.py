@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+# bench_osc_receive.py
+# -*- coding: utf-8 -*-
+"""
+OSC receive-loop benchmark against a local UDP flood generator.
+
+A separate process floods the receiver with /usercamera/Pose packets (the
+stream VRChat sends continuously) and interleaves one avatar-menu parameter
+packet every --menu-every packets. Reports the received packets/second
+ceiling, loss, receiver CPU time per packet and the send->handler latency of
+the menu packets, i.e. how responsive the avatar-menu handlers stay under
+the pose flood. An unpaced flood measures the ceiling (latency there is
+dominated by the kernel receive queue); --rate measures a paced stream.
+
+Run from the repo root:
+    python benchmarks/bench_osc_receive.py [--seconds 5] [--compare-threading]
+"""
+import argparse
+import multiprocessing
+import os
+import socket
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from pythonosc.dispatcher import Dispatcher  # noqa: E402
+from pythonosc.osc_message_builder import OscMessageBuilder  # noqa: E402
+import dolly_core as dc  # noqa: E402
+
+MENU_ADDRESS = "/avatar/parameters/SetDolly_T+X"
+
+
+def build_packet(address, *args):
+    builder = OscMessageBuilder(address)
+    for arg in args:
+        builder.add_arg(arg)
+    return builder.build().dgram
+
+
+def flood(port, seconds, menu_every, menu_times, rate=0.0):
+    """Flood generator (child process): send for `seconds`, unpaced or at `rate` packets/s."""
+    sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    target = ("127.0.0.1", port)
+    pose = build_packet("/usercamera/Pose", 1.0, 2.0, 3.0, 10.0, 20.0, 30.0)
+    sent = 0
+    menu_seq = 0
+    start = time.perf_counter()
+    deadline = start + seconds
+    while time.perf_counter() < deadline:
+        if rate > 0:
+            # Pace in bursts of `menu_every` packets.
+            ahead = start + sent / rate - time.perf_counter()
+            if ahead > 0:
+                time.sleep(ahead)
+        for _ in range(menu_every - 1):
+            sock.sendto(pose, target)
+        menu_seq += 1
+        # The float argument carries the sequence number back to the handler.
+        sock.sendto(build_packet(MENU_ADDRESS, float(menu_seq)), target)
+        menu_times[menu_seq % len(menu_times)] = time.perf_counter()
+        sent += menu_every
+    sock.close()
+    return sent
+
+
+def _flood_entry(port, seconds, menu_every, menu_times, rate, result):
+    result.value = flood(port, seconds, menu_every, menu_times, rate)
+
+
+def run(mode, seconds, menu_every, rate):
+    latencies = []
+    menu_times = multiprocessing.Array("d", 4096, lock=False)
+
+    def on_menu(address, *args):
+        seq = int(args[0]) if args else 0
+        sent_at = menu_times[seq % len(menu_times)]
+        if sent_at:
+            latencies.append(time.perf_counter() - sent_at)
+
+    # The same pose sink DollyControl wires into its receiver.
+    poses = dc.PoseStore(dc.PoseRingBuffer())
+    disp = Dispatcher()
+    if mode == "single":
+        disp.map("/usercamera/Pose", poses.on_osc)
+        disp.map(MENU_ADDRESS, on_menu)
+
+    received = [0]
+    if mode == "single":
+        server = dc.OscReceiver(disp, "127.0.0.1", 0, pose_handler=poses.store)
+        port = server.address[1]
+        serve, stop = server.serve_forever, server.close
+
+        def count():
+            return server.packets
+    else:
+        from pythonosc import osc_server
+
+        def pose_counted(address, *args):
+            received[0] += 1
+            poses.on_osc(address, *args)
+
+        def menu_counted(address, *args):
+            received[0] += 1
+            on_menu(address, *args)
+
+        disp.map("/usercamera/Pose", pose_counted)
+        disp.map(MENU_ADDRESS, menu_counted)
+        server = osc_server.ThreadingOSCUDPServer(("127.0.0.1", 0), disp)
+        port = server.server_address[1]
+        serve, stop = server.serve_forever, server.shutdown
+
+        def count():
+            return received[0]
+
+    thread = threading.Thread(target=serve, daemon=True)
+    thread.start()
+    result = multiprocessing.Value("q", 0)
+    cpu0 = time.process_time()
+    wall0 = time.perf_counter()
+    proc = multiprocessing.Process(target=_flood_entry, args=(port, seconds, menu_every, menu_times, rate, result))
+    proc.start()
+    proc.join()
+    time.sleep(0.2)  # drain
+    wall = time.perf_counter() - wall0
+    cpu = time.process_time() - cpu0
+    got = count()
+    stop()
+
+    sent = result.value
+    mode = f"{mode} @ {rate:,.0f}/s" if rate > 0 else f"{mode} @ unpaced"
+    print(f"[{mode}] sent {sent:,}  received {got:,}  loss {100.0 * (1 - got / max(1, sent)):.1f}%")
+    print(f"[{mode}] throughput {got / wall:,.0f} packets/s  receiver CPU {1e6 * cpu / max(1, got):.2f} us/packet")
+    if latencies:
+        latencies.sort()
+        p50 = latencies[len(latencies) // 2] * 1e3
+        p99 = latencies[int(len(latencies) * 0.99)] * 1e3
+        print(f"[{mode}] menu handler latency p50 {p50:.2f} ms  p99 {p99:.2f} ms  ({len(latencies)} menu packets)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--seconds", type=float, default=5.0, help="flood duration")
+    parser.add_argument("--menu-every", type=int, default=200, help="send one avatar-menu packet every N packets")
+    parser.add_argument("--rate", type=float, action="append",
+                        help="paced send rate in packets/s (repeatable); default: unpaced flood, then 1000/s")
+    parser.add_argument("--compare-threading", action="store_true",
+                        help="also measure python-osc's ThreadingOSCUDPServer")
+    args = parser.parse_args()
+    rates = args.rate or [0.0, 1000.0]
+    modes = ["single", "threading"] if args.compare_threading else ["single"]
+    for mode in modes:
+        for rate in rates:
+            run(mode, args.seconds, args.menu_every, rate)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+# bench_serializer.py
+# -*- coding: utf-8 -*-
+"""
+Dolly waypoint JSON serializer benchmark.
+
+Times WaypointEncoder.encode against json.dumps over the equivalent waypoint
+dicts (the previous export path) for 10, 100, 1,000 and 10,000 waypoints, and
+checks that both outputs decode to the same path within the encoder's fixed
+precision.
+
+Run from the repo root:
+    python benchmarks/bench_serializer.py [--repeat N]
+"""
+import argparse
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import dolly_core as dc  # noqa: E402
+
+SIZES = (10, 100, 1000, 10000)
+
+
+def make_path(n):
+    center = {"X": 12.345, "Y": 1.5, "Z": -7.25}
+    return dc.generate_shape_path(dc.ShapeParams(dc.MODE_CIRCLE, center, 3.0, n, 10.0))
+
+
+def best_of(func, repeat, number):
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        for _ in range(number):
+            func()
+        best = min(best, (time.perf_counter() - t0) / number)
+    return best
+
+
+def check_equivalent(a, b):
+    for wa, wb in zip(json.loads(a), json.loads(b)):
+        for key, va in wa.items():
+            vb = wb[key]
+            if isinstance(va, dict):
+                if any(abs(va[k] - vb[k]) > 0.0051 for k in va):
+                    return False
+            elif isinstance(va, bool) or isinstance(vb, bool):
+                if va != vb:
+                    return False
+            elif abs(va - vb) > 0.00051:
+                return False
+    return True
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeat", type=int, default=5, help="timing repeats per size (best is kept)")
+    args = parser.parse_args()
+
+    encoder = dc.WaypointEncoder()
+    print(f"{'waypoints':>10} {'json.dumps':>12} {'encoder':>12} {'speedup':>8} {'bytes':>10}  match")
+    for n in SIZES:
+        path = make_path(n)
+        number = max(1, 2000 // n)
+        t_json = best_of(lambda: json.dumps(path.to_dicts()), args.repeat, number)
+        t_enc = best_of(lambda: encoder.encode(path), args.repeat, number)
+        fast = encoder.encode(path)
+        match = check_equivalent(fast, json.dumps(path.to_dicts()))
+        print(f"{n:>10} {t_json * 1e3:>10.3f}ms {t_enc * 1e3:>10.3f}ms {t_json / t_enc:>7.1f}x {len(fast):>10}  {match}")
+
+
+if __name__ == "__main__":
+    main()
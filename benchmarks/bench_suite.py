@@ -0,0 +1,300 @@
+#!/usr/bin/env python3
+# bench_suite.py
+# -*- coding: utf-8 -*-
+"""
+Headless benchmark suite for the dolly path pipeline.
+
+DollyControl is imported without a UI: its Windows shell-folder lookups
+resolve to a temporary directory and its OSC client is replaced by a null
+sink, so exports really serialize, hash and write files but send nothing.
+  - gen/<mode>      the app's generate_*_path function for each mode
+                    (Circle, Line and Ellipse over 5 to 10,000 points; Arc
+                    and Dolly Zoom at the point count they derive themselves;
+                    File mode over 100 to 100,000 waypoints)
+  - transform/*     build_transformed_path, the offset stage of regenerate_path
+  - look_at/*, vertical/*
+                    the orientation stages run by send_dolly_path
+  - serialize/*     WaypointEncoder JSON serialization
+  - export/*        ExportWorker.export: serialize, hash, atomic temp-file
+                    write and /dolly/Import
+  - regenerate/*    refresh_path rebuilding every product: state hashing,
+                    geometry, offsets and the memoized export stages
+  - send/*          regenerate_path end to end, including the export
+Stage cases run on generated circles (".../circle") and on File-mode
+recordings (".../file"), both with a view target set.
+
+Results are written as JSON. With a baseline present (see --baseline) every
+case is compared against it, and the run fails (exit code 1) when any case
+is more than --threshold slower. Baselines are machine-specific; record one
+with --update-baseline before making changes.
+
+Run from the repo root:
+    python benchmarks/bench_suite.py [--quick] [--threshold 0.25]
+    python benchmarks/bench_suite.py --update-baseline
+"""
+import argparse
+import contextlib
+import ctypes
+import io
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+import types
+import warnings
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import dolly_core as dc  # noqa: E402
+
+POINT_COUNTS = (5, 100, 1000, 10000)
+FILE_SIZES = (100, 1000, 10000, 100000)
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_OUTPUT = os.path.join(BENCH_DIR, "bench_results.json")
+DEFAULT_BASELINE = os.path.join(BENCH_DIR, "baseline.json")
+
+CENTER = {"X": 12.345, "Y": 1.5, "Z": -7.25}
+TARGET = {"X": 14.0, "Y": 1.2, "Z": -5.0}
+CAMERA = dc.CameraSettings()
+
+
+class NullOscClient:
+    """Stands in for SimpleUDPClient: counts messages instead of sending them."""
+
+    def __init__(self):
+        self.sent = 0
+
+    def send_message(self, address, value):
+        self.sent += 1
+
+
+def recorded_path(n):
+    """Deterministic stand-in for a Record-mode take: a wandering handheld move at 90 Hz."""
+    rng = np.random.default_rng(n)
+    steps = rng.normal(0.0, 0.01, (n, 3)).cumsum(axis=0)
+    rows = np.empty((n, 7))
+    rows[:, 0] = np.arange(n) / 90.0
+    rows[:, 1:4] = steps + (CENTER["X"], CENTER["Y"], CENTER["Z"])
+    rows[:, 4:7] = rng.normal(0.0, 0.5, (n, 3)).cumsum(axis=0)
+    return dc.path_from_pose_samples(rows, CAMERA)
+
+
+def import_app(directory):
+    """
+    Import DollyControl headless. The Documents/Desktop lookups it runs at
+    import time resolve to `directory` (ctypes.windll is swapped only for the
+    import), and the OSC client becomes a null sink.
+    """
+    class Shell32:
+        def SHGetFolderPathW(self, hwnd, csidl, token, flags, buf):
+            buf.value = directory
+
+    saved = getattr(ctypes, "windll", None)
+    ctypes.windll = types.SimpleNamespace(shell32=Shell32())
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            import DollyControl as app
+    finally:
+        if saved is None:
+            del ctypes.windll
+        else:
+            ctypes.windll = saved
+    app.client = NullOscClient()
+    app.initial_import = False
+    return app
+
+
+def configure(app, mode, n, recording=None):
+    """Put the app in `mode` with a target, offsets and `n` points (or `recording` loaded)."""
+    app.dolly_mode = mode
+    app.start_position = dict(CENTER)
+    app.exported_center = dict(CENTER)
+    app.view_target = dict(TARGET)
+    app.use_view_target = True
+    app.user_points_limit = n
+    app.dolly_settings.update(radius=3.0, duration=10.0)
+    app.camera_offset = {"X": 0.5, "Y": 0.0, "Z": -0.25}
+    app.camera_rotation_offset = app.rotation_from_euler("XYZ", [5.0, 30.0, 0.0])
+    if recording is not None:
+        app.loaded_path_data_original = recording
+    if mode == dc.MODE_DOLLY_ZOOM:
+        app.ensure_dolly_zoom_init()  # as selecting the mode in the UI does
+
+
+def app_cases(app, kind, mode, n, recording=None):
+    """Cases that run DollyControl's own functions; yields (case, setup, callable)."""
+    def setup():
+        configure(app, mode, n, recording)
+
+    setup()
+    base = app.build_geometry()
+    target = (TARGET["X"], TARGET["Y"], TARGET["Z"])
+    encoder = dc.WaypointEncoder()
+
+    def regenerate():
+        app.PATH_CACHE.clear()
+        app.invalidate_products(app.PRODUCT_GEOMETRY)
+        app.refresh_path()
+
+    def send():
+        app.PATH_CACHE.clear()
+        app.EXPORT_WORKER = app.ExportWorker()  # fresh worker: the dedupe never skips the write
+        app.regenerate_path()
+
+    if recording is not None:
+        yield "gen/file", setup, app.generate_loaded_path
+    yield f"transform/{kind}", setup, lambda: app.build_transformed_path(base)
+    yield f"look_at/{kind}", setup, lambda: dc.stage_look_at(base, target, 1 if recording is not None else None)
+    yield f"vertical/{kind}", setup, lambda: dc.stage_vertical(base)
+    yield f"serialize/{kind}", setup, lambda: encoder.encode(base)
+    yield f"export/{kind}", setup, lambda: app.ExportWorker().export(base)
+    yield f"regenerate/{kind}", setup, regenerate
+    yield f"send/{kind}", setup, send
+
+
+def gen_cases(app, point_counts):
+    """Generator cases through the app's generate_*_path functions; yields (case, size, setup, callable)."""
+    def setup_for(mode, n):
+        return lambda: configure(app, mode, n)
+
+    for case, mode, func in (("gen/circle", dc.MODE_CIRCLE, app.generate_circle_path),
+                             ("gen/line", dc.MODE_LINE, app.generate_line_path),
+                             ("gen/ellipse", dc.MODE_ELLIPSE, app.generate_elliptical_path)):
+        for n in point_counts:
+            yield case, n, setup_for(mode, n), func
+
+    # Arc derives its point count from the arc span and Dolly Zoom uses a fixed
+    # count, so each runs at a single size: the length of the path it builds.
+    camera_pos = dict(CENTER, X=CENTER["X"] + 3.0)
+
+    def arc():
+        return app.generate_arc_path(float(app.arc_angle), float(app.dolly_settings["radius"]),
+                                     camera_pos=camera_pos)
+
+    for case, mode, func in (("gen/arc", dc.MODE_ARC, arc),
+                             ("gen/dolly_zoom", dc.MODE_DOLLY_ZOOM, app.generate_dolly_zoom_path)):
+        setup = setup_for(mode, point_counts[0])
+        setup()
+        yield case, len(func()), setup, func
+
+
+def build_cases(app, point_counts, file_sizes):
+    """Yield (case, size, setup, callable) for every benchmark; `setup` runs before timing."""
+    yield from gen_cases(app, point_counts)
+    for n in point_counts:
+        for case, setup, func in app_cases(app, "circle", dc.MODE_CIRCLE, n):
+            yield case, n, setup, func
+    for n in file_sizes:
+        for case, setup, func in app_cases(app, "file", dc.MODE_FILE, n, recorded_path(n)):
+            yield case, n, setup, func
+
+
+def measure(func, repeat, min_time):
+    """Per-call seconds: (best, median) over `repeat` runs of an auto-sized loop."""
+    func()  # warm caches and lazy imports
+    number = 1
+    while True:
+        t0 = time.perf_counter()
+        for _ in range(number):
+            func()
+        elapsed = time.perf_counter() - t0
+        if elapsed >= min_time or number >= 1 << 20:
+            break
+        number *= 2
+    times = [elapsed / number]
+    for _ in range(repeat - 1):
+        t0 = time.perf_counter()
+        for _ in range(number):
+            func()
+        times.append((time.perf_counter() - t0) / number)
+    return min(times), float(np.median(times))
+
+
+def run_suite(point_counts, file_sizes, repeat, min_time):
+    results = {}
+    with tempfile.TemporaryDirectory() as directory, open(os.devnull, "w") as devnull:
+        app = import_app(directory)
+        for case, n, setup, func in build_cases(app, point_counts, file_sizes):
+            if setup is not None:
+                setup()
+            # The app prints a line per export; keep it out of the report.
+            with contextlib.redirect_stdout(devnull):
+                best, median = measure(func, repeat, min_time)
+            results.setdefault(case, {})[str(n)] = {"best_s": best, "median_s": median}
+            print(f"{case:<20} {n:>8} {best * 1e3:>11.4f}ms {median * 1e3:>11.4f}ms", flush=True)
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "platform": platform.platform(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        },
+        "results": results,
+    }
+
+
+def compare(current, baseline, threshold):
+    """Print per-case ratios against `baseline`; returns the regressed (case, size) pairs."""
+    regressions = []
+    print(f"\n{'case':<20} {'size':>8} {'baseline':>12} {'current':>12} {'ratio':>7}")
+    for case, sizes in current["results"].items():
+        for n, stats in sizes.items():
+            old = baseline["results"].get(case, {}).get(n)
+            if old is None:
+                continue
+            ratio = stats["best_s"] / max(old["best_s"], 1e-12)
+            flag = ""
+            if ratio > 1.0 + threshold:
+                regressions.append((case, n))
+                flag = "  REGRESSION"
+            print(f"{case:<20} {n:>8} {old['best_s'] * 1e3:>10.4f}ms {stats['best_s'] * 1e3:>10.4f}ms "
+                  f"{ratio:>6.2f}x{flag}")
+    return regressions
+
+
+def main():
+    # Random File-mode rotations occasionally hit pitch +-90 in the vertical stage.
+    warnings.filterwarnings("ignore", message="Gimbal lock detected")
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--output", default=DEFAULT_OUTPUT, help="where to write this run's results")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="baseline results to compare against")
+    parser.add_argument("--update-baseline", action="store_true", help="store this run as the baseline")
+    parser.add_argument("--threshold", type=float, default=0.25,
+                        help="allowed slowdown before a case counts as a regression (0.25 = 25%%)")
+    parser.add_argument("--repeat", type=int, default=5, help="timing repeats per case (best is compared)")
+    parser.add_argument("--min-time", type=float, default=0.05, help="seconds per timing repeat")
+    parser.add_argument("--quick", action="store_true", help="skip the largest point count and file size")
+    args = parser.parse_args()
+
+    point_counts, file_sizes = POINT_COUNTS, FILE_SIZES
+    if args.quick:
+        point_counts, file_sizes = point_counts[:-1], file_sizes[:-1]
+
+    print(f"{'case':<20} {'size':>8} {'best':>13} {'median':>13}")
+    current = run_suite(point_counts, file_sizes, max(1, args.repeat), args.min_time)
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(current, f, indent=2)
+    print(f"\nResults written to {args.output}")
+
+    if args.update_baseline:
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(current, f, indent=2)
+        print(f"Baseline updated: {args.baseline}")
+        return
+    if not os.path.exists(args.baseline):
+        print(f"No baseline at {args.baseline}; run with --update-baseline to record one.")
+        return
+    with open(args.baseline, "r", encoding="utf-8") as f:
+        baseline = json.load(f)
+    regressions = compare(current, baseline, args.threshold)
+    if regressions:
+        print(f"\n{len(regressions)} case(s) slower than baseline by more than {args.threshold:.0%}")
+        sys.exit(1)
+    print(f"\nNo regressions beyond {args.threshold:.0%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+# dolly_core/__init__.py
+# -*- coding: utf-8 -*-
+"""
+Headless dolly path core: generation, transforms, timing and serialization.
+
+Depends only on NumPy (scipy is imported on first use by the orientation and
+transform helpers); no Qt, filesystem or Windows APIs. The only network code
+is the OSC receive loop in `osc`, which binds nothing until constructed.
+DollyControl is a thin GUI client on top of it, and scripts can use it
+directly:
+
+    from dolly_core import ShapeParams, MODE_CIRCLE, generate_shape_path, WaypointEncoder
+    path = generate_shape_path(ShapeParams(MODE_CIRCLE, radius=3.0, n_points=60, duration=10.0))
+    payload = WaypointEncoder().encode(path)
+"""
+from .params import (MIN_POINTS, MAX_POINTS, MODE_CIRCLE, MODE_ARC, MODE_LINE, MODE_ELLIPSE,
+                     MODE_FILE, MODE_DOLLY_ZOOM, CLOSED_SHAPES, PAUSE_DURATION_DEFAULT,
+                     TIMING_GENERATOR, TIMING_CONSTANT_SPEED, EASING_LINEAR, EASING_CUSTOM,
+                     EASING_PROFILES, CameraSettings, ShapeParams)
+from .waypoints import WaypointArray, waypoints_from_arrays
+from .serialize import WaypointEncoder
+from .orientation import (compute_look_at_unity_batch, compute_look_at_unity,
+                          apply_vertical_roll_batch)
+from .geometry import (generate_shape_path, uniform_shape_parameters, unit_shape,
+                       unit_shape_template, shape_positions, adaptive_shape_parameters,
+                       arc_start_deg, dolly_zoom_path)
+from .transform import offset_transform, apply_transform_batch, transform_path
+from .timing import (ArcLengthTable, elapsed_to_durations, easing_curve, eased_elapsed,
+                     easing_elapsed_table, add_pause_at_end, add_pause_pair_at_end)
+from .simplify import simplify_path
+from .pose import PoseRingBuffer, path_from_pose_samples
+from .osc import PoseStore, OscReceiver
+from .pipeline import (stage_reverse, stage_look_at, stage_vertical, stage_fields, stage_timing,
+                       stage_pause)
+
+__all__ = [
+    "MIN_POINTS", "MAX_POINTS", "MODE_CIRCLE", "MODE_ARC", "MODE_LINE", "MODE_ELLIPSE",
+    "MODE_FILE", "MODE_DOLLY_ZOOM", "CLOSED_SHAPES", "PAUSE_DURATION_DEFAULT",
+    "TIMING_GENERATOR", "TIMING_CONSTANT_SPEED", "EASING_LINEAR", "EASING_CUSTOM",
+    "EASING_PROFILES", "CameraSettings", "ShapeParams",
+    "WaypointArray", "waypoints_from_arrays", "WaypointEncoder",
+    "compute_look_at_unity_batch", "compute_look_at_unity", "apply_vertical_roll_batch",
+    "generate_shape_path", "uniform_shape_parameters", "unit_shape", "unit_shape_template",
+    "shape_positions", "adaptive_shape_parameters", "arc_start_deg", "dolly_zoom_path",
+    "offset_transform", "apply_transform_batch", "transform_path",
+    "ArcLengthTable", "elapsed_to_durations", "easing_curve", "eased_elapsed",
+    "easing_elapsed_table", "add_pause_at_end", "add_pause_pair_at_end",
+    "simplify_path", "PoseRingBuffer", "path_from_pose_samples", "PoseStore", "OscReceiver",
+    "stage_reverse", "stage_look_at", "stage_vertical", "stage_fields", "stage_timing",
+    "stage_pause",
+]
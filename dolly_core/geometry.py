@@ -0,0 +1,263 @@
+# dolly_core/geometry.py
+# -*- coding: utf-8 -*-
+"""
+Generator shapes (Circle, Arc, Line, Ellipse) and the Dolly Zoom path.
+
+Shapes are described by a ShapeParams and sampled as unit templates that are
+only scaled and translated per call; waypoint fields come from a
+CameraSettings.
+"""
+import math
+from functools import lru_cache
+
+import numpy as np
+
+from .orientation import compute_look_at_unity_batch
+from .params import (CameraSettings, CLOSED_SHAPES, MODE_ARC, MODE_CIRCLE, MODE_ELLIPSE,
+                     MODE_LINE)
+from .waypoints import WaypointArray, waypoints_from_arrays
+
+SHAPE_TEMPLATE_CACHE_SIZE = 64
+ADAPTIVE_DENSE_SAMPLES = 2048  # parameter grid used to measure curvature
+
+def generate_shape_path(params, camera=None, t=None):
+    """
+    Shared engine behind the Circle, Arc, Line and Ellipse generators.
+
+    Positions, yaws and durations for the whole path are computed as batched
+    NumPy array operations; the arrays are only turned into VRChat waypoint
+    path at the very end by `waypoints_from_arrays`.
+
+    `params` is a ShapeParams, `camera` the CameraSettings written into every
+    waypoint. Shapes (keyed by `params.shape`, one of the MODE_* constants):
+      - MODE_CIRCLE:  closed loop in XZ, yaw faces the center
+      - MODE_ELLIPSE: closed loop in XZ, Z radius scaled by `ellipse_ratio`
+      - MODE_LINE:    straight run along X from center-radius to center+radius
+      - MODE_ARC:     open arc of `span_deg` starting at `start_deg`
+                      (yaw convention atan2(X, Z), same as the avatar camera)
+
+    By default `n_points` are spaced evenly in the shape parameter; pass `t`
+    (increasing values in [0, 1), or [0, 1] for open shapes) to sample at
+    arbitrary parameters instead, e.g. from `adaptive_shape_parameters`.
+
+    Closed shapes use cumulative Durations (t * duration); open shapes
+    use a constant per-segment Duration, as the individual generators did.
+    With an explicit `t`, open-shape Durations follow the parameter steps so
+    the speed along the path stays the same.
+    """
+    shape = params.shape
+    total_duration = float(params.duration)
+    closed = shape in CLOSED_SHAPES
+    explicit_t = t is not None
+    if explicit_t:
+        t = np.asarray(t, dtype=np.float64)
+        template = None
+    else:
+        t, offsets, unit_yaws = unit_shape_template(shape, max(1, int(params.n_points)),
+                                                    **params.options())
+        template = (offsets, unit_yaws)
+    n = len(t)
+
+    positions, yaws = shape_positions(shape, params.center, params.radius, t,
+                                      start_deg=params.start_deg, template=template,
+                                      **params.options())
+
+    if closed:
+        durations = t * total_duration
+    elif explicit_t and n > 1:
+        steps = np.diff(t)
+        durations = np.concatenate(([steps[0]], steps)) * total_duration
+    else:
+        durations = np.full(n, total_duration / max(1, n - 1))
+
+    return waypoints_from_arrays(positions, yaws, durations, camera)
+
+def uniform_shape_parameters(shape, n_points):
+    """Evenly spaced shape parameters: [0, 1) for closed shapes, [0, 1] for open ones."""
+    n = max(1, int(n_points))
+    if shape in CLOSED_SHAPES:
+        return np.arange(n, dtype=np.float64) / n
+    if n > 1:
+        return np.linspace(0.0, 1.0, n)
+    return np.zeros(1)
+
+def unit_shape(shape, t, ellipse_ratio=0.75, span_deg=360.0, clockwise=False, look_at_center=True):
+    """
+    A generator shape at radius 1 around the origin (arcs start at 0 deg):
+    XZ offsets (N,2) and yaws (N,) at parameters `t`.
+    """
+    n = len(t)
+    offsets = np.empty((n, 2), dtype=np.float64)
+    yaws = np.zeros(n, dtype=np.float64)
+
+    if shape == MODE_CIRCLE or shape == MODE_ELLIPSE:
+        angles = t * (2.0 * np.pi)
+        offsets[:, 0] = np.cos(angles)
+        offsets[:, 1] = np.sin(angles)
+        if shape == MODE_CIRCLE:
+            yaws = np.degrees(np.arctan2(-offsets[:, 1], -offsets[:, 0]))
+        else:
+            offsets[:, 1] *= ellipse_ratio
+    elif shape == MODE_LINE:
+        offsets[:, 0] = t * 2.0 - 1.0
+        offsets[:, 1] = 0.0
+    elif shape == MODE_ARC:
+        step_sign = -1.0 if clockwise else 1.0
+        ang_deg = step_sign * (t * span_deg)
+        ang_rad = np.radians(ang_deg)
+        offsets[:, 0] = np.sin(ang_rad)
+        offsets[:, 1] = np.cos(ang_rad)
+        if look_at_center:
+            # Face towards center (orbit): bearing from point to center
+            yaws = np.degrees(np.arctan2(-offsets[:, 0], -offsets[:, 1]))
+        else:
+            # Face tangent along path: 90° ahead in direction of travel
+            yaws = ang_deg + (-90.0 if clockwise else 90.0)
+    else:
+        raise ValueError(f"Unsupported shape: {shape}")
+    return offsets, yaws
+
+@lru_cache(maxsize=SHAPE_TEMPLATE_CACHE_SIZE)
+def unit_shape_template(shape, n_points, ellipse_ratio=0.75, span_deg=360.0, clockwise=False,
+                        look_at_center=True):
+    """
+    Evenly sampled unit shape, cached (LRU) per (shape, point count, arc span)
+    plus the other shape options. Returns read-only (t, offsets, yaws); the
+    generators only scale and translate it, so radius and center drags skip
+    the trig entirely. Hit/miss counts come from `cache_info()`.
+    """
+    t = uniform_shape_parameters(shape, n_points)
+    offsets, yaws = unit_shape(shape, t, ellipse_ratio, span_deg, clockwise, look_at_center)
+    for arr in (t, offsets, yaws):
+        arr.flags.writeable = False
+    return t, offsets, yaws
+
+def shape_positions(shape, center, radius, t, ellipse_ratio=0.75, start_deg=0.0,
+                    span_deg=360.0, clockwise=False, look_at_center=True, template=None):
+    """
+    Positions (N,3) and yaws (N,) of a generator shape at parameters `t`.
+    `template` is a precomputed `unit_shape` result for the same `t`.
+    """
+    if template is None:
+        template = unit_shape(shape, t, ellipse_ratio, span_deg, clockwise, look_at_center)
+    offsets, yaws = template
+    if shape == MODE_ARC and start_deg:
+        # Arc templates start at 0 deg; rotate them to the requested start bearing.
+        a = math.radians(start_deg)
+        ca, sa = math.cos(a), math.sin(a)
+        offsets = np.column_stack((offsets[:, 0] * ca + offsets[:, 1] * sa,
+                                   offsets[:, 1] * ca - offsets[:, 0] * sa))
+        yaws = yaws + start_deg
+        if look_at_center:
+            yaws = (yaws + 180.0) % 360.0 - 180.0
+
+    cx, cy, cz = float(center["X"]), float(center["Y"]), float(center["Z"])
+    radius = float(radius)
+    positions = np.empty((len(offsets), 3), dtype=np.float64)
+    positions[:, 0] = cx + radius * offsets[:, 0]
+    positions[:, 1] = cy
+    positions[:, 2] = cz + radius * offsets[:, 1]
+    return positions, yaws
+
+def adaptive_shape_parameters(params, tolerance, max_angle_deg, max_points=None,
+                              look_target=None):
+    """
+    Curvature-adaptive shape parameters for `generate_shape_path(params, t=...)`.
+
+    The shape is measured on a dense parameter grid. A segment of length l
+    turning by phi deviates from its chord by about l * phi / 8, so keeping
+    that under `tolerance` needs sqrt(kappa / (8 * tolerance)) waypoints per
+    metre (kappa = phi / l). Independently, no step may turn the path
+    direction, the yaw, or the bearing to `look_target` by more than
+    `max_angle_deg`. The per-segment demand is accumulated along the shape and
+    waypoints are placed at equal steps of it, so tight ends get dense
+    sampling and straight runs collapse to their end points. The count is
+    clamped to [2, max_points] (3 for closed shapes); `max_points`
+    defaults to `params.n_points`.
+    """
+    shape = params.shape
+    if max_points is None:
+        max_points = params.n_points
+    closed = shape in CLOSED_SHAPES
+    dense_t = np.linspace(0.0, 1.0, ADAPTIVE_DENSE_SAMPLES + 1)
+    pts, yaws = shape_positions(shape, params.center, params.radius, dense_t,
+                                start_deg=params.start_deg, **params.options())
+
+    seg = np.diff(pts, axis=0)
+    seg_len = np.linalg.norm(seg, axis=1)
+    unit = seg / np.maximum(seg_len, 1e-12)[:, None]
+    # Turning angle at each interior vertex, split evenly onto its two segments.
+    if closed:
+        prev_unit = np.roll(unit, 1, axis=0)
+    else:
+        prev_unit = np.vstack([unit[:1], unit[:-1]])
+    turn = np.arccos(np.clip((unit * prev_unit).sum(axis=1), -1.0, 1.0))
+    phi = 0.5 * (turn + np.append(turn[1:], turn[0] if closed else 0.0))
+
+    angle = np.maximum(phi, np.radians(np.abs(np.diff(np.unwrap(yaws, period=360.0)))))
+    if look_target is not None:
+        look = np.asarray(look_target, dtype=np.float64) - pts
+        look /= np.maximum(np.linalg.norm(look, axis=1), 1e-12)[:, None]
+        angle = np.maximum(angle, np.arccos(np.clip((look[1:] * look[:-1]).sum(axis=1), -1.0, 1.0)))
+
+    demand = np.maximum(np.sqrt(phi * seg_len / (8.0 * max(float(tolerance), 1e-6))),
+                        angle / np.radians(max(float(max_angle_deg), 0.1)))
+    cumulative = np.concatenate(([0.0], np.cumsum(demand)))
+    min_segments = 3 if closed else 1
+    max_segments = max(min_segments, int(max_points) - (0 if closed else 1))
+    segments = int(min(max_segments, max(min_segments, math.ceil(cumulative[-1] - 1e-9))))
+
+    if cumulative[-1] <= 0.0:
+        return uniform_shape_parameters(shape, segments + (0 if closed else 1))
+    levels = np.arange(segments + (0 if closed else 1)) * (cumulative[-1] / segments)
+    t = np.interp(levels, cumulative, dense_t)
+    if not closed:
+        t[-1] = 1.0
+    return t
+
+def arc_start_deg(center, camera_pos, eps=1e-6):
+    """
+    Bearing (yaw convention atan2(X, Z)) from `center` to `camera_pos` in the
+    world XZ plane, so an arc starts where the camera stands. A camera on the
+    center starts facing +Z.
+    """
+    vx = float(camera_pos.get("X", 0.0)) - float(center.get("X", 0.0))
+    vz = float(camera_pos.get("Z", 0.0)) - float(center.get("Z", 0.0))
+    if abs(vx) <= eps and abs(vz) <= eps:
+        return 0.0
+    return math.degrees(math.atan2(vx, vz))
+
+def dolly_zoom_path(start, target, initial_zoom, exaggeration, duration, reverse=False,
+                    camera=None, num_points=5, max_t=0.95):
+    """
+    Move from `start` towards `target` ({"X", "Y", "Z"} dicts) while scaling
+    Zoom with the remaining distance, so the target keeps its framing.
+    `max_t` stops short of the target; `reverse` pulls back out instead.
+    """
+    if camera is None:
+        camera = CameraSettings()
+    start_vec = np.array([start["X"], start["Y"], start["Z"]])
+    target_vec = np.array([target["X"], target["Y"], target["Z"]])
+    initial_distance = np.linalg.norm(target_vec - start_vec)
+    if reverse:
+        t_values = [max_t - (max_t * i/(num_points-1)) for i in range(num_points)]
+    else:
+        t_values = [(max_t * i/(num_points-1)) for i in range(num_points)]
+    t_values = np.array(t_values)
+    positions = start_vec[None, :] * (1 - t_values)[:, None] + target_vec[None, :] * t_values[:, None]
+    eulers = compute_look_at_unity_batch(positions, target_vec, vertical_mode=False)
+    if initial_distance > 0:
+        current_distance = np.linalg.norm(target_vec[None, :] - positions, axis=1)
+        zooms = initial_zoom * (current_distance / initial_distance) * exaggeration
+    else:
+        zooms = np.full(num_points, float(initial_zoom))
+    zooms = np.clip(zooms, 20, 300)
+    return WaypointArray(
+        np.round(positions, 3),
+        np.round(eulers[:, [1, 0, 2]], 2),
+        focal_distance=camera.focal_distance,
+        aperture=camera.aperture,
+        zoom=np.round(zooms, 2),
+        speed=camera.speed,
+        duration=np.round(t_values * duration, 3),
+    )
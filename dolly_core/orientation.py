@@ -0,0 +1,65 @@
+# dolly_core/orientation.py
+# -*- coding: utf-8 -*-
+"""
+Unity-convention camera orientation helpers.
+
+scipy is imported on first use so that `import dolly_core` stays cheap.
+"""
+import numpy as np
+
+
+def compute_look_at_unity_batch(camera_positions, target_pos, vertical_mode=False):
+    """
+    Batched Unity LookRotation: (N,3) camera positions looking at one target.
+
+    Returns an (N,3) array of Unity YXZ Euler angles in degrees, ordered
+    (yaw, pitch, roll) like `as_euler('YXZ')`. Cameras sitting on the target
+    get [0, 0, 0]. Near-vertical views fall back to +Z (then +X) as the up
+    vector; `vertical_mode` adds the 90° roll used by "Rotate 90".
+    """
+    cams = np.asarray(camera_positions, dtype=np.float64).reshape(-1, 3)
+    n = len(cams)
+    if n == 0:
+        return np.zeros((0, 3))
+    forward = np.asarray(target_pos, dtype=np.float64).reshape(1, 3) - cams
+    norm_fwd = np.linalg.norm(forward, axis=1)
+    degenerate = norm_fwd < 1e-6
+    forward[~degenerate] /= norm_fwd[~degenerate, None]
+    forward[degenerate] = (0.0, 0.0, 1.0)
+
+    up_vecs = np.zeros((n, 3))
+    up_vecs[:, 1] = 1.0
+    near_vertical = np.abs(forward[:, 1]) > 0.99
+    up_vecs[near_vertical] = (0.0, 0.0, 1.0)
+    near_fallback = near_vertical & (np.abs(forward[:, 2]) > 0.99)
+    up_vecs[near_fallback] = (1.0, 0.0, 0.0)
+
+    right = np.cross(up_vecs, forward)
+    norm_r = np.linalg.norm(right, axis=1)
+    norm_r[norm_r < 1e-6] = 1
+    right /= norm_r[:, None]
+    up_corrected = np.cross(forward, right)
+    from scipy.spatial.transform import Rotation as R
+    rot = R.from_matrix(np.stack((right, up_corrected, forward), axis=2))
+    if vertical_mode:
+        rot = rot * R.from_euler('Z', 90, degrees=True)
+    euler = rot.as_euler('YXZ', degrees=True)
+    euler[degenerate] = 0.0
+    return euler
+
+def compute_look_at_unity(camera_pos, target_pos, vertical_mode=False):
+    return compute_look_at_unity_batch(camera_pos, target_pos, vertical_mode)[0].tolist()
+
+def apply_vertical_roll_batch(rotations_xyz):
+    """
+    Apply the "Rotate 90" roll to an (N,3) array of waypoint rotations
+    (Rotation X, Y, Z columns, interpreted as Unity YXZ Euler angles).
+    Returns the adjusted (N,3) array in the same column order.
+    """
+    rots = np.asarray(rotations_xyz, dtype=np.float64).reshape(-1, 3)
+    if len(rots) == 0:
+        return rots.copy()
+    from scipy.spatial.transform import Rotation as R
+    base_rot = R.from_euler('YXZ', rots[:, [1, 0, 2]], degrees=True)
+    final_rot = base_rot * R.from_euler('Z', 90, degrees=True)
+    return final_rot.as_euler('YXZ', degrees=True)[:, [1, 0, 2]]
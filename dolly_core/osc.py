@@ -0,0 +1,133 @@
+# dolly_core/osc.py
+# -*- coding: utf-8 -*-
+"""
+OSC receive loop and the camera pose sink it feeds.
+
+Importing this module opens no sockets and touches no files; the receiver
+binds only when constructed. The dispatcher is any python-osc `Dispatcher`
+(or object with `call_handlers_for_packet`), so pythonosc itself is not
+imported here.
+"""
+import socket
+import struct
+import time
+
+MAX_COUNTED_ADDRESSES = 256  # distinct addresses counted before the rest go to "other"
+
+# /usercamera/Pose with six float32 args, as VRChat sends it: padded address +
+# ",ffffff" type tags, followed by 6 big-endian floats (52 bytes total).
+_POSE_PACKET_PREFIX = b"/usercamera/Pose\x00\x00\x00\x00,ffffff\x00"
+_POSE_PACKET_ARGS = struct.Struct(">6f")
+_POSE_PACKET_SIZE = len(_POSE_PACKET_PREFIX) + _POSE_PACKET_ARGS.size
+
+
+class PoseStore:
+    """
+    Writes the /usercamera/Pose stream into a PoseRingBuffer.
+
+    `store` is the OscReceiver fast-path handler and `on_osc` the Dispatcher
+    handler for pose packets the fast path does not recognise. Both must
+    only be called from the OSC thread; `last_timestamp` (Unix time of the
+    newest pose, 0.0 before the first) is safe to read from any thread.
+    """
+
+    def __init__(self, buffer):
+        self.buffer = buffer
+        self.last_timestamp = 0.0
+
+    def store(self, x, y, z, rx, ry, rz):
+        self.buffer.push(time.monotonic(), x, y, z, rx, ry, rz)
+        self.last_timestamp = time.time()
+
+    def on_osc(self, address, *args):
+        """OSC handler for camera pose: posX, posY, posZ, rotX, rotY, rotZ (degrees)."""
+        try:
+            if len(args) >= 6:
+                self.store(*[float(a) for a in args[:6]])
+        except Exception:
+            # Ignore malformed packets; keep OSC thread resilient.
+            pass
+
+class OscReceiver:
+    """
+    Single-threaded OSC UDP receive loop.
+
+    Replaces ThreadingOSCUDPServer, which started one OS thread per datagram.
+    Datagrams are read into one preallocated buffer. The high-rate
+    /usercamera/Pose stream is recognized by its fixed byte prefix and decoded
+    with one struct unpack straight into `pose_handler(x, y, z, rx, ry, rz)`;
+    every other packet (avatar parameters, bundles, pose packets with other
+    type tags) goes through the normal python-osc Dispatcher.
+    """
+
+    def __init__(self, dispatcher, ip, port, pose_handler=None, bufsize=65536):
+        self.dispatcher = dispatcher
+        self.pose_handler = pose_handler
+        self.sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        try:
+            # Absorb bursts while a slow handler (e.g. a UI emit) runs.
+            self.sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 1 << 20)
+        except OSError:
+            pass
+        self.sock.bind((ip, port))
+        self._buf = bytearray(bufsize)
+        self._view = memoryview(self._buf)
+        self._running = False
+        self.packets = 0
+        self.pose_packets = 0
+        self.recv_errors = 0
+        self.address_packets = {}  # OSC address (bytes) -> packets, pose fast path excluded
+
+    @property
+    def address(self):
+        return self.sock.getsockname()
+
+    def handle_datagram(self, nbytes, client_address):
+        self.packets += 1
+        buf = self._buf
+        if (self.pose_handler is not None and nbytes == _POSE_PACKET_SIZE
+                and buf.startswith(_POSE_PACKET_PREFIX)):
+            self.pose_packets += 1
+            self.pose_handler(*_POSE_PACKET_ARGS.unpack_from(buf, len(_POSE_PACKET_PREFIX)))
+            return
+        data = bytes(self._view[:nbytes])
+        i = data.find(b"\x00")
+        address = data if i < 0 else data[:i]
+        counts = self.address_packets
+        if address not in counts and len(counts) >= MAX_COUNTED_ADDRESSES:
+            address = b"other"
+        counts[address] = counts.get(address, 0) + 1
+        try:
+            self.dispatcher.call_handlers_for_packet(data, client_address)
+        except Exception:
+            # Ignore malformed packets; keep OSC thread resilient.
+            pass
+
+    def serve_forever(self, poll_interval=0.5):
+        """Receive until `shutdown()`; `poll_interval` bounds how long shutdown takes to notice."""
+        self._running = True
+        self.sock.settimeout(poll_interval)
+        recv_into = self.sock.recvfrom_into
+        buf = self._buf
+        while self._running:
+            try:
+                nbytes, client_address = recv_into(buf)
+            except socket.timeout:
+                continue
+            except OSError as e:
+                if not self._running:
+                    break
+                # Transient on Windows (e.g. WSAECONNRESET after an ICMP port-unreachable);
+                # keep receiving, but report the first one so persistent failures are visible.
+                self.recv_errors += 1
+                if self.recv_errors == 1:
+                    print(f"OSC receive error (further errors counted in recv_errors): {e}")
+                continue
+            self.handle_datagram(nbytes, client_address)
+
+    def shutdown(self):
+        self._running = False
+
+    def close(self):
+        self._running = False
+        self.sock.close()
@@ -0,0 +1,75 @@
+# dolly_core/params.py
+# -*- coding: utf-8 -*-
+"""
+Constants and explicit parameter objects shared by the core modules.
+
+The GUI keeps its state in module globals; it snapshots them into these
+objects before calling into the core, so nothing here reads global state.
+"""
+from dataclasses import dataclass, field
+
+MIN_POINTS = 5
+MAX_POINTS = 1000
+
+# --- Dolly Mode Constants (single source of truth) ---
+MODE_CIRCLE = 1
+MODE_ARC = 2
+MODE_LINE = 3
+MODE_ELLIPSE = 4
+MODE_FILE = 5
+MODE_DOLLY_ZOOM = 6
+
+CLOSED_SHAPES = (MODE_CIRCLE, MODE_ELLIPSE)
+
+PAUSE_DURATION_DEFAULT = 60.0
+
+# --- Duration timing modes ---
+TIMING_GENERATOR = "generator"            # keep the Durations each generator / file produced
+TIMING_CONSTANT_SPEED = "constant_speed"  # retime so the camera moves at constant linear speed
+
+# --- Easing profiles: name -> cubic Bezier (x1, y1, x2, y2), CSS style; None = linear ---
+EASING_LINEAR = "Linear"
+EASING_CUSTOM = "Custom Bezier"
+EASING_PROFILES = {
+    EASING_LINEAR: None,
+    "Ease In": (0.42, 0.0, 1.0, 1.0),
+    "Ease Out": (0.0, 0.0, 0.58, 1.0),
+    "Ease In-Out": (0.42, 0.0, 0.58, 1.0),
+    EASING_CUSTOM: None,  # control points supplied by the caller
+}
+
+@dataclass(frozen=True)
+class CameraSettings:
+    """Per-waypoint camera fields written by the generators."""
+    zoom: float = 45.0
+    speed: float = 3.0
+    focal_distance: float = 2.0
+    aperture: float = 15.0
+    islocal: bool = False
+    path_index: int = 0
+    hue: float = 120.0
+    saturation: float = 100.0
+    lightness: float = 50.0
+
+@dataclass(frozen=True)
+class ShapeParams:
+    """
+    One generator shape. `center` is an {"X", "Y", "Z"} dict like the rest of
+    the app's vectors; `start_deg`, `span_deg`, `clockwise` and
+    `look_at_center` only apply to arcs, `ellipse_ratio` only to ellipses.
+    """
+    shape: int
+    center: dict = field(default_factory=lambda: {"X": 0.0, "Y": 0.0, "Z": 0.0})
+    radius: float = 2.0
+    n_points: int = 15
+    duration: float = 2.0
+    ellipse_ratio: float = 0.75
+    start_deg: float = 0.0
+    span_deg: float = 360.0
+    clockwise: bool = False
+    look_at_center: bool = True
+
+    def options(self):
+        """Shape options as keyword arguments for `unit_shape` / `shape_positions`."""
+        return {"ellipse_ratio": self.ellipse_ratio, "span_deg": self.span_deg,
+                "clockwise": self.clockwise, "look_at_center": self.look_at_center}
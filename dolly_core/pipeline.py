@@ -0,0 +1,72 @@
+# dolly_core/pipeline.py
+# -*- coding: utf-8 -*-
+"""
+Pure path stages. Each takes a WaypointArray plus plain parameters and
+returns a new WaypointArray without touching its input, so callers can
+memoize them on their arguments.
+"""
+import numpy as np
+
+from .orientation import compute_look_at_unity_batch, apply_vertical_roll_batch
+from .timing import ArcLengthTable, elapsed_to_durations, easing_elapsed_table, add_pause_at_end
+
+
+def stage_reverse(path, keep_head):
+    """Reverse waypoint order; with `keep_head` the first two points (start and target) stay put."""
+    if keep_head and len(path) > 2:
+        order = np.concatenate(([0, 1], np.arange(len(path) - 1, 1, -1)))
+        return path[order]
+    return path.reversed()
+
+def stage_look_at(path, target, skip_index):
+    """Point every waypoint (except `skip_index`) at `target` (X, Y, Z tuple)."""
+    if not len(path):
+        return path
+    mask = np.ones(len(path), dtype=bool)
+    if skip_index is not None and skip_index < len(mask):
+        mask[skip_index] = False
+    eulers = compute_look_at_unity_batch(path.position[mask], np.array(target), vertical_mode=False)
+    rotations = path.rotation.copy()
+    rotations[mask] = np.round(eulers[:, [1, 0, 2]], 2)
+    return path.with_columns(rotation=rotations)
+
+def stage_vertical(path):
+    """Add the "Rotate 90" roll to every waypoint."""
+    if not len(path):
+        return path
+    return path.with_columns(rotation=np.round(apply_vertical_roll_batch(path.rotation), 2))
+
+def stage_fields(path, lookat_x, lookat_y, speed, zoom, aperture, focal_distance):
+    """Override per-waypoint scalar fields; `zoom=None` keeps per-waypoint zoom (Dolly Zoom)."""
+    columns = {"lookat_x": lookat_x, "lookat_y": lookat_y, "speed": speed,
+               "aperture": aperture, "focal_distance": focal_distance}
+    if zoom is not None:
+        columns["zoom"] = zoom
+    return path.with_columns(**columns)
+
+def stage_timing(path, total_duration, constant_speed, easing, skip_index=None):
+    """
+    Replace Durations: spread `total_duration` over the path by arc length
+    (`constant_speed`) or evenly per waypoint, shaped by the `easing` Bezier.
+    The `skip_index` waypoint (File mode's target marker) keeps its Duration
+    and is left out of the arc length and the easing.
+    """
+    if len(path) < 2:
+        return path
+    mask = np.ones(len(path), dtype=bool)
+    if skip_index is not None and skip_index < len(mask):
+        mask[skip_index] = False
+        total_duration = max(0.0, total_duration - float(path.duration[skip_index]))
+    n = int(mask.sum())
+    if n < 2:
+        return path
+    if constant_speed:
+        timed = ArcLengthTable(path.position[mask]).durations(total_duration, easing)
+    else:
+        timed = elapsed_to_durations(easing_elapsed_table(easing, n), total_duration)
+    durations = path.duration.copy()
+    durations[mask] = timed
+    return path.with_columns(duration=durations)
+
+def stage_pause(path, duration):
+    return add_pause_at_end(path, duration)
@@ -0,0 +1,135 @@
+# dolly_core/pose.py
+# -*- coding: utf-8 -*-
+"""Camera pose history and conversion of recorded poses into paths."""
+import time
+
+import numpy as np
+
+from .params import CameraSettings
+from .waypoints import WaypointArray
+
+
+class PoseRingBuffer:
+    """Fixed-size history of camera poses from the OSC stream.
+
+    Rows are [monotonic t, X, Y, Z, rotX, rotY, rotZ] (world space, degrees).
+    A single writer (the OSC thread) fills the row at ``count % capacity``
+    and only then bumps ``count``, so readers never need a lock: they copy
+    the rows below ``count`` and retry if the writer lapped them meanwhile.
+    """
+
+    GUARD = 8  # slots readers leave to the writer so a copy rarely has to retry
+
+    def __init__(self, capacity=4096):
+        self.capacity = int(capacity)
+        self._rows = np.zeros((self.capacity, 7), dtype=np.float64)
+        self.count = 0
+
+    def push(self, t, x, y, z, rx, ry, rz):
+        """Append one sample. Must only be called from the writer thread."""
+        self._rows[self.count % self.capacity] = (t, x, y, z, rx, ry, rz)
+        self.count += 1
+
+    def snapshot(self, max_samples=None):
+        """Return a consistent (k, 7) copy of the newest samples, oldest first."""
+        limit = self.capacity - self.GUARD
+        if max_samples is not None:
+            limit = min(limit, int(max_samples))
+        while True:
+            end = self.count
+            k = min(end, limit)
+            if k <= 0:
+                return np.empty((0, 7), dtype=np.float64)
+            start = end - k
+            idx = np.arange(start, end) % self.capacity
+            rows = self._rows[idx]
+            # The writer may have overwritten the oldest rows while we copied.
+            if self.count - start < self.capacity:
+                return rows
+
+    def read_since(self, cursor):
+        """Samples pushed at or after sequence number ``cursor`` (a past ``count``).
+
+        Returns (rows, next_cursor, dropped), where ``dropped`` counts samples
+        that were overwritten before the caller got to them.
+        """
+        while True:
+            end = self.count
+            start = max(cursor, end - (self.capacity - self.GUARD))
+            if start >= end:
+                return np.empty((0, 7), dtype=np.float64), end, 0
+            rows = self._rows[np.arange(start, end) % self.capacity]
+            if self.count - start < self.capacity:
+                return rows, end, start - cursor
+
+    def latest(self):
+        """Newest sample row, or None if nothing has been received."""
+        rows = self.snapshot(1)
+        return rows[0] if len(rows) else None
+
+    def window(self, seconds, now=None):
+        """Samples received during the last ``seconds``."""
+        rows = self.snapshot()
+        if not len(rows):
+            return rows
+        now = time.monotonic() if now is None else now
+        first = np.searchsorted(rows[:, 0], now - seconds, side="left")
+        return rows[first:]
+
+    def window_average(self, seconds, now=None):
+        """Mean pose over the last ``seconds`` as a 6-vector, or None.
+
+        Positions are averaged directly; each rotation axis uses a circular
+        mean so samples straddling +/-180 do not cancel out.
+        """
+        rows = self.window(seconds, now)
+        if not len(rows):
+            return None
+        pos = rows[:, 1:4].mean(axis=0)
+        rad = np.radians(rows[:, 4:7])
+        rot = np.degrees(np.arctan2(np.sin(rad).mean(axis=0), np.cos(rad).mean(axis=0)))
+        return np.concatenate([pos, rot])
+
+    def sample_at(self, t):
+        """Pose interpolated at monotonic time ``t`` (clamped to the buffered range)."""
+        rows = self.snapshot()
+        if not len(rows):
+            return None
+        ts = rows[:, 0]
+        rot = np.unwrap(rows[:, 4:7], period=360.0, axis=0)
+        out = np.empty(6)
+        for i in range(3):
+            out[i] = np.interp(t, ts, rows[:, 1 + i])
+            out[3 + i] = np.interp(t, ts, rot[:, i])
+        out[3:] = (out[3:] + 180.0) % 360.0 - 180.0
+        return out
+
+    def rate(self, seconds=1.0, now=None):
+        """Estimated samples per second over the last ``seconds``."""
+        rows = self.window(seconds, now)
+        if len(rows) < 2:
+            return 0.0
+        span = rows[-1, 0] - rows[0, 0]
+        return (len(rows) - 1) / span if span > 0 else 0.0
+
+def path_from_pose_samples(rows, camera=None):
+    """
+    Turn (k, 7) pose rows into a WaypointArray: one waypoint per sample,
+    Duration is the time since the previous sample, and the remaining fields
+    come from `camera` (a CameraSettings).
+    """
+    rows = np.asarray(rows, dtype=np.float64).reshape(-1, 7)
+    if len(rows) < 2:
+        raise ValueError("fewer than 2 camera poses were received")
+    if camera is None:
+        camera = CameraSettings()
+    # Round the elapsed times, not the steps, so the total take length does not drift.
+    elapsed = np.round(rows[:, 0] - rows[0, 0], 3)
+    return WaypointArray(
+        np.round(rows[:, 1:4], 3), np.round(rows[:, 4:7], 2),
+        zoom=camera.zoom,
+        speed=camera.speed,
+        aperture=camera.aperture,
+        focal_distance=camera.focal_distance,
+        duration=np.round(np.diff(elapsed, prepend=0.0), 3),
+    )
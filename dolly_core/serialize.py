@@ -0,0 +1,73 @@
+# dolly_core/serialize.py
+# -*- coding: utf-8 -*-
+"""Schema-specialized JSON encoder for WaypointArray paths."""
+import numpy as np
+
+
+class WaypointEncoder:
+    """
+    Fast JSON encoder for the fixed VRChat waypoint schema.
+
+    Writes straight from WaypointArray columns with fixed-precision formatting
+    (3 decimals for positions and other scalars, 2 for rotation angles). Columns
+    that hold one value for the whole path are formatted once and baked into the
+    row template, so only the varying fields are formatted per waypoint. The
+    expanded template and the value buffer are kept and reused between exports
+    while the path length and constant fields stay the same.
+
+    Not thread-safe: each thread should own its encoder.
+    """
+
+    # (JSON key, column, format) in schema order, between Index and Position
+    SCALARS = (
+        ("PathIndex", "path_index", "%d"),
+        ("FocalDistance", "focal_distance", "%.3f"),
+        ("Aperture", "aperture", "%.3f"),
+        ("Hue", "hue", "%.3f"),
+        ("Saturation", "saturation", "%.3f"),
+        ("Lightness", "lightness", "%.3f"),
+        ("LookAtMeXOffset", "lookat_x", "%.3f"),
+        ("LookAtMeYOffset", "lookat_y", "%.3f"),
+        ("Zoom", "zoom", "%.3f"),
+        ("Speed", "speed", "%.3f"),
+        ("Duration", "duration", "%.3f"),
+    )
+    TRANSFORM = ',"Position":{"X":%.3f,"Y":%.3f,"Z":%.3f},"Rotation":{"X":%.2f,"Y":%.2f,"Z":%.2f}'
+
+    def __init__(self):
+        self._template_key = None
+        self._template = None
+        self._buffer = None
+
+    def encode(self, path):
+        n = len(path)
+        if n == 0:
+            return "[]"
+        parts = ['{"Index":%d']
+        columns = [np.arange(n)]
+        for key, attr, fmt in self.SCALARS:
+            col = getattr(path, attr)
+            if (col == col[0]).all():
+                parts.append(',"%s":%s' % (key, fmt % col[0].item()))
+            else:
+                parts.append(',"%s":%s' % (key, fmt))
+                columns.append(col)
+        parts.append(self.TRANSFORM)
+        columns.extend(path.position.T)
+        columns.extend(path.rotation.T)
+        if (path.islocal == path.islocal[0]).all():
+            parts.append(',"islocal":%s}' % ("true" if path.islocal[0] else "false"))
+        else:
+            parts.append(',"islocal":%s}')
+            columns.append(np.where(path.islocal, "true", "false"))
+
+        row = "".join(parts)
+        if self._template_key != (n, row):
+            self._template = "[" + ",".join([row] * n) + "]"
+            self._template_key = (n, row)
+        shape = (n, len(columns))
+        if self._buffer is None or self._buffer.shape != shape:
+            self._buffer = np.empty(shape, dtype=object)
+        for j, col in enumerate(columns):
+            self._buffer[:, j] = col
+        return self._template % tuple(self._buffer.ravel())
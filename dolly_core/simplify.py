@@ -0,0 +1,67 @@
+# dolly_core/simplify.py
+# -*- coding: utf-8 -*-
+"""Tolerance-driven waypoint reduction for dense (recorded or imported) paths."""
+import numpy as np
+
+from .waypoints import WaypointArray
+
+
+def simplify_path(path, position_tolerance, angle_tolerance, keep=()):
+    """
+    Ramer-Douglas-Peucker simplification over position and rotation jointly.
+
+    A waypoint may be dropped when the path interpolated between the kept
+    neighbours, at that waypoint's time, stays within `position_tolerance`
+    (metres) and `angle_tolerance` (degrees per axis). Each pass scores every
+    waypoint against its current segment in one set of array operations and
+    splits all failing segments at once, so the loop runs once per recursion
+    level rather than once per segment. Waypoints where any other field
+    changes, plus the indices in `keep`, are always kept. Durations of dropped
+    waypoints are folded into the next kept one, so the total is unchanged.
+    """
+    n = len(path)
+    if n < 3:
+        return path
+    durations = path.duration.astype(np.float64)
+    elapsed = np.cumsum(durations) - durations[0]
+    pos = path.position
+    rot = np.unwrap(path.rotation, period=360.0, axis=0)
+    pos_tol = max(float(position_tolerance), 1e-9)
+    ang_tol = max(float(angle_tolerance), 1e-9)
+
+    keep_mask = np.zeros(n, dtype=bool)
+    keep_mask[[0, -1]] = True
+    keep_mask[[k for k in keep if 0 <= k < n]] = True
+    for _, attr, _, _ in WaypointArray.SCALAR_FIELDS:
+        if attr == "duration":
+            continue
+        changed = np.flatnonzero(getattr(path, attr)[1:] != getattr(path, attr)[:-1])
+        keep_mask[changed] = True
+        keep_mask[changed + 1] = True
+
+    idx = np.arange(n)
+    while True:
+        kept = np.flatnonzero(keep_mask)
+        seg = np.minimum(np.searchsorted(kept, idx, side="right") - 1, len(kept) - 2)
+        a, b = kept[seg], kept[seg + 1]
+        span = elapsed[b] - elapsed[a]
+        by_time = span > 0
+        u = np.where(by_time, (elapsed - elapsed[a]) / np.where(by_time, span, 1.0),
+                     (idx - a) / (b - a))[:, None]
+        pos_err = np.linalg.norm(pos - (pos[a] + u * (pos[b] - pos[a])), axis=1)
+        ang_err = np.abs(rot - (rot[a] + u * (rot[b] - rot[a]))).max(axis=1)
+        score = np.maximum(pos_err / pos_tol, ang_err / ang_tol)
+        score[keep_mask] = 0.0
+
+        seg_max = np.maximum.reduceat(score, kept[:-1])
+        worst = np.flatnonzero((score > 1.0) & (score == seg_max[seg]))
+        if not len(worst):
+            break
+        _, first = np.unique(seg[worst], return_index=True)
+        keep_mask[worst[first]] = True
+
+    kept = np.flatnonzero(keep_mask)
+    new_durations = np.empty(len(kept))
+    new_durations[0] = durations[0]
+    new_durations[1:] = np.diff(elapsed[kept])
+    return path[kept].with_columns(duration=np.round(new_durations, 3))
@@ -0,0 +1,140 @@
+# dolly_core/timing.py
+# -*- coding: utf-8 -*-
+"""Arc-length timing, easing lookup tables and end-of-path pauses."""
+from functools import lru_cache
+
+import numpy as np
+
+from .params import PAUSE_DURATION_DEFAULT
+from .waypoints import WaypointArray
+
+
+class ArcLengthTable:
+    """
+    Cumulative arc-length lookup table over an (N,3) polyline.
+
+    `cumulative[i]` is the distance travelled from waypoint 0 to waypoint i.
+    Distance and time queries are answered by binary search over the table
+    (O(log N) each, vectorized over arrays of queries).
+    """
+
+    __slots__ = ("positions", "cumulative")
+
+    def __init__(self, positions):
+        self.positions = np.asarray(positions, dtype=np.float64).reshape(-1, 3)
+        seg = np.linalg.norm(np.diff(self.positions, axis=0), axis=1)
+        self.cumulative = np.concatenate(([0.0], np.cumsum(seg)))
+
+    @property
+    def total(self):
+        return float(self.cumulative[-1])
+
+    def index_at_distance(self, s):
+        """Fractional waypoint index at distance `s` along the path (clamped)."""
+        s = np.clip(np.asarray(s, dtype=np.float64), 0.0, self.total)
+        i = np.clip(np.searchsorted(self.cumulative, s, side="right") - 1, 0, max(0, len(self.cumulative) - 2))
+        if len(self.cumulative) < 2:
+            return np.zeros_like(s)
+        seg = self.cumulative[i + 1] - self.cumulative[i]
+        frac = np.where(seg > 0, (s - self.cumulative[i]) / np.where(seg > 0, seg, 1.0), 0.0)
+        return i + frac
+
+    def position_at_distance(self, s):
+        """Point(s) at distance `s` along the path."""
+        u = self.index_at_distance(s)
+        i = np.minimum(np.floor(u).astype(np.int64), len(self.positions) - 1)
+        j = np.minimum(i + 1, len(self.positions) - 1)
+        frac = (u - i)[..., None]
+        return self.positions[i] + frac * (self.positions[j] - self.positions[i])
+
+    def position_at_time(self, t, total_duration):
+        """Point(s) reached at time `t` when the whole path takes `total_duration` at constant speed."""
+        fraction = np.asarray(t, dtype=np.float64) / max(float(total_duration), 1e-9)
+        return self.position_at_distance(fraction * self.total)
+
+    def progress(self):
+        """Fraction of the total length covered at each waypoint."""
+        n = len(self.cumulative)
+        if self.total > 0.0:
+            return self.cumulative / self.total
+        return np.linspace(0.0, 1.0, n) if n > 1 else np.zeros(1)
+
+    def durations(self, total_duration, easing=None):
+        """
+        Per-waypoint Durations that cover the path in `total_duration` at
+        constant speed, or following the `easing` Bezier if one is given.
+        """
+        progress = self.progress()
+        if easing is not None:
+            progress = eased_elapsed(easing, progress)
+        return elapsed_to_durations(progress, total_duration)
+
+def elapsed_to_durations(elapsed_fraction, total_duration):
+    """
+    Turn elapsed-time fractions per waypoint into Durations (time from the
+    previous waypoint, 0 for the first). Elapsed times are rounded before
+    differencing so the sum stays exact.
+    """
+    elapsed = np.round(np.asarray(elapsed_fraction) * float(total_duration), 3)
+    return np.round(np.diff(elapsed, prepend=0.0), 3)
+
+EASING_TABLE_SAMPLES = 1024
+
+@lru_cache(maxsize=32)
+def easing_curve(bezier):
+    """
+    Tabulate a cubic Bezier easing (x = elapsed time, y = progress, both 0..1)
+    once per control-point tuple. Returns read-only (progress, elapsed) arrays
+    for inverse lookups; y controls are clamped to [0, 1] so the camera never
+    moves backwards.
+    """
+    x1, y1, x2, y2 = (min(1.0, max(0.0, float(v))) for v in bezier)
+    u = np.linspace(0.0, 1.0, EASING_TABLE_SAMPLES + 1)
+    a, b, c = 3.0 * (1.0 - u) ** 2 * u, 3.0 * (1.0 - u) * u ** 2, u ** 3
+    elapsed = a * x1 + b * x2 + c
+    progress = a * y1 + b * y2 + c
+    progress.flags.writeable = False
+    elapsed.flags.writeable = False
+    return progress, elapsed
+
+def eased_elapsed(bezier, progress):
+    """Elapsed-time fraction at which the easing reaches each `progress` fraction."""
+    table_progress, table_elapsed = easing_curve(bezier)
+    return np.interp(progress, table_progress, table_elapsed)
+
+@lru_cache(maxsize=256)
+def easing_elapsed_table(bezier, n):
+    """Elapsed-time fractions for `n` evenly spaced waypoints, cached per (profile, count)."""
+    progress = np.linspace(0.0, 1.0, n) if n > 1 else np.zeros(1)
+    if bezier is None:
+        elapsed = progress
+    else:
+        elapsed = eased_elapsed(bezier, progress)
+    elapsed.flags.writeable = False
+    return elapsed
+
+def add_pause_at_end(path, duration=PAUSE_DURATION_DEFAULT):
+    """
+    Append a single pause waypoint at the end that keeps the camera fixed
+    for `duration` seconds. Returns a new WaypointArray.
+    """
+    if not len(path):
+        return path
+
+    pause_len = float(duration)
+
+    # keep same transform & schema; only Duration changes
+    # Optional: Speed=0 if your player honors per-WP speed
+    hold = path[-1].with_columns(duration=round(pause_len, 3), speed=0.0)
+    return WaypointArray.concat([path, hold])
+
+def add_pause_pair_at_end(path, duration=PAUSE_DURATION_DEFAULT):
+    if not len(path):
+        return path
+
+    pause_len = float(duration)
+
+    hold1 = path[-1].with_columns(duration=round(pause_len, 3), speed=0.0)
+    # hold2 can be zero duration (acts as a resume marker), or same as hold1
+    hold2 = path[-1].with_columns(duration=0.0, speed=0.0)
+    return WaypointArray.concat([path, hold1, hold2])
@@ -0,0 +1,54 @@
+# dolly_core/transform.py
+# -*- coding: utf-8 -*-
+"""
+Rigid offsets (translation plus rotation about the path centroid) applied to
+whole paths. Rotation offsets are scipy `Rotation` objects.
+"""
+import numpy as np
+
+
+def offset_transform(pivot, translation, rotation_offset):
+    """
+    Homogeneous 4x4 matrix for the path offsets: p' = R (p - c) + c + t,
+    i.e. rotate by `rotation_offset` around the pivot c, then translate by t.
+    """
+    m = rotation_offset.as_matrix()
+    transform = np.eye(4)
+    transform[:3, :3] = m
+    transform[:3, 3] = pivot + translation - m @ pivot
+    return transform
+
+def apply_transform_batch(positions, rotations, transform, rotation_offset, mask):
+    """
+    Apply a homogeneous `transform` to the (N,3) positions and its rotation
+    part to the rotation (XYZ Euler, degrees) rows where `mask` is True, as
+    one matrix product each. Rows where `mask` is False pass through
+    untouched. Results are rounded once, from the untransformed input, so
+    repeated nudges never accumulate rounding error.
+    Returns new (positions, rotations) arrays.
+    """
+    positions = np.array(positions, dtype=np.float64)
+    rotations = np.array(rotations, dtype=np.float64)
+    if not mask.any():
+        return positions, rotations
+    positions[mask] = np.round(positions[mask] @ transform[:3, :3].T + transform[:3, 3], 3)
+    from scipy.spatial.transform import Rotation as R
+    new_rot = rotation_offset * R.from_euler('XYZ', rotations[mask], degrees=True)
+    rotations[mask] = np.round(new_rot.as_euler('XYZ', degrees=True), 2)
+    return positions, rotations
+
+def transform_path(base, translation, rotation_offset, mask=None):
+    """
+    `base` with a translation (X, Y, Z) and a scipy Rotation offset applied
+    through one homogeneous transform, pivoting around the centroid of the
+    masked rows. Returns a new path; `base` itself is never modified.
+    """
+    if not len(base):
+        return base
+    if mask is None:
+        mask = np.ones(len(base), dtype=bool)
+    pivot = base.position[mask].mean(axis=0)
+    transform = offset_transform(pivot, np.asarray(translation, dtype=np.float64), rotation_offset)
+    positions, rotations = apply_transform_batch(
+        base.position, base.rotation, transform, rotation_offset, mask)
+    return base.with_columns(position=positions, rotation=rotations)
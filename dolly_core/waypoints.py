@@ -0,0 +1,157 @@
+# dolly_core/waypoints.py
+# -*- coding: utf-8 -*-
+"""Columnar waypoint container in the VRChat dolly schema."""
+import json
+
+import numpy as np
+
+from .params import CameraSettings
+
+
+class WaypointArray:
+    """
+    Columnar, NumPy-backed dolly path.
+
+    Each waypoint field lives in its own array: `position` and `rotation`
+    are (N,3) float arrays, everything else is an (N,) column. Slicing,
+    reversal and `with_columns` share the underlying arrays instead of
+    cloning nested dicts; `to_dicts`/`to_json` produce the exact VRChat
+    waypoint schema (Index is derived from row order).
+    """
+
+    # (JSON key, attribute, dtype, default)
+    SCALAR_FIELDS = (
+        ("PathIndex", "path_index", np.int32, 0),
+        ("FocalDistance", "focal_distance", np.float64, 2.0),
+        ("Aperture", "aperture", np.float64, 15.0),
+        ("Hue", "hue", np.float64, 120.0),
+        ("Saturation", "saturation", np.float64, 100.0),
+        ("Lightness", "lightness", np.float64, 50.0),
+        ("LookAtMeXOffset", "lookat_x", np.float64, 0.0),
+        ("LookAtMeYOffset", "lookat_y", np.float64, 0.0),
+        ("Zoom", "zoom", np.float64, 45.0),
+        ("Speed", "speed", np.float64, 3.0),
+        ("Duration", "duration", np.float64, 0.0),
+        ("islocal", "islocal", np.bool_, False),
+    )
+    COLUMNS = ("position", "rotation") + tuple(f[1] for f in SCALAR_FIELDS)
+
+    __slots__ = COLUMNS
+
+    def __init__(self, position, rotation=None, **columns):
+        self.position = np.asarray(position, dtype=np.float64).reshape(-1, 3)
+        n = len(self.position)
+        if rotation is None:
+            rotation = np.zeros((n, 3))
+        self.rotation = np.asarray(rotation, dtype=np.float64).reshape(-1, 3)
+        for _, attr, dtype, default in self.SCALAR_FIELDS:
+            value = columns.pop(attr, default)
+            setattr(self, attr, self._column(value, n, dtype))
+        if columns:
+            raise TypeError(f"Unknown waypoint columns: {sorted(columns)}")
+
+    @staticmethod
+    def _column(value, n, dtype):
+        arr = np.asarray(value, dtype=dtype)
+        if arr.ndim == 0:
+            return np.full(n, arr, dtype=dtype)
+        return arr
+
+    @classmethod
+    def empty(cls):
+        return cls(np.zeros((0, 3)))
+
+    @classmethod
+    def from_dicts(cls, waypoints):
+        """Build from a list of VRChat waypoint dicts (e.g. an imported JSON file)."""
+        waypoints = list(waypoints)
+        if not waypoints:
+            return cls.empty()
+
+        def vec(key):
+            return [[float(wp.get(key, {}).get(a, 0.0)) for a in ("X", "Y", "Z")] for wp in waypoints]
+
+        columns = {attr: [wp.get(key, default) for wp in waypoints]
+                   for key, attr, _, default in cls.SCALAR_FIELDS}
+        return cls(vec("Position"), vec("Rotation"), **columns)
+
+    @classmethod
+    def concat(cls, paths):
+        paths = [p for p in paths if len(p)]
+        if not paths:
+            return cls.empty()
+        return cls(**{c: np.concatenate([getattr(p, c) for p in paths]) for c in cls.COLUMNS})
+
+    def __len__(self):
+        return len(self.position)
+
+    def __getitem__(self, key):
+        """Row selection. Slices return views; index arrays/masks return copies."""
+        if isinstance(key, (int, np.integer)):
+            key = slice(key, key + 1 if key != -1 else None)
+        return WaypointArray(**{c: getattr(self, c)[key] for c in self.COLUMNS})
+
+    def reversed(self):
+        return self[::-1]
+
+    def copy(self):
+        return WaypointArray(**{c: getattr(self, c).copy() for c in self.COLUMNS})
+
+    def with_columns(self, **columns):
+        """Shallow copy sharing every column except the ones given (scalars broadcast)."""
+        n = len(self)
+        data = {c: getattr(self, c) for c in self.COLUMNS}
+        for attr, value in columns.items():
+            if attr in ("position", "rotation"):
+                data[attr] = np.asarray(value, dtype=np.float64).reshape(-1, 3)
+            else:
+                data[attr] = self._column(value, n, getattr(self, attr).dtype)
+        return WaypointArray(**data)
+
+    def to_dicts(self):
+        """Expand to the VRChat waypoint dict schema."""
+        scalars = [(key, getattr(self, attr).tolist()) for key, attr, _, _ in self.SCALAR_FIELDS]
+        positions = self.position.tolist()
+        rotations = self.rotation.tolist()
+        out = []
+        for i in range(len(positions)):
+            wp = {"Index": i}
+            for key, values in scalars:
+                if key == "islocal":
+                    continue
+                wp[key] = values[i]
+            x, y, z = positions[i]
+            rx, ry, rz = rotations[i]
+            wp["Position"] = {"X": x, "Y": y, "Z": z}
+            wp["Rotation"] = {"X": rx, "Y": ry, "Z": rz}
+            wp["islocal"] = scalars[-1][1][i]
+            out.append(wp)
+        return out
+
+    def to_json(self):
+        return json.dumps(self.to_dicts())
+
+def waypoints_from_arrays(positions, yaws, durations, camera=None):
+    """
+    Pack batched (N,3) positions, (N,) yaws and (N,) durations into a
+    WaypointArray, filling the other columns from `camera` (a CameraSettings).
+    Rounding is done once over the arrays.
+    """
+    if camera is None:
+        camera = CameraSettings()
+    n = len(positions)
+    rotations = np.zeros((n, 3))
+    rotations[:, 1] = np.round(yaws, 2)
+    return WaypointArray(
+        np.round(positions, 3), rotations,
+        path_index=camera.path_index,
+        focal_distance=float(camera.focal_distance),
+        aperture=float(camera.aperture),
+        hue=camera.hue,
+        saturation=camera.saturation,
+        lightness=camera.lightness,
+        zoom=float(camera.zoom),
+        speed=float(camera.speed),
+        duration=np.round(durations, 3),
+        islocal=bool(camera.islocal),
+    )
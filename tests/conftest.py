@@ -0,0 +1,6 @@
+# tests/conftest.py
+# Make the repo root importable so `import dolly_core` works under plain `pytest` too.
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,67 @@
+# tests/test_geometry.py
+import numpy as np
+import pytest
+
+from dolly_core import (MODE_ARC, MODE_CIRCLE, MODE_ELLIPSE, MODE_LINE, ShapeParams, arc_start_deg,
+                        dolly_zoom_path, generate_shape_path)
+
+# Expected waypoints were taken from the original per-mode generators in
+# DollyControl. Rows: Position X, Y, Z, Rotation X, Y, Z, Duration.
+START = {"X": 1.0, "Y": 1.5, "Z": -2.0}
+
+SHAPES = {
+    "circle": (ShapeParams(MODE_CIRCLE, START, 2.0, 4, 8.0), [
+        [3.0, 1.5, -2.0, 0.0, 180.0, 0.0, 0.0],
+        [1.0, 1.5, 0.0, 0.0, -90.0, 0.0, 2.0],
+        [-1.0, 1.5, -2.0, 0.0, 0.0, 0.0, 4.0],
+        [1.0, 1.5, -4.0, 0.0, 90.0, 0.0, 6.0],
+    ]),
+    "line": (ShapeParams(MODE_LINE, START, 2.0, 4, 8.0), [
+        [-1.0, 1.5, -2.0, 0.0, 0.0, 0.0, 2.667],
+        [0.333, 1.5, -2.0, 0.0, 0.0, 0.0, 2.667],
+        [1.667, 1.5, -2.0, 0.0, 0.0, 0.0, 2.667],
+        [3.0, 1.5, -2.0, 0.0, 0.0, 0.0, 2.667],
+    ]),
+    "ellipse": (ShapeParams(MODE_ELLIPSE, START, 2.0, 4, 8.0), [
+        [3.0, 1.5, -2.0, 0.0, 0.0, 0.0, 0.0],
+        [1.0, 1.5, -0.5, 0.0, 0.0, 0.0, 2.0],
+        [-1.0, 1.5, -2.0, 0.0, 0.0, 0.0, 4.0],
+        [1.0, 1.5, -3.5, 0.0, 0.0, 0.0, 6.0],
+    ]),
+    # 20 degrees around START, starting where a camera at X=3 stands.
+    "arc": (ShapeParams(MODE_ARC, START, 2.0, 4, 8.0, span_deg=20.0,
+                        start_deg=arc_start_deg(START, {"X": 3.0, "Y": 1.5, "Z": -2.0})), [
+        [3.0, 1.5, -2.0, 0.0, -90.0, 0.0, 2.667],
+        [2.986, 1.5, -2.232, 0.0, -83.33, 0.0, 2.667],
+        [2.946, 1.5, -2.461, 0.0, -76.67, 0.0, 2.667],
+        [2.879, 1.5, -2.684, 0.0, -70.0, 0.0, 2.667],
+    ]),
+}
+
+
+def assert_waypoints(path, expected):
+    expected = np.array(expected)
+    np.testing.assert_allclose(path.position, expected[:, 0:3], atol=1e-9)
+    # Yaw +180 and -180 are the same heading.
+    turn = (path.rotation - expected[:, 3:6] + 180.0) % 360.0 - 180.0
+    np.testing.assert_allclose(turn, 0.0, atol=1e-9)
+    np.testing.assert_allclose(path.duration, expected[:, 6], atol=1e-9)
+
+
+@pytest.mark.parametrize("name", sorted(SHAPES))
+def test_shape_matches_original_generator(name):
+    params, expected = SHAPES[name]
+    assert_waypoints(generate_shape_path(params), expected)
+
+
+def test_dolly_zoom_matches_original_generator():
+    path = dolly_zoom_path(START, {"X": 1.0, "Y": 1.5, "Z": 2.0}, 45.0, 2.0, 8.0)
+    assert_waypoints(path, [
+        [1.0, 1.5, -2.0, 0.0, 0.0, 0.0, 0.0],
+        [1.0, 1.5, -1.05, 0.0, 0.0, 0.0, 1.9],
+        [1.0, 1.5, -0.1, 0.0, 0.0, 0.0, 3.8],
+        [1.0, 1.5, 0.85, 0.0, 0.0, 0.0, 5.7],
+        [1.0, 1.5, 1.8, 0.0, 0.0, 0.0, 7.6],
+    ])
+    # Zoom scales with the remaining distance and is clamped at 20.
+    np.testing.assert_allclose(path.zoom, [90.0, 68.62, 47.25, 25.88, 20.0])
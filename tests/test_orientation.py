@@ -0,0 +1,41 @@
+# tests/test_orientation.py
+import numpy as np
+import pytest
+from scipy.spatial.transform import Rotation as R
+
+from dolly_core import compute_look_at_unity, compute_look_at_unity_batch
+
+TARGET = np.array([1.0, 1.5, 2.0])
+
+# Straight up/down views are gimbal lock for YXZ Euler angles; scipy warns, the view is exact.
+pytestmark = pytest.mark.filterwarnings("ignore:Gimbal lock detected")
+
+
+def forward_of(euler_yxz):
+    """Unity forward (+Z) of YXZ Euler angles (yaw, pitch, roll) in degrees."""
+    return R.from_euler("YXZ", euler_yxz, degrees=True).apply([0.0, 0.0, 1.0])
+
+
+@pytest.mark.parametrize("vertical_mode", [False, True])
+def test_batch_points_at_target(vertical_mode):
+    cams = np.random.default_rng(3).uniform(-10.0, 10.0, (50, 3))
+    euler = compute_look_at_unity_batch(cams, TARGET, vertical_mode)
+    expected = TARGET - cams
+    expected /= np.linalg.norm(expected, axis=1)[:, None]
+    np.testing.assert_allclose(forward_of(euler), expected, atol=1e-9)
+
+
+def test_yaw_and_pitch_signs():
+    # Straight ahead along +X, level: yaw 90, no pitch.
+    yaw, pitch, roll = compute_look_at_unity([0.0, 0.0, 0.0], [5.0, 0.0, 0.0])
+    assert (yaw, pitch, roll) == pytest.approx((90.0, 0.0, 0.0))
+    # Looking up is a negative pitch in Unity.
+    _, pitch, _ = compute_look_at_unity([0.0, 0.0, 0.0], [0.0, 1.0, 1.0])
+    assert pitch == pytest.approx(-45.0)
+
+
+def test_near_vertical_and_degenerate_views():
+    cams = np.array([[1.0, -4.0, 2.0], TARGET])  # directly below, and on the target
+    euler = compute_look_at_unity_batch(cams, TARGET)
+    np.testing.assert_allclose(forward_of(euler[0]), [0.0, 1.0, 0.0], atol=1e-9)
+    np.testing.assert_array_equal(euler[1], [0.0, 0.0, 0.0])
@@ -0,0 +1,53 @@
+# tests/test_pose.py
+import numpy as np
+
+from dolly_core import PoseRingBuffer
+
+
+def push_range(buffer, start, stop):
+    for i in range(start, stop):
+        buffer.push(float(i), i, 0.0, 0.0, 0.0, 0.0, 0.0)
+
+
+def test_read_since_returns_new_rows_in_order():
+    buffer = PoseRingBuffer(capacity=32)
+    push_range(buffer, 0, 10)
+    rows, cursor, dropped = buffer.read_since(0)
+    assert list(rows[:, 0]) == list(range(10))
+    assert (cursor, dropped) == (10, 0)
+    push_range(buffer, 10, 13)
+    rows, cursor, dropped = buffer.read_since(cursor)
+    assert list(rows[:, 0]) == [10.0, 11.0, 12.0]
+    assert (cursor, dropped) == (13, 0)
+
+
+def test_read_since_nothing_new():
+    buffer = PoseRingBuffer(capacity=32)
+    push_range(buffer, 0, 5)
+    rows, cursor, dropped = buffer.read_since(5)
+    assert rows.shape == (0, 7)
+    assert (cursor, dropped) == (5, 0)
+
+
+def test_read_since_after_lapping_reports_dropped():
+    buffer = PoseRingBuffer(capacity=16)
+    push_range(buffer, 0, 6)
+    _, cursor, _ = buffer.read_since(0)
+    assert cursor == 6
+    push_range(buffer, 6, 50)  # the writer laps the reader more than twice
+    rows, next_cursor, dropped = buffer.read_since(cursor)
+    available = buffer.capacity - buffer.GUARD
+    assert list(rows[:, 0]) == list(range(50 - available, 50))
+    assert next_cursor == 50
+    assert dropped == 50 - available - cursor
+    assert dropped + len(rows) == 50 - cursor
+
+
+def test_snapshot_and_latest():
+    buffer = PoseRingBuffer(capacity=16)
+    assert buffer.latest() is None
+    push_range(buffer, 0, 40)
+    rows = buffer.snapshot()
+    assert np.all(np.diff(rows[:, 0]) == 1.0)
+    assert rows[-1, 0] == 39.0
+    assert buffer.latest()[0] == 39.0
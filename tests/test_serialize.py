@@ -0,0 +1,58 @@
+# tests/test_serialize.py
+import json
+
+import numpy as np
+
+from dolly_core import WaypointArray, WaypointEncoder
+
+
+def sample_path(n=25, seed=0):
+    # Values are pre-rounded to the encoder's precision (3 decimals, 2 for rotations).
+    rng = np.random.default_rng(seed)
+    return WaypointArray(
+        np.round(rng.uniform(-50.0, 50.0, (n, 3)), 3),
+        np.round(rng.uniform(-180.0, 180.0, (n, 3)), 2),
+        path_index=3,
+        zoom=np.round(rng.uniform(20.0, 90.0, n), 3),
+        duration=np.round(rng.uniform(0.0, 2.0, n), 3),
+        lookat_x=0.25,
+        islocal=rng.uniform(size=n) > 0.5,
+    )
+
+
+def assert_round_trip(path, encoded):
+    decoded = json.loads(encoded)
+    expected = path.to_dicts()
+    assert len(decoded) == len(expected)
+    for got, want in zip(decoded, expected):
+        assert list(got) == list(want)  # same keys, same order
+        for key, value in want.items():
+            if isinstance(value, dict):
+                for axis, v in value.items():
+                    assert np.isclose(got[key][axis], v, atol=1e-9), (key, axis)
+            elif isinstance(value, bool):
+                assert got[key] is value, key
+            else:
+                assert np.isclose(got[key], value, atol=1e-9), key
+
+
+def test_round_trip_matches_to_dicts():
+    path = sample_path()
+    assert_round_trip(path, WaypointEncoder().encode(path))
+
+
+def test_matches_json_dumps_of_constant_columns():
+    path = WaypointArray(np.zeros((3, 3)), islocal=True)
+    assert_round_trip(path, WaypointEncoder().encode(path))
+    assert json.loads(WaypointEncoder().encode(path)) == json.loads(json.dumps(path.to_dicts()))
+
+
+def test_empty_path():
+    assert WaypointEncoder().encode(WaypointArray.empty()) == json.dumps([])
+
+
+def test_reused_encoder_follows_shape_changes():
+    encoder = WaypointEncoder()
+    a, b = sample_path(25, seed=1), sample_path(7, seed=2)
+    for path in (a, b, a, b.with_columns(islocal=False)):
+        assert_round_trip(path, encoder.encode(path))
@@ -0,0 +1,55 @@
+# tests/test_simplify.py
+import numpy as np
+import pytest
+
+from dolly_core import WaypointArray, simplify_path
+
+
+def wandering_path(n=500, seed=0):
+    rng = np.random.default_rng(seed)
+    positions = rng.normal(0.0, 0.05, (n, 3)).cumsum(axis=0)
+    rotations = rng.normal(0.0, 1.0, (n, 3)).cumsum(axis=0)
+    durations = np.round(rng.uniform(0.005, 0.02, n), 3)
+    durations[0] = 0.0
+    return WaypointArray(positions, rotations, duration=durations)
+
+
+def test_total_duration_is_kept():
+    path = wandering_path()
+    simplified = simplify_path(path, 0.1, 5.0)
+    assert len(simplified) < len(path)
+    assert simplified.duration.sum() == pytest.approx(path.duration.sum(), abs=1e-9)
+
+
+def test_endpoints_are_kept():
+    path = wandering_path()
+    simplified = simplify_path(path, 0.1, 5.0)
+    np.testing.assert_array_equal(simplified.position[0], path.position[0])
+    np.testing.assert_array_equal(simplified.position[-1], path.position[-1])
+
+
+def test_straight_line_collapses_to_endpoints():
+    positions = np.linspace([0.0, 0.0, 0.0], [10.0, 0.0, 0.0], 50)
+    path = WaypointArray(positions, duration=np.r_[0.0, np.full(49, 0.1)])
+    simplified = simplify_path(path, 0.01, 1.0)
+    assert len(simplified) == 2
+    assert simplified.duration.sum() == pytest.approx(4.9)
+
+
+def test_keep_index_survives():
+    # Index 1 lies on the line, so only `keep` can save it (File mode's target marker).
+    positions = np.linspace([0.0, 0.0, 0.0], [10.0, 0.0, 0.0], 20)
+    path = WaypointArray(positions, duration=np.r_[0.0, np.full(19, 0.5)])
+    assert len(simplify_path(path, 0.01, 1.0)) == 2
+    simplified = simplify_path(path, 0.01, 1.0, keep=(1,))
+    assert len(simplified) == 3
+    np.testing.assert_array_equal(simplified.position[1], path.position[1])
+    assert simplified.duration.sum() == pytest.approx(path.duration.sum())
+
+
+def test_changed_fields_are_kept():
+    positions = np.linspace([0.0, 0.0, 0.0], [10.0, 0.0, 0.0], 20)
+    zoom = np.r_[np.full(10, 45.0), np.full(10, 60.0)]
+    path = WaypointArray(positions, zoom=zoom, duration=np.r_[0.0, np.full(19, 0.5)])
+    simplified = simplify_path(path, 0.01, 1.0)
+    assert list(simplified.zoom) == [45.0, 45.0, 60.0, 60.0]
@@ -0,0 +1,48 @@
+# tests/test_timing.py
+import numpy as np
+import pytest
+
+from dolly_core import ArcLengthTable, WaypointArray, stage_timing
+
+# An L: 3 m along X, then 4 m along Z (7 m in total).
+L_SHAPE = [[0.0, 0.0, 0.0], [3.0, 0.0, 0.0], [3.0, 0.0, 4.0]]
+
+
+def test_cumulative_lengths():
+    table = ArcLengthTable(L_SHAPE)
+    np.testing.assert_allclose(table.cumulative, [0.0, 3.0, 7.0])
+    assert table.total == 7.0
+
+
+def test_distance_lookups_and_clamping():
+    table = ArcLengthTable(L_SHAPE)
+    np.testing.assert_allclose(table.index_at_distance([0.0, 1.5, 3.0, 5.0, 7.0]), [0.0, 0.5, 1.0, 1.5, 2.0])
+    np.testing.assert_allclose(table.index_at_distance([-1.0, 99.0]), [0.0, 2.0])
+    np.testing.assert_allclose(table.position_at_distance(5.0), [3.0, 0.0, 2.0])
+    np.testing.assert_allclose(table.position_at_time(1.0, 7.0), [1.0, 0.0, 0.0])
+
+
+def test_constant_speed_durations():
+    durations = ArcLengthTable(L_SHAPE).durations(14.0)
+    np.testing.assert_allclose(durations, [0.0, 6.0, 8.0])
+
+
+def test_eased_durations_keep_the_total():
+    positions = np.linspace([0.0, 0.0, 0.0], [10.0, 0.0, 0.0], 11)
+    durations = ArcLengthTable(positions).durations(5.0, (0.42, 0.0, 0.58, 1.0))
+    assert durations.sum() == pytest.approx(5.0)
+    assert durations[1] > durations[5] < durations[-1]  # slow start and end
+
+
+def test_degenerate_path_spreads_evenly():
+    table = ArcLengthTable(np.zeros((4, 3)))
+    assert table.total == 0.0
+    np.testing.assert_allclose(table.progress(), [0.0, 1 / 3, 2 / 3, 1.0])
+
+
+def test_stage_timing_skips_target_marker():
+    # Index 1 is a far-away marker; it keeps its Duration and is not travelled through.
+    positions = [[0.0, 0.0, 0.0], [50.0, 0.0, 0.0], [1.0, 0.0, 0.0], [2.0, 0.0, 0.0], [3.0, 0.0, 0.0]]
+    path = WaypointArray(positions, duration=[0.0, 0.5, 1.0, 1.0, 1.0])
+    timed = stage_timing(path, 3.5, True, None, skip_index=1)
+    np.testing.assert_allclose(timed.duration, [0.0, 0.5, 1.0, 1.0, 1.0])
@@ -0,0 +1,45 @@
+# tests/test_transform.py
+import numpy as np
+import pytest
+from scipy.spatial.transform import Rotation as R
+
+from dolly_core import MODE_CIRCLE, ShapeParams, WaypointArray, generate_shape_path, transform_path
+
+BASE = generate_shape_path(ShapeParams(MODE_CIRCLE, {"X": 1.0, "Y": 1.5, "Z": -2.0}, 2.0, 8, 8.0))
+
+# Yaw +-90 is a gimbal-lock pose for XYZ Euler angles; scipy warns but the orientation is exact.
+pytestmark = pytest.mark.filterwarnings("ignore:Gimbal lock detected")
+
+
+def orientations(path):
+    return R.from_euler("XYZ", path.rotation, degrees=True).as_matrix()
+
+
+def test_identity_returns_input_unchanged():
+    path = transform_path(BASE, (0.0, 0.0, 0.0), R.identity())
+    for c in WaypointArray.COLUMNS:
+        if c != "rotation":
+            np.testing.assert_array_equal(getattr(path, c), getattr(BASE, c))
+    # Rotations come back as scipy's canonical XYZ Euler angles, e.g. yaw 180
+    # as (180, 0, 180), so compare the orientations rather than the triplets.
+    np.testing.assert_allclose(orientations(path), orientations(BASE), atol=1e-9)
+
+
+def test_translation_and_rotation_about_centroid():
+    offset = R.from_euler("Y", 90, degrees=True)
+    path = transform_path(BASE, (1.0, 0.0, -0.5), offset)
+    # The centroid only moves by the translation; the base is left untouched.
+    np.testing.assert_allclose(path.position.mean(axis=0), BASE.position.mean(axis=0) + (1.0, 0.0, -0.5),
+                               atol=1e-3)
+    np.testing.assert_allclose(BASE.position[0], [3.0, 1.5, -2.0])
+    expected = (offset * R.from_euler("XYZ", BASE.rotation, degrees=True)).as_matrix()
+    np.testing.assert_allclose(orientations(path), expected, atol=1e-3)
+
+
+def test_mask_leaves_unmasked_rows():
+    mask = np.zeros(len(BASE), dtype=bool)
+    mask[2:] = True
+    path = transform_path(BASE, (0.0, 2.0, 0.0), R.identity(), mask)
+    np.testing.assert_array_equal(path.position[:2], BASE.position[:2])
+    np.testing.assert_array_equal(path.rotation[:2], BASE.rotation[:2])
+    np.testing.assert_allclose(path.position[2:], BASE.position[2:] + (0.0, 2.0, 0.0))